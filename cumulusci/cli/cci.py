@@ -3,6 +3,7 @@ from urllib.parse import urlparse
 
 import code
 import functools
+import importlib
 import json
 import re
 import os
@@ -19,21 +20,11 @@ from pathlib import Path
 from datetime import datetime
 
 import click
-import github3
 import pkg_resources
 import requests
 from requests import exceptions
-from rst2ansi import rst2ansi
-from jinja2 import Environment
-from jinja2 import PackageLoader
 
 import cumulusci
-from cumulusci.core.config import OrgConfig
-from cumulusci.core.config import ScratchOrgConfig
-from cumulusci.core.config import ServiceConfig
-from cumulusci.core.config import TaskConfig
-from cumulusci.core.config import UniversalConfig
-from cumulusci.core.github import create_gist, get_github_api
 from cumulusci.core.exceptions import OrgNotFound
 from cumulusci.core.exceptions import CumulusCIException
 from cumulusci.core.exceptions import CumulusCIUsageError
@@ -43,29 +34,71 @@ from cumulusci.core.exceptions import FlowNotFoundError
 
 from cumulusci.core.utils import import_global
 from cumulusci.cli.utils import group_items
-from cumulusci.cli.runtime import CliRuntime
-from cumulusci.cli.runtime import get_installed_version
 from cumulusci.cli.ui import CliTable, CROSSMARK, SimpleSalesforceUIHelpers
-from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
 from cumulusci.utils import doc_task, document_flow, flow_ref_title_and_intro
 from cumulusci.utils import parse_api_datetime
 from cumulusci.utils import get_cci_upgrade_command
 from cumulusci.utils.git import current_branch
 from cumulusci.utils.logging import tee_stdout_stderr
-from cumulusci.oauth.salesforce import CaptureSalesforceOAuth
 from cumulusci.core.utils import cleanup_org_cache_dirs
-from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load
+from cumulusci.core.utils import default_cumulusci_dir
 
 
 from .logger import init_logger, get_tempfile_logger
 
+# Names that used to be imported here at module level, mapped to where they're
+# defined. They pull in the config, keychain and runtime stack, github3 or
+# jinja2, so they're only imported when first used, which keeps `cci` startup
+# and shell completion fast. They still resolve as attributes of this module,
+# so they can be imported or patched here as before.
+_LAZY_IMPORTS = {
+    "github3": ("github3", None),
+    "Environment": ("jinja2", "Environment"),
+    "PackageLoader": ("jinja2", "PackageLoader"),
+    "OrgConfig": ("cumulusci.core.config", "OrgConfig"),
+    "ScratchOrgConfig": ("cumulusci.core.config", "ScratchOrgConfig"),
+    "ServiceConfig": ("cumulusci.core.config", "ServiceConfig"),
+    "TaskConfig": ("cumulusci.core.config", "TaskConfig"),
+    "UniversalConfig": ("cumulusci.core.config", "UniversalConfig"),
+    "create_gist": ("cumulusci.core.github", "create_gist"),
+    "get_github_api": ("cumulusci.core.github", "get_github_api"),
+    "MetricsFlowCallback": ("cumulusci.core.flowrunner", "MetricsFlowCallback"),
+    "CliRuntime": ("cumulusci.cli.runtime", "CliRuntime"),
+    "get_installed_version": ("cumulusci.cli.runtime", "get_installed_version"),
+    "get_simple_salesforce_connection": (
+        "cumulusci.salesforce_api.utils",
+        "get_simple_salesforce_connection",
+    ),
+    "CaptureSalesforceOAuth": ("cumulusci.oauth.salesforce", "CaptureSalesforceOAuth"),
+    "cci_safe_load": ("cumulusci.utils.yaml.cumulusci_yml", "cci_safe_load"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(name):
+    """Return one of the _LAZY_IMPORTS, or the value it's been patched with."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 
 @contextlib.contextmanager
 def timestamp_file():
     """Opens a file for tracking the time of the last version check"""
 
-    config_dir = UniversalConfig.default_cumulusci_dir()
-    timestamp_file = os.path.join(config_dir, "cumulus_timestamp")
+    timestamp_file = os.path.join(default_cumulusci_dir(), "cumulus_timestamp")
 
     try:
         with open(timestamp_file, "r+") as f:
@@ -75,6 +108,16 @@ def timestamp_file():
             yield f
 
 
+def rst2ansi(rst):
+    """Render reStructuredText for the terminal.
+
+    rst2ansi is imported here rather than at module level because it pulls in
+    docutils, which is slow to import and only needed by a few commands."""
+    from rst2ansi import rst2ansi
+
+    return rst2ansi(rst)
+
+
 FINAL_VERSION_RE = re.compile(r"^[\d\.]+$")
 
 
@@ -119,7 +162,7 @@ def check_latest_version():
             click.echo(str(e))
             return
 
-        result = latest_version > get_installed_version()
+        result = latest_version > _lazy_import("get_installed_version")()
         click.echo("Checking the version!")
         if result:
             click.echo(
@@ -155,17 +198,30 @@ def render_recursive(data, indent=None):
 RUNTIME = None
 
 
+def get_runtime():
+    """Returns the active runtime, loading the CCI config the first time it's needed.
+
+    main() doesn't load it up front, so that commands which don't use it
+    (and `--help` or shell completion for any command) don't pay for it."""
+    global RUNTIME
+    if RUNTIME is None:
+        runtime = _lazy_import("CliRuntime")(load_keychain=False)
+        runtime.check_cumulusci_version()
+        RUNTIME = runtime
+    return RUNTIME
+
+
 def pass_runtime(func=None, require_project=True, require_keychain=False):
     """Decorator which passes the CCI runtime object as the first arg to a click command."""
 
     def decorate(func):
         def new_func(*args, **kw):
-            runtime = RUNTIME
+            runtime = get_runtime()
             if require_project and runtime.project_config is None:
                 raise runtime.project_config_error
             if require_keychain:
                 runtime._load_keychain()
-            func(RUNTIME, *args, **kw)
+            func(runtime, *args, **kw)
 
         return functools.update_wrapper(new_func, func)
 
@@ -192,6 +248,13 @@ def main(args=None):
 
     This wraps the `click` library in order to do some initialization and centralized error handling.
     """
+    # Shell completion needs to be fast. click prints the completions and
+    # exits, so skip the version check, logging and error handling, and only
+    # load the CCI config if a command group needs it to list its commands.
+    if "_CCI_COMPLETE" in os.environ:
+        cli(standalone_mode=False)
+        return
+
     with contextlib.ExitStack() as stack:
         args = args or sys.argv
         # Check for updates _unless_ we've been asked to output JSON,
@@ -200,16 +263,14 @@ def main(args=None):
         if "--json" not in args and not is_version_command:
             check_latest_version()
 
-        # Load CCI config
+        # The CCI config is loaded by get_runtime() when a command needs it.
         global RUNTIME
-        RUNTIME = CliRuntime(load_keychain=False)
-        RUNTIME.check_cumulusci_version()
+        RUNTIME = None
 
         # Configure logging
         debug = "--debug" in args
         if debug:
             args.remove("--debug")
-        should_show_stacktraces = RUNTIME.universal_config.cli__show_stacktraces
 
         # Only create logfiles for commands
         # that are not `cci error`
@@ -231,11 +292,19 @@ def main(args=None):
                 show_debug_info()
             else:
                 handle_exception(
-                    e, is_error_command, tempfile_path, should_show_stacktraces
+                    e, is_error_command, tempfile_path, should_show_stacktraces()
                 )
             sys.exit(1)
 
 
+def should_show_stacktraces():
+    """Returns the cli.show_stacktraces setting, or False if the config can't be loaded."""
+    try:
+        return get_runtime().universal_config.cli__show_stacktraces
+    except Exception:
+        return False
+
+
 def handle_exception(error, is_error_cmd, logfile_path, should_show_stacktraces=False):
     """Displays error of appropriate message back to user, prompts user to investigate further
     with `cci error` commands, and writes the traceback to the latest logfile.
@@ -281,6 +350,8 @@ def cli():
 
 @cli.command(name="version", help="Print the current version of CumulusCI")
 def version():
+    get_installed_version = _lazy_import("get_installed_version")
+
     click.echo("CumulusCI version: ", nl=False)
     click.echo(click.style(cumulusci.__version__, bold=True), nl=False)
     click.echo(f" ({sys.argv[0]})")
@@ -418,6 +489,9 @@ def project_init(runtime):
 
     context = {"cci_version": cumulusci.__version__}
 
+    Environment = _lazy_import("Environment")
+    PackageLoader = _lazy_import("PackageLoader")
+
     # Prep jinja2 environment for rendering files
     env = Environment(
         loader=PackageLoader(
@@ -767,7 +841,7 @@ class ConnectServiceCommand(click.MultiCommand):
 
     def list_commands(self, ctx):
         """ list the services that can be configured """
-        services = self._get_services_config(RUNTIME)
+        services = self._get_services_config(get_runtime())
         return sorted(services.keys())
 
     def _build_param(self, attribute, details):
@@ -775,9 +849,9 @@ class ConnectServiceCommand(click.MultiCommand):
         return click.Option((f"--{attribute}",), prompt=req, required=req)
 
     def get_command(self, ctx, name):
-        runtime = RUNTIME
+        runtime = get_runtime()
         runtime._load_keychain()
-        services = self._get_services_config(RUNTIME)
+        services = self._get_services_config(runtime)
         try:
             service_config = services[name]
         except KeyError:
@@ -803,6 +877,8 @@ class ConnectServiceCommand(click.MultiCommand):
                 validator = import_global(validator_path)
                 validator(serv_conf)
 
+            ServiceConfig = _lazy_import("ServiceConfig")
+
             runtime.keychain.set_service(name, ServiceConfig(serv_conf), project)
             if project:
                 click.echo(f"{name} is now configured for this project.")
@@ -889,6 +965,9 @@ def org_browser(runtime, org_name):
 )
 @pass_runtime(require_project=False, require_keychain=True)
 def org_connect(runtime, org_name, sandbox, login_url, default, global_org):
+    OrgConfig = _lazy_import("OrgConfig")
+    CaptureSalesforceOAuth = _lazy_import("CaptureSalesforceOAuth")
+
     runtime.check_org_overwrite(org_name)
 
     if "lightning.force.com" in login_url:
@@ -949,6 +1028,8 @@ def org_default(runtime, org_name, unset):
 @click.argument("org_name")
 @pass_runtime(require_keychain=True)
 def org_import(runtime, username_or_alias, org_name):
+    ScratchOrgConfig = _lazy_import("ScratchOrgConfig")
+
     org_config = {"username": username_or_alias}
     scratch_org_config = ScratchOrgConfig(
         org_config, org_name, runtime.keychain, global_org=False
@@ -1041,15 +1122,18 @@ def org_info(runtime, org_name, print_json):
 @click.option("--plain", is_flag=True, help="Print the table using plain ascii.")
 @pass_runtime(require_project=False, require_keychain=True)
 def org_list(runtime, plain):
+    ScratchOrgConfig = _lazy_import("ScratchOrgConfig")
+
     plain = plain or runtime.universal_config.cli__plain_output
     header = ["Name", "Default", "Username", "Expires"]
     persistent_data = [header]
     scratch_data = [header[:2] + ["Days", "Expired", "Config", "Domain"]]
     org_configs = {
-        org: runtime.keychain.get_org(org) for org in runtime.keychain.list_orgs()
+        org: runtime.keychain.get_org_summary(org)
+        for org in runtime.keychain.list_orgs()
     }
     rows_to_dim = []
-    default_org_name, _ = runtime.keychain.get_default_org()
+    default_org_name = runtime.keychain.get_default_org_name()
     for org, org_config in org_configs.items():
         row = [org, org == default_org_name]
         if isinstance(org_config, ScratchOrgConfig):
@@ -1101,6 +1185,7 @@ def org_list(runtime, plain):
 )
 @pass_runtime(require_project=True, require_keychain=True)
 def org_prune(runtime, include_active=False):
+    ScratchOrgConfig = _lazy_import("ScratchOrgConfig")
 
     predefined_scratch_configs = getattr(runtime.project_config, "orgs__scratch", {})
 
@@ -1273,6 +1358,8 @@ class CCIHelp(type(help)):
 @click.option("--python", help="Python code to run directly")
 @pass_runtime(require_keychain=True)
 def org_shell(runtime, org_name, script=None, python=None):
+    get_simple_salesforce_connection = _lazy_import("get_simple_salesforce_connection")
+
     org_name, org_config = runtime.get_org(org_name)
     org_config.refresh_oauth_token(runtime.keychain)
 
@@ -1353,6 +1440,8 @@ def task_list(runtime, plain, print_json):
     require_project=False,
 )
 def task_doc(runtime, project=False, write=False):
+    TaskConfig = _lazy_import("TaskConfig")
+
     if project and runtime.project_config is None:
         raise click.UsageError(
             "The --project option can only be used inside a project."
@@ -1387,6 +1476,8 @@ def task_doc(runtime, project=False, write=False):
 @flow.command(name="doc", help="Exports RST format documentation for all flows")
 @pass_runtime(require_project=False)
 def flow_doc(runtime):
+    cci_safe_load = _lazy_import("cci_safe_load")
+
     with open("docs/flows.yml", "r", encoding="utf-8") as f:
         flow_info = cci_safe_load(f)
     click.echo(flow_ref_title_and_intro(flow_info["intro_blurb"]))
@@ -1464,15 +1555,16 @@ class RunTaskCommand(click.MultiCommand):
     }
 
     def list_commands(self, ctx):
-        tasks = RUNTIME.get_available_tasks()
+        tasks = get_runtime().get_available_tasks()
         return sorted([t["name"] for t in tasks])
 
     def get_command(self, ctx, task_name):
-        RUNTIME._load_keychain()
-        if RUNTIME.project_config is None:
-            task_config = RUNTIME.universal_config.get_task(task_name)
+        runtime = get_runtime()
+        runtime._load_keychain()
+        if runtime.project_config is None:
+            task_config = runtime.universal_config.get_task(task_name)
         else:
-            task_config = RUNTIME.project_config.get_task(task_name)
+            task_config = runtime.project_config.get_task(task_name)
 
         if "options" not in task_config.config:
             task_config.config["options"] = {}
@@ -1485,7 +1577,7 @@ class RunTaskCommand(click.MultiCommand):
 
         def run_task(*args, **kwargs):
             """Callback function that executes when the command fires."""
-            org, org_config = RUNTIME.get_org(
+            org, org_config = runtime.get_org(
                 kwargs.pop("org", None), fail_if_missing=False
             )
 
@@ -1519,14 +1611,15 @@ class RunTaskCommand(click.MultiCommand):
                     pdb.set_trace()
 
             finally:
-                RUNTIME.alert(f"Task complete: {task_name}")
+                runtime.alert(f"Task complete: {task_name}")
 
         return click.Command(task_name, params=params, callback=run_task)
 
     def format_help(self, ctx, formatter):
         """Custom help for `cci task run`"""
-        tasks = RUNTIME.get_available_tasks()
-        plain = RUNTIME.universal_config.cli__plain_output or False
+        runtime = get_runtime()
+        tasks = runtime.get_available_tasks()
+        plain = runtime.universal_config.cli__plain_output or False
         task_groups = group_items(tasks)
         for group, tasks in task_groups.items():
             data = [["Task", "Description"]]
@@ -1677,8 +1770,30 @@ def flow_info(runtime, flow_name):
     is_flag=True,
     help="Disables all prompts.  Set for non-interactive mode use such as calling from scripts or CI systems",
 )
+@click.option(
+    "--metrics",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write timing, HTTP and API usage metrics for each step of the flow to this file",
+)
+@click.option(
+    "--metrics-format",
+    type=click.Choice(["json", "chrome"]),
+    default="json",
+    help="Write the metrics as a JSON report (the default) or as a Chrome trace",
+)
 @pass_runtime(require_keychain=True)
-def flow_run(runtime, flow_name, org, delete_org, debug, o, skip, no_prompt):
+def flow_run(
+    runtime,
+    flow_name,
+    org,
+    delete_org,
+    debug,
+    o,
+    skip,
+    no_prompt,
+    metrics=None,
+    metrics_format="json",
+):
 
     # Get necessary configs
     org, org_config = runtime.get_org(org)
@@ -1700,6 +1815,10 @@ def flow_run(runtime, flow_name, org, delete_org, debug, o, skip, no_prompt):
     # Create the flow and handle initialization exceptions
     try:
         coordinator = runtime.get_flow(flow_name, options=options)
+        if metrics:
+            MetricsFlowCallback = _lazy_import("MetricsFlowCallback")
+
+            coordinator.callbacks = MetricsFlowCallback(metrics, metrics_format)
         coordinator.run(org_config)
     finally:
         runtime.alert(f"Flow Complete: {flow_name}")
@@ -1757,6 +1876,10 @@ def lines_from_traceback(log_content: str, max_lines: int = 0) -> str:
 @error.command(name="gist", help="Creates a GitHub gist from the latest logfile")
 @pass_runtime(require_project=False, require_keychain=True)
 def gist(runtime):
+    github3 = _lazy_import("github3")
+    create_gist = _lazy_import("create_gist")
+    get_github_api = _lazy_import("get_github_api")
+
     if CCI_LOGFILE_PATH.is_file():
         log_content = CCI_LOGFILE_PATH.read_text(encoding="utf-8")
     else:
@@ -1773,7 +1896,7 @@ def gist(runtime):
     }
 
     try:
-        gh = RUNTIME.keychain.get_service("github")
+        gh = runtime.keychain.get_service("github")
         gist = create_gist(
             get_github_api(gh.config["username"], gh.config["password"]),
             "CumulusCI Error Output",
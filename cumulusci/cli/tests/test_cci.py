@@ -6,6 +6,8 @@ import io
 import json
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
 import time
 import pytest
@@ -158,10 +160,96 @@ class TestCCI(unittest.TestCase):
 
         check_latest_version.assert_called_once()
         init_logger.assert_called_once()
-        CliRuntime.assert_called_once()
+        # The runtime is loaded by the commands that need it
+        CliRuntime.assert_not_called()
         cli.assert_called_once()
         tee.assert_called_once()
 
+    @mock.patch("cumulusci.cli.cci.tee_stdout_stderr")
+    @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
+    @mock.patch("cumulusci.cli.cci.init_logger")
+    @mock.patch("cumulusci.cli.cci.check_latest_version")
+    @mock.patch("cumulusci.cli.cci.CliRuntime")
+    @mock.patch("cumulusci.cli.cci.cli")
+    def test_main__completion(
+        self,
+        cli,
+        CliRuntime,
+        check_latest_version,
+        init_logger,
+        get_tempfile_logger,
+        tee,
+    ):
+        get_tempfile_logger.return_value = mock.Mock(), "tempfile.log"
+        with mock.patch.dict(os.environ, {"_CCI_COMPLETE": "complete_zsh"}):
+            cci.main()
+
+        check_latest_version.assert_not_called()
+        CliRuntime.assert_not_called()
+        get_tempfile_logger.assert_not_called()
+        cli.assert_called_once()
+
+    def _run_cci_and_list_modules(self, args, env):
+        """Runs the cci entry point in a new interpreter and returns the modules it imported."""
+        script = "\n".join(
+            (
+                "import os, sys",
+                "from cumulusci.cli import cci",
+                "modules_path = sys.argv[1]",
+                # click exits from shell completion with os._exit()
+                "os._exit = sys.exit",
+                "sys.argv = ['cci'] + sys.argv[2:]",
+                "try:",
+                "    cci.main()",
+                "except SystemExit:",
+                "    pass",
+                "with open(modules_path, 'w') as f:",
+                "    f.write(' '.join(sys.modules))",
+            )
+        )
+        with temporary_dir() as home:
+            # Record a recent version check so that none is made
+            Path(home, ".cumulusci").mkdir()
+            Path(home, ".cumulusci", "cumulus_timestamp").write_text(str(time.time()))
+            modules_path = Path(home, "modules.txt")
+            env = {**os.environ, "HOME": home, "USERPROFILE": home, **env}
+            subprocess.run(
+                [sys.executable, "-c", script, str(modules_path)] + args,
+                env=env,
+                cwd=home,
+                stdout=subprocess.DEVNULL,
+                check=False,
+            )
+            return set(modules_path.read_text().split())
+
+    # Dependencies that only some commands need should be imported by those
+    # commands, not when the CLI starts.
+    DEFERRED_MODULES = {
+        "docutils",
+        "github3",
+        "jinja2",
+        "keyring",
+        "rst2ansi",
+        "simple_salesforce",
+        "cumulusci.cli.runtime",
+        "cumulusci.core.config",
+        "cumulusci.core.flowrunner",
+        "cumulusci.core.keychain",
+    }
+
+    def test_main__completion_defers_heavy_dependencies(self):
+        modules = self._run_cci_and_list_modules(
+            [],
+            {"_CCI_COMPLETE": "complete", "COMP_WORDS": "cci org ", "COMP_CWORD": "2"},
+        )
+        assert "cumulusci.cli.cci" in modules
+        assert not self.DEFERRED_MODULES & modules
+
+    def test_main__help_defers_heavy_dependencies(self):
+        modules = self._run_cci_and_list_modules(["org", "list", "--help"], {})
+        assert "cumulusci.cli.cci" in modules
+        assert not self.DEFERRED_MODULES & modules
+
     @mock.patch("cumulusci.cli.cci.tee_stdout_stderr")
     @mock.patch("cumulusci.cli.cci.get_tempfile_logger")
     @mock.patch("cumulusci.cli.cci.init_logger")
@@ -188,7 +276,7 @@ class TestCCI(unittest.TestCase):
 
         check_latest_version.assert_called_once()
         init_logger.assert_called_once_with(log_requests=True)
-        CliRuntime.assert_called_once()
+        CliRuntime.assert_not_called()
         cli.assert_called_once()
         post_mortem.assert_called_once()
         sys_exit.assert_called_once_with(1)
@@ -1195,23 +1283,10 @@ Environment Info: Rossian / x68_46
         }
 
         runtime.keychain.list_orgs.return_value = list(org_configs.keys())
-        runtime.keychain.get_org = lambda orgname: org_configs[orgname]
+        runtime.keychain.get_org_summary = lambda orgname: org_configs[orgname]
         runtime.project_config.cache_dir = Path("does_not_possibly_exist")
 
-        runtime.keychain.get_default_org.return_value = (
-            "test0",
-            ScratchOrgConfig(
-                {
-                    "default": True,
-                    "scratch": True,
-                    "date_created": datetime.now() - timedelta(days=8),
-                    "days": 7,
-                    "config_name": "dev",
-                    "username": "test0@example.com",
-                },
-                "test0",
-            ),
-        )
+        runtime.keychain.get_default_org_name.return_value = "test0"
 
         run_click_command(cci.org_list, runtime=runtime, plain=False)
 
@@ -1958,6 +2033,31 @@ Environment Info: Rossian / x68_46
         )
         org_config.delete_org.assert_called_once()
 
+    def test_flow_run__metrics(self):
+        org_config = mock.Mock(scratch=True, config={})
+        runtime = CliRuntime(config={"noop": {}}, load_keychain=False)
+        runtime.get_org = mock.Mock(return_value=("test", org_config))
+        runtime.get_flow = mock.Mock()
+
+        run_click_command(
+            cci.flow_run,
+            runtime=runtime,
+            flow_name="test",
+            org="test",
+            delete_org=False,
+            debug=False,
+            o=None,
+            skip=(),
+            no_prompt=True,
+            metrics="trace.json",
+            metrics_format="chrome",
+        )
+
+        callbacks = runtime.get_flow.return_value.callbacks
+        assert callbacks.path == "trace.json"
+        assert callbacks.format == "chrome"
+        runtime.get_flow.return_value.run.assert_called_once_with(org_config)
+
     def test_flow_run_o_error(self):
         org_config = mock.Mock(scratch=True, config={})
         runtime = CliRuntime(config={"noop": {}}, load_keychain=False)
@@ -1,14 +1,16 @@
 from collections import defaultdict
 from collections import namedtuple
 from distutils.version import StrictVersion
+import json
 import os
 import re
+import time
 from contextlib import contextmanager
+from urllib.parse import urlencode
 from urllib.parse import urlparse
 from cumulusci.utils.fileutils import open_fs_resource
 
 import requests
-from simple_salesforce import Salesforce
 
 from cumulusci.core.config import BaseConfig
 from cumulusci.core.exceptions import CumulusCIException
@@ -16,11 +18,19 @@ from cumulusci.core.exceptions import DependencyResolutionError
 from cumulusci.core.exceptions import SalesforceCredentialsException
 from cumulusci.oauth.salesforce import SalesforceOAuth2
 from cumulusci.oauth.salesforce import jwt_session
+from cumulusci.salesforce_api.describe_cache import DescribeCache
+from cumulusci.salesforce_api.utils import get_org_connection
 
 
 SKIP_REFRESH = os.environ.get("CUMULUSCI_DISABLE_REFRESH")
 SANDBOX_MYDOMAIN_RE = re.compile(r"\.cs\d+\.my\.(.*)salesforce\.com")
 MYDOMAIN_RE = re.compile(r"\.my\.(.*)salesforce\.com")
+# The installed package inventory is persisted in the orginfo cache and reused
+# for this long (in seconds), unless reset by a task that installs or
+# uninstalls packages.
+INSTALLED_PACKAGES_TTL = 300
+# Maximum number of subrequests in a Tooling API composite request
+INSTALLED_PACKAGES_COMPOSITE_SIZE = 25
 
 
 VersionInfo = namedtuple("VersionInfo", ["id", "number"])
@@ -31,6 +41,10 @@ class OrgConfig(BaseConfig):
 
     # make sure it can be mocked for tests
     SalesforceOAuth2 = SalesforceOAuth2
+    # Turned off in a flow's parallel worker processes, which use the credentials
+    # that the flow refreshed before starting them rather than refreshing and
+    # saving their own.
+    refresh_credentials = True
 
     def __init__(self, config: dict, name: str, keychain=None, global_org=False):
         self.keychain = keychain
@@ -41,6 +55,7 @@ class OrgConfig(BaseConfig):
         self._latest_api_version = None
         self._installed_packages = None
         self._is_person_accounts_enabled = None
+        self._describe_cache = DescribeCache(self)
         super(OrgConfig, self).__init__(config)
 
     def refresh_oauth_token(self, keychain, connected_app=None):
@@ -118,11 +133,7 @@ class OrgConfig(BaseConfig):
 
     @property
     def salesforce_client(self):
-        return Salesforce(
-            instance=self.instance_url.replace("https://", ""),
-            session_id=self.access_token,
-            version=self.latest_api_version,
-        )
+        return get_org_connection(self, self.latest_api_version)
 
     @property
     def latest_api_version(self):
@@ -250,39 +261,135 @@ class OrgConfig(BaseConfig):
 
         Beta version of a package are represented as "1.2.3b5", where 5 is the build number."""
         if self._installed_packages is None:
-            isp_result = self.salesforce_client.restful(
-                "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
-                "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
-            )
             _installed_packages = defaultdict(list)
-            for isp in isp_result["records"]:
-                sp = isp["SubscriberPackage"]
-                spv_result = self.salesforce_client.restful(
-                    "tooling/query/?q=SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
-                    f"IsBeta FROM SubscriberPackageVersion WHERE Id='{isp['SubscriberPackageVersionId']}'"
+            for package in self._get_installed_package_versions():
+                version_info = VersionInfo(
+                    package["version_id"], StrictVersion(package["version"])
                 )
-                if not spv_result["records"]:
-                    # This _shouldn't_ happen, but it is possible in customer orgs.
-                    continue
-                spv = spv_result["records"][0]
-
-                version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
-                if spv["PatchVersion"]:
-                    version += f".{spv['PatchVersion']}"
-                if spv["IsBeta"]:
-                    version += f"b{spv['BuildNumber']}"
-                version_info = VersionInfo(spv["Id"], StrictVersion(version))
-                namespace = sp["NamespacePrefix"]
+                namespace = package["namespace"]
                 _installed_packages[namespace].append(version_info)
-                namespace_version = f"{namespace}@{version}"
+                namespace_version = f"{namespace}@{package['version']}"
                 _installed_packages[namespace_version].append(version_info)
-                _installed_packages[sp["Id"]].append(version_info)
+                _installed_packages[package["package_id"]].append(version_info)
 
             self._installed_packages = _installed_packages
         return self._installed_packages
 
+    def _get_installed_package_versions(self):
+        """Return a list of the package versions installed in the org, from the
+        orginfo cache if it is recent enough and from the Tooling API otherwise."""
+        if self.keychain is None:
+            return self._query_installed_package_versions()
+
+        with self.get_orginfo_cache_dir("installed_packages") as cache_dir:
+            cache_file = cache_dir / "installed_packages.json"
+            if cache_file.exists():
+                try:
+                    with cache_file.open("r") as f:
+                        cached = json.load(f)
+                    if time.time() - cached["fetched"] < INSTALLED_PACKAGES_TTL:
+                        return cached["packages"]
+                except (ValueError, KeyError):
+                    pass
+
+            fetched = time.time()
+            packages = self._query_installed_package_versions()
+            with cache_file.open("w") as f:
+                json.dump({"fetched": fetched, "packages": packages}, f)
+        return packages
+
+    def _query_installed_package_versions(self):
+        sf = self.salesforce_client
+        isp_result = sf.restful(
+            "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
+            "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
+        )
+        version_ids = [
+            isp["SubscriberPackageVersionId"] for isp in isp_result["records"]
+        ]
+
+        # The Tooling API only looks up a SubscriberPackageVersion by a single
+        # Id, so send the lookups as subrequests of composite requests.
+        versions = {}
+        for i in range(0, len(version_ids), INSTALLED_PACKAGES_COMPOSITE_SIZE):
+            batch = version_ids[i : i + INSTALLED_PACKAGES_COMPOSITE_SIZE]
+            composite_result = sf.restful(
+                "tooling/composite",
+                method="POST",
+                json={
+                    "allOrNone": False,
+                    "compositeRequest": [
+                        {
+                            "method": "GET",
+                            "referenceId": f"spv{n}",
+                            "url": f"/services/data/v{sf.sf_version}/tooling/query/?"
+                            + urlencode(
+                                {
+                                    "q": "SELECT Id, MajorVersion, MinorVersion, PatchVersion, "
+                                    "BuildNumber, IsBeta FROM SubscriberPackageVersion "
+                                    f"WHERE Id='{version_id}'"
+                                }
+                            ),
+                        }
+                        for n, version_id in enumerate(batch)
+                    ],
+                },
+            )
+            for response in composite_result["compositeResponse"]:
+                if response["httpStatusCode"] != 200:
+                    raise CumulusCIException(
+                        f"Failed to look up installed package versions: {response['body']}"
+                    )
+                for spv in response["body"]["records"]:
+                    version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
+                    if spv["PatchVersion"]:
+                        version += f".{spv['PatchVersion']}"
+                    if spv["IsBeta"]:
+                        version += f"b{spv['BuildNumber']}"
+                    versions[spv["Id"]] = version
+
+        packages = []
+        for isp in isp_result["records"]:
+            version_id = isp["SubscriberPackageVersionId"]
+            if version_id not in versions:
+                # This _shouldn't_ happen, but it is possible in customer orgs.
+                continue
+            packages.append(
+                {
+                    "namespace": isp["SubscriberPackage"]["NamespacePrefix"],
+                    "package_id": isp["SubscriberPackage"]["Id"],
+                    "version_id": version_id,
+                    "version": versions[version_id],
+                }
+            )
+        return packages
+
     def reset_installed_packages(self):
         self._installed_packages = None
+        if self.keychain is not None:
+            with self.get_orginfo_cache_dir("installed_packages") as cache_dir:
+                cache_file = cache_dir / "installed_packages.json"
+                if cache_file.exists():
+                    cache_file.unlink()
+
+    def describe(self, sobject=None, sf=None):
+        """Return the describe for an sObject, or the global describe if no
+        sObject is given.
+
+        Results are cached per org and API version (that of the ``sf`` client,
+        which defaults to ``salesforce_client``) and shared by every task that
+        uses this org. Call ``reset_describe_cache()`` after changing the schema."""
+        return self._describe_cache.describe(sf or self.salesforce_client, sobject)
+
+    def reset_describe_cache(self, sobjects=None):
+        self._describe_cache.reset(sobjects)
+
+    def reload_cached_info(self):
+        """Forget the installed packages and describes held in memory, so they
+        are read again from the orginfo cache (or the org) the next time they
+        are needed, e.g. after another process has changed the org."""
+        self._installed_packages = None
+        self._describe_cache.reload()
 
     def save(self):
         assert self.keychain, "Keychain was not set on OrgConfig"
@@ -336,7 +443,7 @@ class OrgConfig(BaseConfig):
         if self._is_person_accounts_enabled is None:
             self._is_person_accounts_enabled = any(
                 field["name"] == "IsPersonAccount"
-                for field in self.salesforce_client.Account.describe()["fields"]
+                for field in self.describe("Account")["fields"]
             )
         return self._is_person_accounts_enabled
 
@@ -0,0 +1,68 @@
+"""A cache of parsed and merged cumulusci.yml configs.
+
+Parsing the universal cumulusci.yml and merging it with the global and project
+configs takes a large share of every cci invocation's startup time. The result
+is stored as a pickle in the CumulusCI config directory (next to the keychain),
+keyed by a hash of the source files, and reused until any of them change.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+from cumulusci import __version__
+
+CONFIG_CACHE_DIRNAME = "config_cache"
+
+
+def hash_config_sources(paths, *values):
+    """Return a hash of the contents of the files at paths (which may be None
+    or missing) and of any additional values that the config depends on."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{__version__}\0{sys.version}".encode("utf-8"))
+    for path in paths:
+        h.update(b"\0file\0")
+        if path and os.path.isfile(path):
+            h.update(os.fsencode(path))
+            with open(path, "rb") as f:
+                h.update(f.read())
+    for value in values:
+        h.update(b"\0value\0")
+        h.update(repr(value).encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_config_cache(cache_dir, name):
+    """Return the (key, data) stored under name, or (None, None)."""
+    path = Path(cache_dir, CONFIG_CACHE_DIRNAME, f"{name}.pickle")
+    try:
+        with open(path, "rb") as f:
+            key, data = pickle.load(f)
+    except FileNotFoundError:
+        return None, None
+    except Exception:
+        # A corrupt or incompatible cache file is just a cache miss.
+        return None, None
+    return key, data
+
+
+def write_config_cache(cache_dir, name, key, data):
+    """Store data under name with the given key, replacing any previous entry."""
+    directory = Path(cache_dir, CONFIG_CACHE_DIRNAME)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent cci processes
+        # never read a partially written cache file.
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, directory / f"{name}.pickle")
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        # The cache is only an optimization.
+        pass
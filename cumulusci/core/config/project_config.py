@@ -1,20 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
 from distutils.version import LooseVersion
 import io
 import json
 import os
 import re
+import threading
 from pathlib import Path
 from configparser import ConfigParser
 from itertools import chain
 from contextlib import contextmanager
 
 API_VERSION_RE = re.compile(r"^\d\d+\.0$")
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 
 import github3
-import yaml
 
 from cumulusci.core.utils import merge_config
 from cumulusci.core.config import BaseTaskFlowConfig
+from cumulusci.core.config.config_cache import (
+    hash_config_sources,
+    read_config_cache,
+    write_config_cache,
+)
 from cumulusci.core.exceptions import (
     ConfigError,
     DependencyResolutionError,
@@ -31,7 +38,7 @@ from cumulusci.core.source import GitHubSource
 from cumulusci.core.source import LocalFolderSource
 from cumulusci.core.source import NullSource
 from cumulusci.utils.git import current_branch, git_path
-from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load
+from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load, safe_load
 from cumulusci.utils.fileutils import open_fs_resource
 
 from github3.exceptions import NotFoundError
@@ -42,9 +49,14 @@ class BaseProjectConfig(BaseTaskFlowConfig):
 
     config_filename = "cumulusci.yml"
 
+    # Number of sibling GitHub dependencies to resolve at once
+    dependency_resolution_concurrency = 8
+
     def __init__(self, universal_config_obj, config=None, *args, **kwargs):
         self.universal_config_obj = universal_config_obj
         self.keychain = None
+        self._dependency_repo_cache = {}
+        self._dependency_repo_cache_lock = threading.Lock()
 
         # optionally pass in a repo_info dict
         self._repo_info = kwargs.pop("repo_info", None)
@@ -96,6 +108,11 @@ class BaseProjectConfig(BaseTaskFlowConfig):
                 f"The file {self.config_filename} was not found in the repo root: {repo_root}. Are you in a CumulusCI Project directory?"
             )
 
+        # Use the compiled config if none of its sources have changed
+        if self._load_cached_config():
+            self._validate_config()
+            return
+
         # Load the project's yaml config file
         with open(self.config_project_path, "r", encoding="utf-8") as f_config:
             project_config = cci_safe_load(f_config)
@@ -114,7 +131,7 @@ class BaseProjectConfig(BaseTaskFlowConfig):
 
         # merge in any additional yaml that was passed along
         if self.additional_yaml:
-            additional_yaml_config = yaml.safe_load(self.additional_yaml)
+            additional_yaml_config = safe_load(self.additional_yaml)
             if additional_yaml_config:
                 self.config_additional_yaml.update(additional_yaml_config)
 
@@ -127,9 +144,63 @@ class BaseProjectConfig(BaseTaskFlowConfig):
                 "additional_yaml": self.config_additional_yaml,
             }
         )
+        self._save_cached_config()
 
         self._validate_config()
 
+    @property
+    def _config_cache_name(self):
+        return "project_" + hash_config_sources([], self.repo_root)
+
+    def _get_config_cache_key(self):
+        # The merged config depends on the universal config too, so only
+        # cache it if the universal config came from known sources.
+        universal_key = getattr(self.universal_config_obj, "config_key", None)
+        if not isinstance(universal_key, str):
+            return None
+        return hash_config_sources(
+            [self.config_project_path, self.config_project_local_path],
+            universal_key,
+            self.additional_yaml,
+        )
+
+    def _load_cached_config(self):
+        """Loads the compiled config saved by a previous run, if it is current.
+        Returns True if the config was loaded."""
+        if not isinstance(getattr(self.universal_config_obj, "config_key", None), str):
+            return False
+        cache_dir = self.universal_config_obj.cumulusci_config_dir
+        cached_key, cached = read_config_cache(cache_dir, self._config_cache_name)
+        if cached is None:
+            return False
+
+        # The path of the local project config depends on the project name.
+        self.config_project.update(cached["project_config"])
+        if cached_key != self._get_config_cache_key():
+            self.config_project.clear()
+            return False
+
+        self.config_project_local.update(cached["project_local_config"])
+        self.config_additional_yaml.update(cached["additional_yaml"])
+        self.config = cached["config"]
+        return True
+
+    def _save_cached_config(self):
+        config_key = self._get_config_cache_key()
+        if config_key is None:
+            return
+        write_config_cache(
+            self.universal_config_obj.cumulusci_config_dir,
+            self._config_cache_name,
+            config_key,
+            {
+                "project_config": self.config_project,
+                "project_local_config": self.config_project_local,
+                "additional_yaml": self.config_additional_yaml,
+                "config": self.config,
+            },
+        )
+
     def _validate_config(self):
         """Performs validation checks on the configuration"""
         self._validate_package_api_format()
@@ -525,6 +596,67 @@ class BaseProjectConfig(BaseTaskFlowConfig):
 
         return (release, ref)
 
+    def _dependency_repo_cache_key(self, url, ref):
+        splits = self._split_repo_url(url)
+        return (splits["owner"].lower(), splits["name"].lower(), ref)
+
+    def _get_cached_dependency_repo(self, url, ref):
+        """Look up the contents of a dependency repo at ref, first in memory
+        and then (for commit SHAs) in the project's dependency cache."""
+        key = self._dependency_repo_cache_key(url, ref)
+        with self._dependency_repo_cache_lock:
+            repo_info = self._dependency_repo_cache.get(key)
+        if repo_info is None and COMMIT_SHA_RE.match(ref) and self.repo_root:
+            with self.open_cache("dependencies") as cache:
+                cache_file = cache / "{}__{}__{}.json".format(*key)
+                if cache_file.exists():
+                    with cache_file.open("r") as f:
+                        repo_info = json.load(f)
+            if repo_info is not None:
+                with self._dependency_repo_cache_lock:
+                    self._dependency_repo_cache[key] = repo_info
+        return repo_info
+
+    def _get_dependency_repo(self, repo, url, ref):
+        """Return the contents of a dependency repo at ref that are needed to
+        resolve it: its cumulusci.yml and unpackaged/pre, src and unpackaged/post
+        folders. Results are memoized, and persisted when ref is a commit SHA
+        since the contents of a commit never change."""
+        repo_info = self._get_cached_dependency_repo(url, ref)
+        if repo_info is not None:
+            return repo_info
+
+        def list_subfolders(path):
+            try:
+                contents = repo.directory_contents(path, return_as=dict, ref=ref)
+            except NotFoundError:
+                contents = None
+            return list(contents.keys()) if contents else []
+
+        try:
+            has_src = bool(repo.directory_contents("src", ref=ref))
+        except NotFoundError:
+            has_src = False
+
+        contents = repo.file_contents("cumulusci.yml", ref=ref)
+        repo_info = {
+            "repo_owner": str(repo.owner),
+            "repo_name": repo.name,
+            "cumulusci_yml": contents.decoded.decode("utf-8"),
+            "unpackaged_pre": list_subfolders("unpackaged/pre"),
+            "src": has_src,
+            "unpackaged_post": list_subfolders("unpackaged/post"),
+        }
+
+        key = self._dependency_repo_cache_key(url, ref)
+        with self._dependency_repo_cache_lock:
+            self._dependency_repo_cache[key] = repo_info
+        if COMMIT_SHA_RE.match(ref) and self.repo_root:
+            with self.open_cache("dependencies") as cache:
+                with (cache / "{}__{}__{}.json".format(*key)).open("w") as f:
+                    json.dump(repo_info, f)
+        return repo_info
+
     def get_static_dependencies(
         self, dependencies=None, include_beta=None, ignore_deps=None
     ):
@@ -543,20 +675,95 @@ class BaseProjectConfig(BaseTaskFlowConfig):
         if not dependencies:
             return []
 
+        fetched = self._fetch_github_dependencies(
+            dependencies, include_beta, ignore_deps
+        )
+        return self._get_static_dependencies(
+            dependencies, include_beta, ignore_deps, fetched
+        )
+
+    def _get_static_dependencies(
+        self, dependencies, include_beta, ignore_deps, fetched
+    ):
         static_dependencies = []
         for dependency in dependencies:
             if self._should_ignore_dependency(dependency, ignore_deps):
                 continue
-
             if "github" not in dependency:
                 static_dependencies.append(dependency)
             else:
-                static = self.process_github_dependency(
-                    dependency, include_beta=include_beta, ignore_deps=ignore_deps
+                static_dependencies.extend(
+                    self._process_github_dependency(
+                        dependency, "", include_beta, ignore_deps, fetched
+                    )
                 )
-                static_dependencies.extend(static)
         return static_dependencies
 
+    def _fetch_github_dependencies(self, dependencies, include_beta, ignore_deps):
+        """Look up the release, commit and repo contents of each GitHub
+        dependency in dependencies, and of their own dependencies.
+
+        The tree is walked a level at a time, with one pool of
+        dependency_resolution_concurrency threads for the whole tree, so that
+        no more than that many GitHub lookups run at once however deep the
+        dependencies are nested. Returns a dict of the results by
+        _github_dependency_key()."""
+        fetched = {}
+        level = dependencies
+        with ThreadPoolExecutor(
+            max_workers=self.dependency_resolution_concurrency
+        ) as executor:
+            while level:
+                futures = {}
+                for dependency in level:
+                    if "github" not in dependency or self._should_ignore_dependency(
+                        dependency, ignore_deps
+                    ):
+                        continue
+                    key = self._github_dependency_key(dependency)
+                    if key not in fetched and key not in futures:
+                        futures[key] = executor.submit(
+                            self._fetch_github_dependency, dependency, include_beta
+                        )
+
+                level = []
+                for key, future in futures.items():
+                    fetched[key] = future.result()
+                    release, ref, repo_info = fetched[key]
+                    cumulusci_yml = cci_safe_load(
+                        io.StringIO(repo_info["cumulusci_yml"])
+                    )
+                    level.extend(
+                        cumulusci_yml.get("project", {}).get("dependencies") or []
+                    )
+        return fetched
+
+    def _github_dependency_key(self, dependency):
+        return (dependency["github"], dependency.get("ref"), dependency.get("tag"))
+
+    def _fetch_github_dependency(self, dependency, include_beta):
+        """Return the release (if any), commit and repo contents that a GitHub
+        dependency resolves to."""
+        # A dependency pinned to a commit that we've already seen
+        # can be resolved without calling the GitHub API
+        if "ref" in dependency:
+            ref = dependency["ref"]
+            repo_info = self._get_cached_dependency_repo(dependency["github"], ref)
+            if repo_info is not None:
+                return None, ref, repo_info
+
+        # Initialize github3.py API against repo
+        repo = self.get_repo_from_url(dependency["github"])
+        if repo is None:
+            raise DependencyResolutionError(
+                f"Github repository {dependency['github']} not found or not authorized."
+            )
+
+        # Determine the commit
+        release, ref = self.get_ref_for_dependency(repo, dependency, include_beta)
+        repo_info = self._get_dependency_repo(repo, dependency["github"], ref)
+        return release, ref, repo_info
+
     def _should_ignore_dependency(self, dependency, ignore_deps):
         if not ignore_deps:
             return False
@@ -594,8 +801,18 @@ class BaseProjectConfig(BaseTaskFlowConfig):
                 prefix = f"{' ' * indent}    "
         return pretty
 
-    def process_github_dependency(  # noqa: C901
+    def process_github_dependency(
         self, dependency, indent=None, include_beta=None, ignore_deps=None
+    ):
+        fetched = self._fetch_github_dependencies(
+            [dependency], include_beta, ignore_deps
+        )
+        return self._process_github_dependency(
+            dependency, indent, include_beta, ignore_deps, fetched
+        )
+
+    def _process_github_dependency(  # noqa: C901
+        self, dependency, indent, include_beta, ignore_deps, fetched
     ):
         if not indent:
             indent = ""
@@ -608,22 +825,17 @@ class BaseProjectConfig(BaseTaskFlowConfig):
         if not isinstance(skip, list):
             skip = [skip]
 
-        # Initialize github3.py API against repo
-        repo = self.get_repo_from_url(dependency["github"])
-        if repo is None:
-            raise DependencyResolutionError(
-                f"{indent}Github repository {dependency['github']} not found or not authorized."
+        key = self._github_dependency_key(dependency)
+        if key in fetched:
+            release, ref, repo_info = fetched[key]
+        else:
+            release, ref, repo_info = self._fetch_github_dependency(
+                dependency, include_beta
             )
 
-        repo_owner = str(repo.owner)
-        repo_name = repo.name
-
-        # Determine the commit
-        release, ref = self.get_ref_for_dependency(repo, dependency, include_beta)
-
-        # Get the cumulusci.yml file
-        contents = repo.file_contents("cumulusci.yml", ref=ref)
-        cumulusci_yml = cci_safe_load(io.StringIO(contents.decoded.decode("utf-8")))
+        repo_owner = repo_info["repo_owner"]
+        repo_name = repo_info["repo_name"]
+        cumulusci_yml = cci_safe_load(io.StringIO(repo_info["cumulusci_yml"]))
 
         # Get the namespace from the cumulusci.yml if set
         package_config = cumulusci_yml.get("project", {}).get("package", {})
@@ -639,37 +851,29 @@ class BaseProjectConfig(BaseTaskFlowConfig):
 
         # Look for subfolders under unpackaged/pre
         unpackaged_pre = []
-        try:
-            contents = repo.directory_contents(
-                "unpackaged/pre", return_as=dict, ref=ref
+        for dirname in repo_info["unpackaged_pre"]:
+            subfolder = f"unpackaged/pre/{dirname}"
+            if subfolder in skip:
+                continue
+            name = f"Deploy {subfolder}"
+
+            unpackaged_pre.append(
+                {
+                    "name": name,
+                    "repo_owner": repo_owner,
+                    "repo_name": repo_name,
+                    "ref": ref,
+                    "subfolder": subfolder,
+                    "unmanaged": dependency.get("unmanaged"),
+                    "namespace_inject": dependency.get("namespace_inject"),
+                    "namespace_strip": dependency.get("namespace_strip"),
+                }
             )
-        except NotFoundError:
-            contents = None
-        if contents:
-            for dirname in list(contents.keys()):
-                subfolder = f"unpackaged/pre/{dirname}"
-                if subfolder in skip:
-                    continue
-                name = f"Deploy {subfolder}"
-
-                unpackaged_pre.append(
-                    {
-                        "name": name,
-                        "repo_owner": repo_owner,
-                        "repo_name": repo_name,
-                        "ref": ref,
-                        "subfolder": subfolder,
-                        "unmanaged": dependency.get("unmanaged"),
-                        "namespace_inject": dependency.get("namespace_inject"),
-                        "namespace_strip": dependency.get("namespace_strip"),
-                    }
-                )
 
         # Look for metadata under src (deployed if no namespace)
         unmanaged_src = None
         if unmanaged or not namespace:
-            contents = repo.directory_contents("src", ref=ref)
-            if contents:
+            if repo_info["src"]:
                 subfolder = "src"
 
                 unmanaged_src = {
@@ -685,42 +889,35 @@ class BaseProjectConfig(BaseTaskFlowConfig):
 
         # Look for subfolders under unpackaged/post
         unpackaged_post = []
-        try:
-            contents = repo.directory_contents(
-                "unpackaged/post", return_as=dict, ref=ref
-            )
-        except NotFoundError:
-            contents = None
-        if contents:
-            for dirname in list(contents.keys()):
-                subfolder = f"unpackaged/post/{dirname}"
-                if subfolder in skip:
-                    continue
-                name = f"Deploy {subfolder}"
+        for dirname in repo_info["unpackaged_post"]:
+            subfolder = f"unpackaged/post/{dirname}"
+            if subfolder in skip:
+                continue
+            name = f"Deploy {subfolder}"
 
-                dependency = {
-                    "name": name,
-                    "repo_owner": repo_owner,
-                    "repo_name": repo_name,
-                    "ref": ref,
-                    "subfolder": subfolder,
-                    "unmanaged": dependency.get("unmanaged"),
-                    "namespace_inject": dependency.get("namespace_inject"),
-                    "namespace_strip": dependency.get("namespace_strip"),
-                }
-                # By default, we always inject the project's namespace into
-                # unpackaged/post metadata
-                if namespace and not dependency.get("namespace_inject"):
-                    dependency["namespace_inject"] = namespace
-                    dependency["unmanaged"] = unmanaged
-                unpackaged_post.append(dependency)
+            dependency = {
+                "name": name,
+                "repo_owner": repo_owner,
+                "repo_name": repo_name,
+                "ref": ref,
+                "subfolder": subfolder,
+                "unmanaged": dependency.get("unmanaged"),
+                "namespace_inject": dependency.get("namespace_inject"),
+                "namespace_strip": dependency.get("namespace_strip"),
+            }
+            # By default, we always inject the project's namespace into
+            # unpackaged/post metadata
+            if namespace and not dependency.get("namespace_inject"):
+                dependency["namespace_inject"] = namespace
+                dependency["unmanaged"] = unmanaged
+            unpackaged_post.append(dependency)
 
         # Parse values from the repo's cumulusci.yml
         project = cumulusci_yml.get("project", {})
         dependencies = project.get("dependencies")
         if dependencies:
-            dependencies = self.get_static_dependencies(
-                dependencies, include_beta=include_beta, ignore_deps=ignore_deps
+            dependencies = self._get_static_dependencies(
+                dependencies, include_beta, ignore_deps, fetched
             )
 
         # Create the final ordered list of all parsed dependencies
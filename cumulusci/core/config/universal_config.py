@@ -1,11 +1,15 @@
 import os
 
-import yaml
-from pathlib import Path
-
+from cumulusci.core.utils import default_cumulusci_dir
 from cumulusci.core.utils import merge_config
+from cumulusci.core.config.config_cache import (
+    hash_config_sources,
+    read_config_cache,
+    write_config_cache,
+)
 from cumulusci.core.config.project_config import BaseProjectConfig
 from cumulusci.core.config import BaseTaskFlowConfig
+from cumulusci.utils.yaml.cumulusci_yml import safe_load
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
 
@@ -14,6 +18,7 @@ class UniversalConfig(BaseTaskFlowConfig):
     """ Base class for the global config which contains all configuration not specific to projects """
 
     config = None
+    config_key = None
     config_filename = "cumulusci.yml"
     project_config_class = BaseProjectConfig
 
@@ -32,12 +37,7 @@ class UniversalConfig(BaseTaskFlowConfig):
 
         Creates it if it doesn't exist yet.
         """
-        config_dir = Path.home() / ".cumulusci"
-
-        if not config_dir.exists():
-            config_dir.mkdir(parents=True)
-
-        return config_dir
+        return default_cumulusci_dir()
 
     @property
     def config_global_path(self):
@@ -63,22 +63,42 @@ class UniversalConfig(BaseTaskFlowConfig):
         if UniversalConfig.config is not None:
             return
 
+        config_key = hash_config_sources(
+            [self.config_universal_path, self.config_global_path]
+        )
+        cached_key, cached = read_config_cache(self.cumulusci_config_dir, "universal")
+        if cached_key != config_key:
+            cached = self._parse_config()
+            write_config_cache(
+                self.cumulusci_config_dir, "universal", config_key, cached
+            )
+
+        UniversalConfig.config_universal = cached["universal_config"]
+        UniversalConfig.config_global = cached["global_config"]
+        UniversalConfig.config = cached["config"]
+        UniversalConfig.config_key = config_key
+
+    def _parse_config(self):
+        """Parses and merges the universal and global YAML config files."""
         # load the global config
         with open(self.config_universal_path, "r", encoding="utf-8") as f_config:
-            config = yaml.safe_load(f_config)
-        UniversalConfig.config_universal = config
+            config_universal = safe_load(f_config)
 
         # Load the local config
         if self.config_global_path:
             with open(self.config_global_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config_global = safe_load(f)
         else:
-            config = {}
-        UniversalConfig.config_global = config
+            config_global = {}
 
-        UniversalConfig.config = merge_config(
+        config = merge_config(
             {
-                "universal_config": UniversalConfig.config_universal,
-                "global_config": UniversalConfig.config_global,
+                "universal_config": config_universal,
+                "global_config": config_global,
             }
         )
+        return {
+            "universal_config": config_universal,
+            "global_config": config_global,
+            "config": config,
+        }
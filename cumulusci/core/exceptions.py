@@ -144,6 +144,12 @@ class FlowConfigError(CumulusCIException):
     pass
 
 
+class FlowParallelStepError(CumulusCIException):
+    """ Raised when a step in a parallel group could not be run or report its result """
+
+    pass
+
+
 class FlowNotFoundError(CumulusCIUsageError):
     """ Raise when flow is not found in project config """
 
@@ -33,6 +33,28 @@ Upon running the flow, FlowRunner:
 - * Creates a TaskRunner to run the task and get the result
 - * Re-raise any fatal exceptions from the task, if not ignore_failure.
 - * collects StepResults into the flow.
+- Runs the steps of a parallel group (see below) concurrently in worker processes
+
+Parallel groups:
+
+A step may be a group of steps (tasks or flows) that don't depend on each other:
+
+    3:
+        parallel:
+            1:
+                task: deploy_post
+            2:
+                task: update_admin_profile
+
+Each member of the group runs in its own worker process, so tasks that change the
+working directory don't affect each other. The members' steps are numbered like the
+steps of a sub-flow (3/1, 3/2) and run in order within the member. Steps in a group
+can use the return values of steps before the group (and of earlier steps in the
+same member), and their results are added to the flow in step order once the whole
+group has finished. If a step fails (and doesn't ignore_failure), the other members
+stop after their current step and the flow raises the failure of the earliest
+failed step.
+On platforms without fork (Windows) the group is run one step at a time.
 
 TaskRunner:
 
@@ -57,26 +79,54 @@ try:
     from typing import List
 except ImportError:  # pragma: no cover
     pass
+from typing import Union
 
+import contextlib
 import copy
+import functools
+import itertools
+import json
 import logging
+import pickle
+import sys
+import threading
 from collections import defaultdict
 from collections import namedtuple
 from distutils.version import LooseVersion
 from operator import attrgetter
 
-from jinja2.sandbox import ImmutableSandboxedEnvironment
-
 from cumulusci.core.config import TaskConfig
 from cumulusci.core.config import FlowConfig
 from cumulusci.core.exceptions import FlowConfigError, FlowInfiniteLoopError
+from cumulusci.core.exceptions import FlowParallelStepError
+from cumulusci.core.instrumentation import chrome_trace
+from cumulusci.core.instrumentation import metrics_report
+from cumulusci.core.instrumentation import record_step_metrics
 from cumulusci.core.utils import import_global
 
 # TODO: define exception types: flowfailure, taskimporterror, etc?
 
 RETURN_VALUE_OPTION_PREFIX = "^^"
+PARALLEL = "parallel"
+
 
-jinja2_env = ImmutableSandboxedEnvironment()
+@functools.lru_cache(maxsize=None)
+def get_jinja2_env():
+    """Return the sandboxed environment used to evaluate `when` expressions.
+
+    jinja2 is imported on first use so that importing this module (and so
+    starting the CLI) doesn't pay for it."""
+    from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+    return ImmutableSandboxedEnvironment()
+
+
+def __getattr__(name):
+    # jinja2_env used to be created when this module was imported. It's still
+    # available under that name for code that imports it from here.
+    if name == "jinja2_env":
+        return get_jinja2_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class StepVersion(LooseVersion):
@@ -100,11 +150,12 @@ class StepSpec(object):
         "path",  # type: str
         "skip",  # type: bool
         "when",  # type: str
+        "parallel",  # type: tuple
     )
 
     def __init__(
         self,
-        step_num: StepVersion,
+        step_num: Union[StepVersion, str, int],
         task_name,
         task_config,
         task_class,
@@ -113,6 +164,7 @@ class StepSpec(object):
         from_flow=None,
         skip=None,
         when=None,
+        parallel=(),
     ):
         self.step_num = step_num
         self.task_name = task_name
@@ -122,6 +174,8 @@ class StepSpec(object):
         self.allow_failure = allow_failure
         self.skip = skip
         self.when = when
+        # Step numbers of the parallel groups this step is in, outermost first
+        self.parallel = parallel
 
         # Store the dotted path to this step.
         # This is not guaranteed to be unique, because multiple steps
@@ -144,8 +198,18 @@ class StepSpec(object):
 
 StepResult = namedtuple(
     "StepResult",
-    ["step_num", "task_name", "path", "result", "return_values", "exception"],
+    [
+        "step_num",
+        "task_name",
+        "path",
+        "result",
+        "return_values",
+        "exception",
+        "metrics",
+    ],
 )
+# metrics (a StepMetrics) is only recorded if the flow's callbacks ask for it
+StepResult.__new__.__defaults__ = (None,)
 
 
 class FlowCallback(object):
@@ -176,6 +240,31 @@ class FlowCallback(object):
         pass
 
 
+class MetricsFlowCallback(FlowCallback):
+    """Records metrics for each step of the flow (see cumulusci.core.instrumentation)
+    and writes them to a file when the flow finishes.
+
+    The file is a JSON report of the steps if format is "json", or a Chrome trace
+    if format is "chrome"."""
+
+    formats = {"json": metrics_report, "chrome": chrome_trace}
+
+    def __init__(self, path, format="json"):
+        if format not in self.formats:
+            raise ValueError(f"Unknown metrics format: {format}")
+        self.path = path
+        self.format = format
+
+    def pre_flow(self, coordinator):
+        coordinator.record_metrics = True
+
+    def post_flow(self, coordinator):
+        report = self.formats[self.format](coordinator.results, name=coordinator.name)
+        with open(self.path, "w") as f:
+            json.dump(report, f, indent=2)
+        coordinator.logger.info(f"Wrote step metrics to {self.path}")
+
+
 class TaskRunner(object):
     """TaskRunner encapsulates the job of instantiating and running a task."""
 
@@ -212,11 +301,12 @@ class TaskRunner(object):
         )
         self._log_options(task)
         exc = None
-        try:
-            task()
-        except Exception as e:
-            self.flow.logger.error(f"Exception in task {self.step.path}")
-            exc = e
+        with self._record_metrics() as metrics:
+            try:
+                task()
+            except Exception as e:
+                self.flow.logger.error(f"Exception in task {self.step.path}")
+                exc = e
         return StepResult(
             self.step.step_num,
             self.step.task_name,
@@ -224,8 +314,14 @@ class TaskRunner(object):
             task.result,
             task.return_values,
             exc,
+            metrics,
         )
 
+    def _record_metrics(self):
+        if self.flow is not None and self.flow.record_metrics:
+            return record_step_metrics()
+        return _no_metrics()
+
     def _log_options(self, task):
         task.logger.info("Options:")
         if not task.task_options:
@@ -237,6 +333,11 @@ class TaskRunner(object):
 
 
 class FlowCoordinator(object):
+    # The most members of a parallel group to run at once
+    parallel_workers = 4
+    # Whether to record StepMetrics for each step (usually set by a callback)
+    record_metrics = False
+
     def __init__(
         self,
         project_config,
@@ -305,6 +406,10 @@ class FlowCoordinator(object):
         previous_source = None
         for step in self.steps:
             parts = step.path.split(".")
+            for group in step.parallel:
+                # Parallel groups are numbered like flows but aren't part of the path
+                parts.insert(len(group.split("/")) - 1, (PARALLEL, group))
+            path_parts = list(parts)
             steps = str(step.step_num).split("/")
             if len(parts) > len(steps):
                 # Sub-step generated during freeze process; skip it
@@ -318,11 +423,14 @@ class FlowCoordinator(object):
                 else ""
             )
             for i, flow_name in enumerate(parts):
-                if not any(":" in part for part in step.path.split(".")[i + 1 :]):
+                if not any(":" in part for part in path_parts[i + 1 :]):
                     source = new_source
                 else:
                     source = ""
                 if len(previous_parts) < i + 1 or previous_parts[i] != flow_name:
+                    if isinstance(flow_name, tuple):
+                        lines.append(f"{'    ' * i}{steps[i]}) parallel:")
+                        continue
                     if for_docs:
                         source = ""
 
@@ -378,47 +486,231 @@ class FlowCoordinator(object):
         self._rule(new_line=True)
 
         try:
-            for step in self.steps:
-                self._run_step(step)
+            for group, steps in itertools.groupby(self.steps, key=_parallel_group):
+                if group is None:
+                    for step in steps:
+                        self._run_step(step)
+                else:
+                    self._run_parallel_steps(group, list(steps))
             flow_name = f"'{self.name}' " if self.name else ""
             self.logger.info(f"Completed flow {flow_name}successfully!")
         finally:
             self.callbacks.post_flow(self)
 
     def _run_step(self, step):
+        if not self._should_run_step(step):
+            return
+
+        self._log_step_start(step)
+        self.callbacks.pre_task(step)
+        result = TaskRunner.from_flow(self, step).run_step()
+        self.callbacks.post_task(step, result)
+
+        self.results.append(
+            result
+        )  # add even a failed result to the result set for the post flow
+
+        if result.exception and not step.allow_failure:
+            raise result.exception  # PY3: raise an exception type we control *from* this exception instead?
+
+    def _should_run_step(self, step):
         if step.skip:
             self._rule(fill="*")
             self.logger.info(f"Skipping task: {step.task_name}")
             self._rule(fill="*", new_line=True)
-            return
+            return False
 
         if step.when:
             jinja2_context = {
                 "project_config": step.project_config,
                 "org_config": self.org_config,
             }
-            expr = jinja2_env.compile_expression(step.when)
+            expr = get_jinja2_env().compile_expression(step.when)
             value = expr(**jinja2_context)
             if not value:
                 self.logger.info(
                     f"Skipping task {step.task_name} (skipped unless {step.when})"
                 )
-                return
+                return False
+
+        return True
 
+    def _log_step_start(self, step):
         self._rule(fill="-")
         self.logger.info(f"Running task: {step.task_name}")
         self._rule(fill="-", new_line=True)
 
-        self.callbacks.pre_task(step)
-        result = TaskRunner.from_flow(self, step).run_step()
-        self.callbacks.post_task(step, result)
-
-        self.results.append(
-            result
-        )  # add even a failed result to the result set for the post flow
+    def _run_parallel_steps(self, group, steps):
+        """Run the steps of a parallel group, with each member of the group in
+        its own worker process.
+
+        Callbacks are called in this process, in the order the workers report
+        the steps, and the steps' results are added to the flow in step order
+        once the whole group has finished.
+
+        Workers are forked from this process, so members must not depend on
+        state they share in memory with each other or with the flow. Changes
+        a member makes to the org's config are copied back to the flow's
+        org_config, in step order, once the group has finished. Any other
+        changes to in-memory state in a worker are lost."""
+        import multiprocessing
+        from multiprocessing.connection import wait
+
+        # Each member is a list of (index in steps, step)
+        members = [
+            list(member)
+            for _, member in itertools.groupby(
+                enumerate(steps), key=lambda item: _parallel_member(group, item[1])
+            )
+        ]
+        self.logger.info(
+            f"Running {len(members)} steps in parallel: "
+            + ", ".join(member[0][1].path for member in members)
+        )
+        self.logger.info("")
+        if len(members) > 1 and not _can_fork():
+            self.logger.info(
+                "Worker processes can't be used here, so running the steps one at a time."
+            )
+        if len(members) == 1 or not _can_fork():
+            for step in steps:
+                self._run_step(step)
+            return
 
-        if result.exception and not step.allow_failure:
-            raise result.exception  # PY3: raise an exception type we control *from* this exception instead?
+        # The workers share the org's keychain entry, so refresh the
+        # credentials once here instead of in every worker.
+        if self.org_config is not None:
+            with self.org_config.save_if_changed():
+                self.org_config.refresh_oauth_token(self.project_config.keychain)
+
+        context = multiprocessing.get_context("fork")
+        stop = context.Event()
+        pending = list(members)
+        running = {}  # connection: (worker, member)
+        results = {}
+        failures = {}
+        org_updates = {}
+        try:
+            while running or (pending and not stop.is_set()):
+                while (
+                    pending
+                    and not stop.is_set()
+                    and len(running) < self.parallel_workers
+                ):
+                    member = pending.pop(0)
+                    conn, worker_conn = context.Pipe()
+                    worker = context.Process(
+                        target=self._run_parallel_member,
+                        args=(member, worker_conn, stop),
+                        name=f"{PARALLEL} step {member[0][1].step_num}",
+                    )
+                    # Don't let the worker inherit (and repeat) buffered output
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    worker.start()
+                    worker_conn.close()
+                    running[conn] = (worker, member)
+
+                for conn in wait(list(running)):
+                    try:
+                        message, index, value = conn.recv()
+                    except EOFError:
+                        worker, member = running.pop(conn)
+                        conn.close()
+                        worker.join()
+                        if worker.exitcode:
+                            index, step = member[0]
+                            failures.setdefault(
+                                index,
+                                FlowParallelStepError(
+                                    f"The worker running step {step.step_num} exited with code {worker.exitcode}"
+                                ),
+                            )
+                            stop.set()
+                        continue
+
+                    step = steps[index]
+                    if message == "pre_task":
+                        self.callbacks.pre_task(step)
+                        conn.send(True)
+                    elif message == "post_task":
+                        results[index] = value
+                        self.callbacks.post_task(step, value)
+                        if value.exception and not step.allow_failure:
+                            failures[index] = value.exception
+                            stop.set()
+                    elif message == "error":
+                        failures[index] = value
+                        stop.set()
+                    elif message == "org_config":
+                        org_updates[index] = value
+        finally:
+            # Let steps that are already running finish if something went wrong here
+            stop.set()
+            for conn, (worker, member) in running.items():
+                conn.close()
+                worker.join()
+            if self.org_config is not None:
+                with self.org_config.save_if_changed():
+                    for index in sorted(org_updates):
+                        self.org_config.config.update(org_updates[index])
+                # The steps may have installed packages or changed the schema
+                self.org_config.reload_cached_info()
+
+        # add even failed results to the result set for the post flow
+        self.results.extend(results[index] for index in sorted(results))
+        if failures:
+            raise failures[min(failures)]
+
+    def _run_parallel_member(self, member, conn, stop):
+        """Run the steps of one member of a parallel group in a worker process,
+        reporting each step to the flow's process over conn."""
+        from cumulusci.salesforce_api.metadata import reset_mdapi_sessions
+        from cumulusci.salesforce_api.utils import reset_org_connections
+
+        # Don't share the flow's open connections to the org
+        reset_org_connections()
+        reset_mdapi_sessions()
+        if self.org_config is not None:
+            self.org_config.refresh_credentials = False
+            orig_org_config = copy.deepcopy(self.org_config.config)
+        try:
+            self._run_parallel_member_steps(member, conn, stop)
+        finally:
+            # Send back changes to the org's config, since the flow's
+            # process won't see them otherwise.
+            if self.org_config is not None:
+                changes = {
+                    key: value
+                    for key, value in self.org_config.config.items()
+                    if key not in orig_org_config or orig_org_config[key] != value
+                }
+                if changes:
+                    conn.send(("org_config", member[0][0], _picklable(changes, {})))
+            conn.close()
+
+    def _run_parallel_member_steps(self, member, conn, stop):
+        for position, (index, step) in enumerate(member):
+            # Once a step in the group has failed, stop after the current step
+            if position and stop.is_set():
+                break
+            try:
+                if not self._should_run_step(step):
+                    continue
+                self._log_step_start(step)
+                conn.send(("pre_task", index, None))
+                conn.recv()  # wait for the pre_task callback
+                result = TaskRunner.from_flow(self, step).run_step()
+            except Exception as e:
+                conn.send(("error", index, _picklable_exception(e)))
+                stop.set()
+                break
+            # later steps of this member can use the result's return values
+            self.results.append(result)
+            conn.send(("post_task", index, _picklable_result(result)))
+            if result.exception and not step.allow_failure:
+                stop.set()
+                break
 
     def _init_logger(self):
         """
@@ -455,6 +747,7 @@ class FlowCoordinator(object):
         parent_options=None,
         parent_ui_options=None,
         from_flow=None,
+        parallel=(),
     ):
         """
         for each step (as defined in the flow YAML), _visit_step is called with only
@@ -469,6 +762,7 @@ class FlowCoordinator(object):
         :param parent_options: used when called recursively for nested steps, options from parent flow
         :param parent_ui_options: used when called recursively for nested steps, UI options from parent flow
         :param from_flow: used when called recursively for nested steps, name of parent flow
+        :param parallel: used when called recursively for nested steps, numbers of the parallel groups containing the step
         :return: List[StepSpec] a list of all resolved steps including/under the one passed in
         """
         number = StepVersion(str(number))
@@ -486,6 +780,11 @@ class FlowCoordinator(object):
             raise FlowConfigError(
                 f"Step {number} is configured as both a flow AND a task. \n\t{step_config}."
             )
+        # - A parallel group is neither.
+        if PARALLEL in step_config and any(k in step_config for k in ("flow", "task")):
+            raise FlowConfigError(
+                f"Step {number} is configured as both a parallel group AND a flow or task. \n\t{step_config}."
+            )
 
         # Skips
         # - either in YAML (with the None string)
@@ -504,6 +803,7 @@ class FlowCoordinator(object):
                     project_config=project_config,
                     from_flow=from_flow,
                     skip=True,  # someday we could use different vals for why skipped
+                    parallel=parallel,
                 )
             )
             return visited_steps
@@ -555,10 +855,26 @@ class FlowCoordinator(object):
                     allow_failure=step_config.get("ignore_failure", False),
                     from_flow=from_flow,
                     when=step_config.get("when"),
+                    parallel=parallel,
                 )
             )
             return visited_steps
 
+        if PARALLEL in step_config:
+            # The members of the group are numbered like the steps of a sub-flow
+            for sub_number, sub_stepconf in step_config[PARALLEL].items():
+                self._visit_step(
+                    number=f"{number}/{sub_number}",
+                    step_config=sub_stepconf,
+                    project_config=project_config,
+                    visited_steps=visited_steps,
+                    parent_options=parent_options,
+                    parent_ui_options=parent_ui_options,
+                    from_flow=from_flow,
+                    parallel=parallel + (str(number),),
+                )
+            return visited_steps
+
         if "flow" in step_config:
             name = step_config["flow"]
             if from_flow:
@@ -582,6 +898,7 @@ class FlowCoordinator(object):
                     parent_options=step_options,
                     parent_ui_options=step_ui_options,
                     from_flow=path,
+                    parallel=parallel,
                 )
         return visited_steps
 
@@ -605,7 +922,10 @@ class FlowCoordinator(object):
         if visited_flows is None:
             visited_flows = set()
         project_config = flow_config.project_config
-        for step in flow_config.steps.values():
+        steps = list(flow_config.steps.values())
+        for step in steps:
+            if PARALLEL in step:
+                steps.extend(step[PARALLEL].values())
             if "flow" in step:
                 flow_name = step["flow"]
                 if flow_name == "None":
@@ -647,6 +967,63 @@ class FlowCoordinator(object):
         raise NameError(f"Path not found: {path}")
 
 
+@contextlib.contextmanager
+def _no_metrics():
+    yield None
+
+
+def _parallel_group(step):
+    """The outermost parallel group containing the step, if any."""
+    return step.parallel[0] if step.parallel else None
+
+
+def _parallel_member(group, step):
+    """The step number of the member of the parallel group that contains the step."""
+    depth = len(group.split("/")) + 1
+    return "/".join(str(step.step_num).split("/")[:depth])
+
+
+def _can_fork():
+    """Whether parallel groups can run in forked worker processes.
+
+    A forked process inherits any locks held by other threads, which would
+    never be released there, so this is only done when no other threads are
+    running. fork isn't available on Windows, and isn't safe on macOS, where
+    system libraries may have started threads of their own."""
+    import multiprocessing
+
+    return (
+        sys.platform != "darwin"
+        and "fork" in multiprocessing.get_all_start_methods()
+        and threading.active_count() == 1
+    )
+
+
+def _picklable(value, default):
+    try:
+        pickle.loads(pickle.dumps(value))
+    except Exception:
+        return default
+    return value
+
+
+def _picklable_exception(exception):
+    return _picklable(
+        exception,
+        FlowParallelStepError(f"{exception.__class__.__name__}: {exception}"),
+    )
+
+
+def _picklable_result(result):
+    """Return the StepResult, leaving out any parts that can't be sent from
+    a worker process."""
+    return result._replace(
+        result=_picklable(result.result, None),
+        return_values=_picklable(result.return_values, {}),
+        exception=result.exception and _picklable_exception(result.exception),
+    )
+
+
 class PreflightFlowCoordinator(FlowCoordinator):
     """Coordinates running preflight checks instead of the actual flow steps."""
 
@@ -690,7 +1067,7 @@ class PreflightFlowCoordinator(FlowCoordinator):
 
     def evaluate_check(self, check, jinja2_context):
         self.logger.info(f"Evaluating check: {check['when']}")
-        expr = jinja2_env.compile_expression(check["when"])
+        expr = get_jinja2_env().compile_expression(check["when"])
         value = bool(expr(**jinja2_context))
         self.logger.info(f"Check result: {value}")
         if value:
@@ -0,0 +1,208 @@
+""" Measurements of where the time goes in a flow.
+
+While a flow step is being recorded (see record_step_metrics), every HTTP
+request made with requests and every call to time.sleep in the process,
+including those made by worker threads the step starts, is attributed to the
+step. (Steps in a parallel group run in their own processes.) The results can be written out as a JSON report
+or as a Chrome trace (which can be opened in chrome://tracing or Perfetto)
+by a MetricsFlowCallback.
+"""
+
+import contextlib
+import os
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+LIMIT_INFO_HEADER = "Sforce-Limit-Info"
+API_USAGE_RE = re.compile(r"(?<![\w-])api-usage=(\d+)/(\d+)")
+
+# Guarded by _hooks_lock, as are updates to the current StepMetrics
+_current_metrics = None
+_hooks_lock = threading.Lock()
+_hooks_users = 0
+_original_send = None
+_original_sleep = None
+
+
+class StepMetrics(object):
+    """What one flow step spent its time on."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.start = None  # seconds since the epoch
+        self.wall_time = 0.0
+        self.wait_time = 0.0
+        # host: {"requests": count, "bytes_sent": bytes, "bytes_received": bytes}
+        self.http = {}
+        # Salesforce API usage reported by the first and last responses
+        self.api_usage_start = None
+        self.api_usage_end = None
+        self.api_limit = None
+
+    @property
+    def api_calls(self):
+        """The number of Salesforce API calls used while the step ran (by any client of the org)."""
+        if self.api_usage_start is None:
+            return 0
+        # The first response's usage already includes its own request
+        return self.api_usage_end - self.api_usage_start + 1
+
+    def record_sleep(self, seconds):
+        self.wait_time += seconds
+
+    def record_response(self, request, response, stream=False):
+        host = urlparse(request.url).hostname or ""
+        stats = self.http.setdefault(
+            host, {"requests": 0, "bytes_sent": 0, "bytes_received": 0}
+        )
+        stats["requests"] += 1
+        stats["bytes_sent"] += _request_size(request)
+        stats["bytes_received"] += _response_size(response, stream)
+
+        match = API_USAGE_RE.search(response.headers.get(LIMIT_INFO_HEADER, ""))
+        if match:
+            used, limit = int(match.group(1)), int(match.group(2))
+            if self.api_usage_start is None:
+                self.api_usage_start = used
+            self.api_usage_end = used
+            self.api_limit = limit
+
+    def as_dict(self):
+        return {
+            "start": self.start,
+            "wall_time": self.wall_time,
+            "wait_time": self.wait_time,
+            "http_requests": sum(stats["requests"] for stats in self.http.values()),
+            "http": self.http,
+            "api_calls": self.api_calls,
+            "api_usage": self.api_usage_end,
+            "api_limit": self.api_limit,
+        }
+
+
+@contextlib.contextmanager
+def record_step_metrics():
+    """Record the metrics of whatever runs in this process in the with block."""
+    global _current_metrics
+    metrics = StepMetrics()
+    _install_hooks()
+    with _hooks_lock:
+        previous = _current_metrics
+        _current_metrics = metrics
+    metrics.start = time.time()
+    started = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_time = time.perf_counter() - started
+        with _hooks_lock:
+            _current_metrics = previous
+        _uninstall_hooks()
+
+
+def metrics_report(results, name=None):
+    """Return a JSON-serializable report of the metrics of a flow's StepResults."""
+    steps = []
+    for result in results:
+        if result.metrics is None:
+            continue
+        step = {
+            "step_num": str(result.step_num),
+            "task_name": result.task_name,
+            "path": result.path,
+            "status": "failure" if result.exception else "success",
+        }
+        step.update(result.metrics.as_dict())
+        steps.append(step)
+    return {"flow": name, "steps": steps}
+
+
+def chrome_trace(results, name=None):
+    """Return the metrics of a flow's StepResults in the Chrome trace event format.
+
+    Steps that ran in parallel worker processes are shown on separate rows."""
+    events = []
+    for result in results:
+        metrics = result.metrics
+        if metrics is None:
+            continue
+        args = metrics.as_dict()
+        del args["start"]
+        args["status"] = "failure" if result.exception else "success"
+        events.append(
+            {
+                "name": f"{result.step_num} {result.path}",
+                "cat": "step",
+                "ph": "X",
+                "ts": int(metrics.start * 1000000),
+                "dur": int(metrics.wall_time * 1000000),
+                "pid": 1,
+                "tid": metrics.pid,
+                "args": args,
+            }
+        )
+    return {"traceEvents": events, "otherData": {"flow": name}}
+
+
+def _request_size(request):
+    length = request.headers.get("Content-Length")
+    if length is not None:
+        return int(length)
+    body = request.body
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return 0
+
+
+def _response_size(response, stream):
+    length = response.headers.get("Content-Length")
+    if length is not None:
+        return int(length)
+    if stream:
+        # Reading the content here would consume the stream
+        return 0
+    return len(response.content or b"")
+
+
+def _send(session, request, **kwargs):
+    response = _original_send(session, request, **kwargs)
+    with _hooks_lock:
+        if _current_metrics is not None:
+            _current_metrics.record_response(
+                request, response, kwargs.get("stream", False)
+            )
+    return response
+
+
+def _sleep(seconds):
+    with _hooks_lock:
+        if _current_metrics is not None:
+            _current_metrics.record_sleep(seconds)
+    return _original_sleep(seconds)
+
+
+def _install_hooks():
+    global _hooks_users, _original_send, _original_sleep
+    with _hooks_lock:
+        _hooks_users += 1
+        if _hooks_users == 1:
+            _original_send = requests.Session.send
+            _original_sleep = time.sleep
+            requests.Session.send = _send
+            time.sleep = _sleep
+
+
+def _uninstall_hooks():
+    global _hooks_users
+    with _hooks_lock:
+        _hooks_users -= 1
+        if _hooks_users == 0:
+            # Only put things back if nothing else has replaced them since
+            if requests.Session.send is _send:
+                requests.Session.send = _original_send
+            if time.sleep is _sleep:
+                time.sleep = _original_sleep
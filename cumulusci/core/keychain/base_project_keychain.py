@@ -160,11 +160,14 @@ class BaseProjectKeychain(BaseConfig):
     def get_default_org(self):
         """ retrieve the name and configuration of the default org """
         for org in self.list_orgs():
-            org_config = self.get_org(org)
-            if org_config.default:
-                return org, org_config
+            if self.get_org_summary(org).default:
+                return org, self.get_org(org)
         return None, None
 
+    def get_default_org_name(self):
+        """ retrieve the name of the default org """
+        return self.get_default_org()[0]
+
     def set_default_org(self, name):
         """ set the default org for tasks and flows by name """
         org = self.get_org(name)
@@ -181,8 +184,8 @@ class BaseProjectKeychain(BaseConfig):
     def unset_default_org(self):
         """ unset the default orgs for tasks """
         for org in self.list_orgs():
-            org_config = self.get_org(org)
-            if org_config.default:
+            if self.get_org_summary(org).default:
+                org_config = self.get_org(org)
                 del org_config.config["default"]
                 org_config.save()
         sfdx("force:config:set defaultusername=")
@@ -198,6 +201,13 @@ class BaseProjectKeychain(BaseConfig):
             org.keychain = self
         return org
 
+    def get_org_summary(self, name: str):
+        """retrieve an org configuration for listing the org.
+
+        Keychains that can read an org's details without decrypting its
+        credentials return an org config with only those details."""
+        return self.get_org(name)
+
     def _get_org(self, name):
         return self.orgs.get(name)
 
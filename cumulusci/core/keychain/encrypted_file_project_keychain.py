@@ -1,3 +1,6 @@
+import datetime
+import hashlib
+import json
 import os
 from typing import NamedTuple
 from pathlib import Path
@@ -6,11 +9,34 @@ from cumulusci.core.exceptions import OrgNotFound
 from cumulusci.core.exceptions import ServiceNotConfigured
 from cumulusci.core.keychain import BaseEncryptedProjectKeychain
 from cumulusci.core.config import OrgConfig
+from cumulusci.core.config import ScratchOrgConfig
+
+# The org index stores the cleartext details needed to list orgs next to
+# the encrypted .org files, so that listing orgs does not decrypt them.
+ORG_INDEX_FILENAME = "orgs.index.json"
+ORG_INDEX_FIELDS = (
+    "scratch",
+    "config_name",
+    "days",
+    "date_created",
+    "expires",
+    "instance_url",
+    "username",
+    "default",
+)
+INDEX_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 
 
 class EncryptedFileProjectKeychain(BaseEncryptedProjectKeychain):
     """ An encrypted project keychain that stores in the project's local directory """
 
+    def __init__(self, project_config, key):
+        # Decrypted org configs, by name, along with the data they came from
+        self._org_configs = {}
+        # Org indexes, by whether they are for the global or project orgs
+        self._org_indexes = {}
+        super().__init__(project_config, key)
+
     @property
     def global_config_dir(self):
         try:
@@ -82,6 +108,21 @@ class EncryptedFileProjectKeychain(BaseEncryptedProjectKeychain):
 
         os.remove(full_path)
         del self.orgs[name]
+        self._org_configs.pop(name, None)
+        global_org = bool(global_org)
+        if self._read_org_index(global_org).pop(name, None) is not None:
+            self._write_org_index(global_org)
+
+    def _set_org(self, org_config, global_org):
+        super()._set_org(org_config, global_org)
+        dirname = self._org_dir(global_org)
+        if dirname is None:
+            return
+        try:
+            encrypted = Path(dirname, f"{org_config.name}.org").read_bytes()
+        except OSError:
+            return
+        self._index_org(org_config, encrypted, global_org)
 
     def _set_encrypted_org(self, name, encrypted, global_org):
         if global_org:
@@ -113,16 +154,88 @@ class EncryptedFileProjectKeychain(BaseEncryptedProjectKeychain):
         )
 
     def _get_org(self, name):
+        # Orgs are only decrypted when they are first needed, and are then
+        # kept until the org is changed.
+        encrypted = self.orgs[name].encrypted_data
+        cached = self._org_configs.get(name)
+        if cached is not None and cached[0] == encrypted:
+            return cached[1]
         org = self._decrypt_config(
-            OrgConfig,
-            self.orgs[name].encrypted_data,
-            extra=[name, self],
-            context=f"org config ({name})",
+            OrgConfig, encrypted, extra=[name, self], context=f"org config ({name})"
         )
         if self.orgs[name].global_org:
             org.global_org = True
+        self._org_configs[name] = (encrypted, org)
         return org
 
+    def get_org_summary(self, name: str):
+        """Retrieve an org configuration with only the details needed to list
+        the org (and no credentials) without decrypting the org, if possible."""
+        if name not in self.orgs:
+            self._raise_org_not_found(name)
+        org = self.orgs[name]
+        entry = self._read_org_index(org.global_org).get(name)
+        if not entry or entry.get("hash") != _hash_org_data(org.encrypted_data):
+            org_config = self.get_org(name)
+            self._index_org(org_config, org.encrypted_data, org.global_org)
+            return org_config
+        config = dict(entry["config"])
+        config_class = ScratchOrgConfig if config.get("scratch") else OrgConfig
+        return config_class(config, name, keychain=self, global_org=org.global_org)
+
+    def _org_dir(self, global_org):
+        return self.global_config_dir if global_org else self.project_local_dir
+
+    def _read_org_index(self, global_org):
+        if global_org not in self._org_indexes:
+            index = {}
+            dirname = self._org_dir(global_org)
+            if dirname is not None:
+                try:
+                    index = json.loads(
+                        Path(dirname, ORG_INDEX_FILENAME).read_text(),
+                        object_hook=_decode_index_value,
+                    )
+                except (OSError, ValueError):
+                    pass
+            self._org_indexes[global_org] = index if isinstance(index, dict) else {}
+        return self._org_indexes[global_org]
+
+    def _write_org_index(self, global_org):
+        dirname = self._org_dir(global_org)
+        if dirname is None:
+            return
+        try:
+            data = json.dumps(
+                self._read_org_index(global_org),
+                default=_encode_index_value,
+                indent=2,
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            # Orgs with details that can't be stored in the index are decrypted
+            # when they are listed instead.
+            return
+        try:
+            Path(dirname, ORG_INDEX_FILENAME).write_text(data)
+        except OSError:
+            pass
+
+    def _index_org(self, org_config, encrypted, global_org):
+        config = {
+            field: org_config.config[field]
+            for field in ORG_INDEX_FIELDS
+            if field in org_config.config
+        }
+        username = org_config.config.get(
+            "username", org_config.userinfo__preferred_username
+        )
+        if username:
+            config["username"] = username
+        index = self._read_org_index(global_org)
+        index[org_config.name] = {"hash": _hash_org_data(encrypted), "config": config}
+        self._write_org_index(global_org)
+
     @property
     def _default_org_path(self):
         if self.project_local_dir:
@@ -146,6 +259,15 @@ class EncryptedFileProjectKeychain(BaseEncryptedProjectKeychain):
             self.set_default_org(org_name)  # upgrade to new way
         return org_name, org_config
 
+    def get_default_org_name(self):
+        """ Retrieve the name of the default org """
+        default_org_path = self._default_org_path
+        if default_org_path and default_org_path.exists():
+            org_name = default_org_path.read_text().strip()
+            if org_name in self.orgs:
+                return org_name
+        return self.get_default_org()[0]
+
     def set_default_org(self, name: str):
         """ Set the default org for tasks and flows by name """
         super().set_default_org(name)
@@ -168,3 +290,21 @@ class GlobalOrg(NamedTuple):
 class LocalOrg(NamedTuple):
     encrypted_data: bytes
     global_org: bool = False
+
+
+def _hash_org_data(encrypted):
+    if isinstance(encrypted, str):
+        encrypted = encrypted.encode("utf-8")
+    return hashlib.blake2b(encrypted, digest_size=20).hexdigest()
+
+
+def _encode_index_value(value):
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        return {"$datetime": value.strftime(INDEX_DATETIME_FORMAT)}
+    raise TypeError(f"{value!r} can't be stored in the org index")
+
+
+def _decode_index_value(value):
+    if list(value) == ["$datetime"]:
+        return datetime.datetime.strptime(value["$datetime"], INDEX_DATETIME_FORMAT)
+    return value
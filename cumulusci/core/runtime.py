@@ -4,7 +4,6 @@ import sys
 from cumulusci.core.config import UniversalConfig, BaseProjectConfig
 from cumulusci.core.exceptions import NotInProject, ProjectConfigNotFound
 from cumulusci.core.keychain import BaseProjectKeychain
-from cumulusci.core.flowrunner import FlowCallback, FlowCoordinator
 
 
 # pylint: disable=assignment-from-none
@@ -12,7 +11,9 @@ class BaseCumulusCI(object):
     universal_config_class = UniversalConfig
     project_config_class = BaseProjectConfig
     keychain_class = BaseProjectKeychain
-    callback_class = FlowCallback
+    # Defaults to FlowCallback. The flowrunner is imported when a flow is run,
+    # so that commands which don't run flows don't import it.
+    callback_class = None
 
     def __init__(self, *args, load_keychain=True, **kwargs):
         self.universal_config = None
@@ -86,8 +87,10 @@ class BaseCumulusCI(object):
 
     def get_flow(self, name, options=None):
         """ Get a primed and readytogo flow coordinator. """
+        from cumulusci.core.flowrunner import FlowCallback, FlowCoordinator
+
         flow_config = self.project_config.get_flow(name)
-        callbacks = self.callback_class()
+        callbacks = (self.callback_class or FlowCallback)()
         coordinator = FlowCoordinator(
             flow_config.project_config,
             flow_config,
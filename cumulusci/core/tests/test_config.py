@@ -3,14 +3,19 @@ from distutils.version import StrictVersion
 import json
 import os
 import pathlib
+import re
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
 
 import pytest
 from unittest import mock
 import responses
 import yaml
+from simple_salesforce import Salesforce
 
 from github3.exceptions import NotFoundError
 from cumulusci.core.config import BaseConfig
@@ -844,6 +849,119 @@ class TestBaseProjectConfig(unittest.TestCase):
             ],
         )
 
+    def test_process_github_dependency__commit_cached(self):
+        sha = "a" * 40
+        dependency = {
+            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test",
+            "unmanaged": True,
+            "ref": sha,
+        }
+        with TemporaryDirectory() as repo_root:
+            config = BaseProjectConfig(UniversalConfig())
+            config._repo_info = {"root": repo_root}
+            config.get_github_api = mock.Mock(return_value=self._make_github())
+            expected = config.process_github_dependency(dependency, "")
+
+            # A new project config reads the repo contents from the cache
+            # and only hits the API to resolve the child dependency.
+            github = self._make_github()
+            github.repositories["CumulusCI-Test"] = DummyRepository(
+                "SFDO-Tooling", "CumulusCI-Test", {}
+            )
+            config = BaseProjectConfig(UniversalConfig())
+            config._repo_info = {"root": repo_root}
+            config.get_github_api = mock.Mock(return_value=github)
+            assert config.process_github_dependency(dependency, "") == expected
+            assert (
+                Path(repo_root)
+                / ".cci"
+                / "dependencies"
+                / f"sfdo-tooling__cumulusci-test__{sha}.json"
+            ).exists()
+
+    def test_process_github_dependency__memoized(self):
+        config = BaseProjectConfig(UniversalConfig())
+        github = self._make_github()
+        config.get_github_api = mock.Mock(return_value=github)
+        repo = github.repositories["CumulusCI-Test-Dep"]
+        dependency = {
+            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test-Dep",
+            "unmanaged": True,
+            "ref": "some_branch",
+        }
+
+        with mock.patch.object(
+            repo, "file_contents", wraps=repo.file_contents
+        ) as file_contents:
+            result = config.process_github_dependency(dependency, "")
+            assert config.process_github_dependency(dependency, "") == result
+        file_contents.assert_called_once()
+
+    def test_get_static_dependencies__concurrent(self):
+        config = BaseProjectConfig(
+            UniversalConfig(),
+            {
+                "project": {
+                    "dependencies": [
+                        {"namespace": "first", "version": "1.0"},
+                        {
+                            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test",
+                            "unmanaged": True,
+                        },
+                        {"namespace": "middle", "version": "1.0"},
+                        {
+                            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test-Dep"
+                        },
+                        {"namespace": "last", "version": "1.0"},
+                    ]
+                }
+            },
+        )
+        config.get_github_api = mock.Mock(return_value=self._make_github())
+
+        result = config.get_static_dependencies()
+        assert [dep.get("name") or dep["namespace"] for dep in result] == [
+            "first",
+            "Deploy unpackaged/pre/pre",
+            "Deploy unpackaged/pre/skip",
+            "Install CumulusCI-Test-Dep 2.0",
+            "Deploy CumulusCI-Test",
+            "Deploy unpackaged/post/post",
+            "Deploy unpackaged/post/skip",
+            "middle",
+            "Install CumulusCI-Test-Dep 2.0",
+            "last",
+        ]
+
+    def test_get_static_dependencies__one_pool(self):
+        config = BaseProjectConfig(
+            UniversalConfig(),
+            {
+                "project": {
+                    "dependencies": [
+                        {
+                            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test",
+                            "unmanaged": True,
+                        },
+                        {
+                            "github": "https://github.com/SFDO-Tooling/CumulusCI-Test-Dep"
+                        },
+                    ]
+                }
+            },
+        )
+        config.dependency_resolution_concurrency = 2
+        config.get_github_api = mock.Mock(return_value=self._make_github())
+
+        with mock.patch(
+            "cumulusci.core.config.project_config.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            config.get_static_dependencies()
+
+        # CumulusCI-Test's own dependency is looked up in the same pool
+        executor.assert_called_once_with(max_workers=2)
+
     def test_process_github_dependency__with_skipped_deps(self):
         universal_config = UniversalConfig()
         config = BaseProjectConfig(universal_config)
@@ -1413,51 +1531,71 @@ class TestOrgConfig(unittest.TestCase):
             ],
         },
         {
-            "size": 1,
-            "totalSize": 1,
-            "done": True,
-            "records": [
+            "compositeResponse": [
                 {
-                    "Id": "04t1T00000070yqQAA",
-                    "MajorVersion": 3,
-                    "MinorVersion": 119,
-                    "PatchVersion": 0,
-                    "BuildNumber": 5,
-                    "IsBeta": False,
-                }
-            ],
-        },
-        {
-            "size": 1,
-            "totalSize": 1,
-            "done": True,
-            "records": [
+                    "body": {
+                        "size": 1,
+                        "totalSize": 1,
+                        "done": True,
+                        "records": [
+                            {
+                                "Id": "04t1T00000070yqQAA",
+                                "MajorVersion": 3,
+                                "MinorVersion": 119,
+                                "PatchVersion": 0,
+                                "BuildNumber": 5,
+                                "IsBeta": False,
+                            }
+                        ],
+                    },
+                    "httpStatusCode": 200,
+                    "referenceId": "spv0",
+                },
                 {
-                    "Id": "04t000000000001AAA",
-                    "MajorVersion": 12,
-                    "MinorVersion": 0,
-                    "PatchVersion": 1,
-                    "BuildNumber": 1,
-                    "IsBeta": False,
-                }
-            ],
-        },
-        {
-            "size": 1,
-            "totalSize": 1,
-            "done": True,
-            "records": [
+                    "body": {
+                        "size": 1,
+                        "totalSize": 1,
+                        "done": True,
+                        "records": [
+                            {
+                                "Id": "04t000000000001AAA",
+                                "MajorVersion": 12,
+                                "MinorVersion": 0,
+                                "PatchVersion": 1,
+                                "BuildNumber": 1,
+                                "IsBeta": False,
+                            }
+                        ],
+                    },
+                    "httpStatusCode": 200,
+                    "referenceId": "spv1",
+                },
                 {
-                    "Id": "04t000000000002AAA",
-                    "MajorVersion": 1,
-                    "MinorVersion": 10,
-                    "PatchVersion": 0,
-                    "BuildNumber": 5,
-                    "IsBeta": True,
-                }
-            ],
+                    "body": {
+                        "size": 1,
+                        "totalSize": 1,
+                        "done": True,
+                        "records": [
+                            {
+                                "Id": "04t000000000002AAA",
+                                "MajorVersion": 1,
+                                "MinorVersion": 10,
+                                "PatchVersion": 0,
+                                "BuildNumber": 5,
+                                "IsBeta": True,
+                            }
+                        ],
+                    },
+                    "httpStatusCode": 200,
+                    "referenceId": "spv2",
+                },
+                {
+                    "body": {"size": 0, "totalSize": 0, "done": True, "records": []},
+                    "httpStatusCode": 200,
+                    "referenceId": "spv3",
+                },
+            ]
         },
-        {"size": 0, "totalSize": 0, "done": True, "records": []},
     ]
 
     @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
@@ -1495,12 +1633,177 @@ class TestOrgConfig(unittest.TestCase):
         assert config.installed_packages == expected
         sf.restful.assert_called()
 
+        # One query for the installed packages, then one composite request
+        # with a query for each version
+        assert sf.restful.call_count == 2
+        assert sf.restful.call_args[0][0] == "tooling/composite"
+        subrequests = sf.restful.call_args[1]["json"]["compositeRequest"]
+        assert [
+            parse_qs(urlparse(subrequest["url"]).query)["q"][0]
+            for subrequest in subrequests
+        ] == [
+            "SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
+            f"IsBeta FROM SubscriberPackageVersion WHERE Id='{version_id}'"
+            for version_id in (
+                "04t1T00000070yqQAA",
+                "04t000000000001AAA",
+                "04t000000000002AAA",
+                "04t0000000BOGUSAAA",
+            )
+        ]
+
         sf.restful.reset_mock()
         sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
         config.reset_installed_packages()
         assert config.installed_packages == expected
         sf.restful.assert_called()
 
+    @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
+    def test_installed_packages__persisted(self, sf):
+        config = OrgConfig(
+            {"instance_url": "https://example.com", "username": "test@example.com"},
+            "test",
+            keychain=DummyKeychain(),
+        )
+        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS * 2
+        with TemporaryDirectory() as t:
+            with mock.patch("cumulusci.tests.util.DummyKeychain.cache_dir", Path(t)):
+                expected = config.installed_packages
+
+                # Another org config for the same org reads the orginfo cache
+                other_config = OrgConfig(
+                    config.config, "other", keychain=config.keychain
+                )
+                assert other_config.installed_packages == expected
+                assert sf.restful.call_count == 2
+
+                other_config.reset_installed_packages()
+                config.reset_installed_packages()
+                assert config.installed_packages == expected
+                assert sf.restful.call_count == 4
+
+    @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
+    def test_installed_packages__cache_expired(self, sf):
+        config = OrgConfig(
+            {"instance_url": "https://example.com", "username": "test@example.com"},
+            "test",
+            keychain=DummyKeychain(),
+        )
+        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS * 2
+        with TemporaryDirectory() as t:
+            with mock.patch("cumulusci.tests.util.DummyKeychain.cache_dir", Path(t)):
+                expected = config.installed_packages
+                with config.get_orginfo_cache_dir("installed_packages") as cache_dir:
+                    with (cache_dir / "installed_packages.json").open("r+") as f:
+                        cached = json.load(f)
+                        cached["fetched"] = 0
+                        f.seek(0)
+                        json.dump(cached, f)
+
+                config._installed_packages = None
+                assert config.installed_packages == expected
+                assert sf.restful.call_count == 4
+
+    @responses.activate
+    def test_installed_packages__composite_batches(self):
+        version_ids = [f"04t{n:015d}" for n in range(30)]
+        responses.add(
+            "GET",
+            "https://example.com/services/data/v48.0/tooling/query/",
+            json={
+                "size": 30,
+                "totalSize": 30,
+                "done": True,
+                "records": [
+                    {
+                        "SubscriberPackage": {
+                            "Id": f"033{n:015d}",
+                            "NamespacePrefix": f"ns{n}",
+                        },
+                        "SubscriberPackageVersionId": version_id,
+                    }
+                    for n, version_id in enumerate(version_ids)
+                ],
+            },
+        )
+
+        def composite_callback(request):
+            subrequests = json.loads(request.body)["compositeRequest"]
+            return (
+                200,
+                {},
+                json.dumps(
+                    {
+                        "compositeResponse": [
+                            {
+                                "body": {
+                                    "size": 1,
+                                    "totalSize": 1,
+                                    "done": True,
+                                    "records": [
+                                        {
+                                            "Id": re.search(
+                                                r"Id='(\w+)'",
+                                                parse_qs(urlparse(sub["url"]).query)[
+                                                    "q"
+                                                ][0],
+                                            ).group(1),
+                                            "MajorVersion": 1,
+                                            "MinorVersion": 0,
+                                            "PatchVersion": 0,
+                                            "BuildNumber": 1,
+                                            "IsBeta": False,
+                                        }
+                                    ],
+                                },
+                                "httpStatusCode": 200,
+                                "referenceId": sub["referenceId"],
+                            }
+                            for sub in subrequests
+                        ]
+                    }
+                ),
+            )
+
+        responses.add_callback(
+            "POST",
+            "https://example.com/services/data/v48.0/tooling/composite",
+            callback=composite_callback,
+        )
+        config = OrgConfig({}, "test")
+        sf = Salesforce(
+            instance_url="https://example.com", session_id="abc123", version="48.0"
+        )
+        with mock.patch("cumulusci.core.config.OrgConfig.salesforce_client", sf):
+            installed_packages = config.installed_packages
+
+        assert [installed_packages[f"ns{n}"][0].id for n in range(30)] == version_ids
+        # One query, then composite requests of 25 and 5 version lookups
+        assert len(responses.calls) == 3
+        assert [
+            len(json.loads(call.request.body)["compositeRequest"])
+            for call in responses.calls[1:]
+        ] == [25, 5]
+
+    @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
+    def test_installed_packages__composite_error(self, sf):
+        config = OrgConfig({}, "test")
+        sf.restful.side_effect = [
+            self.MOCK_TOOLING_PACKAGE_RESULTS[0],
+            {
+                "compositeResponse": [
+                    {
+                        "body": [{"errorCode": "INVALID_TYPE", "message": "nope"}],
+                        "httpStatusCode": 400,
+                        "referenceId": "spv0",
+                    }
+                ]
+            },
+        ]
+
+        with pytest.raises(CumulusCIException):
+            config.installed_packages
+
     @mock.patch("cumulusci.core.config.OrgConfig.salesforce_client")
     def test_has_minimum_package_version(self, sf):
         config = OrgConfig({}, "test")
@@ -78,6 +78,34 @@ class TestUniversalConfig(unittest.TestCase):
         expected_config["tasks"]["newtesttask"]["description"] = "test description"
         self.assertEqual(config.config, expected_config)
 
+    def test_load_universal_config__cached(self, mock_class):
+        self._create_universal_config_local("tasks: {}")
+        mock_class.return_value = self.tempdir_home
+        UniversalConfig.config = None
+        expected_config = UniversalConfig().config
+
+        # A second load is served from the compiled config cache
+        UniversalConfig.config = None
+        with mock.patch(
+            "cumulusci.core.config.universal_config.safe_load",
+            side_effect=AssertionError("should not be parsed"),
+        ):
+            config = UniversalConfig()
+        self.assertEqual(config.config, expected_config)
+
+        # Changing a source file invalidates it
+        local_yaml = "tasks:\n    newtesttask:\n        description: test description"
+        self._write_file(
+            os.path.join(
+                self.tempdir_home, ".cumulusci", UniversalConfig.config_filename
+            ),
+            local_yaml,
+        )
+        UniversalConfig.config = None
+        config = UniversalConfig()
+        self.assertIn("newtesttask", config.config["tasks"])
+        UniversalConfig.config = None
+
 
 @mock.patch("pathlib.Path.home")
 class TestBaseProjectConfig(unittest.TestCase):
@@ -241,6 +269,39 @@ class TestBaseProjectConfig(unittest.TestCase):
             self.assertNotEqual(config.config_project_local, {})
             self.assertEqual(config.project__package__api_version, 45.0)
 
+    def test_load_project_config__cached(self, mock_class):
+        mock_class.return_value = self.tempdir_home
+        os.mkdir(os.path.join(self.tempdir_project, ".git"))
+        self._create_git_config()
+        self._create_project_config()
+
+        with cd(self.tempdir_project):
+            universal_config = UniversalConfig()
+            expected_config = BaseProjectConfig(universal_config).config
+
+            # A second load is served from the compiled config cache
+            with mock.patch(
+                "cumulusci.core.config.project_config.cci_safe_load",
+                side_effect=AssertionError("should not be parsed"),
+            ):
+                config = BaseProjectConfig(universal_config)
+            self.assertEqual(config.config, expected_config)
+            self.assertEqual(config.config_project["project"]["name"], "TestRepo")
+
+            # Adding a local project config invalidates it
+            content = "project:\n" + "    package:\n" + "        api_version: 45.0\n"
+            self._write_file(
+                os.path.join(config.project_local_dir, config.config_filename),
+                content,
+            )
+            config = BaseProjectConfig(universal_config)
+            self.assertEqual(config.project__package__api_version, 45.0)
+
+            # So does passing different additional yaml
+            content = "project:\n" + "    package:\n" + "        api_version: 46.0\n"
+            config = BaseProjectConfig(universal_config, additional_yaml=content)
+            self.assertEqual(config.project__package__api_version, 46.0)
+
     def test_load_additional_yaml(self, mock_class):
         mock_class.return_value = self.tempdir_home
         os.mkdir(os.path.join(self.tempdir_project, ".git"))
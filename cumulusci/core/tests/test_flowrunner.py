@@ -1,19 +1,27 @@
 from unittest import mock
 import unittest
+import json
 import logging
+import os
 
 import cumulusci
 from cumulusci.core.exceptions import FlowConfigError
 from cumulusci.core.exceptions import FlowInfiniteLoopError
 from cumulusci.core.exceptions import TaskNotFoundError
+from cumulusci.core import flowrunner
 from cumulusci.core.config import FlowConfig
 from cumulusci.core.flowrunner import FlowCoordinator
+from cumulusci.core.flowrunner import MetricsFlowCallback
 from cumulusci.core.flowrunner import PreflightFlowCoordinator
 from cumulusci.core.flowrunner import StepSpec
+from cumulusci.core.tasks import BaseSalesforceTask
 from cumulusci.core.tasks import BaseTask
 from cumulusci.core.config import OrgConfig
 from cumulusci.core.tests.utils import MockLoggingHandler
+from cumulusci.salesforce_api.metadata import get_mdapi_session
+from cumulusci.salesforce_api.utils import get_org_connection
 from cumulusci.tests.util import create_project_config
+from cumulusci.utils import temporary_dir
 
 ORG_ID = "00D000000000001"
 
@@ -40,6 +48,31 @@ class _TaskRaisesException(BaseTask):
         raise self.options["exception"](self.options["message"])
 
 
+class _TaskReturnsPid(BaseTask):
+    task_options = {"name": {"description": "A name to return"}}
+
+    def _run_task(self):
+        self.return_values = {"pid": os.getpid(), "name": self.options.get("name")}
+
+
+class _TaskChecksConnections(BaseSalesforceTask):
+    def _run_task(self):
+        flow_sessions = self.options["flow_sessions"]
+        self.return_values = {
+            "fresh_sessions": get_mdapi_session(self.org_config) is not flow_sessions[0]
+            and get_org_connection(self.org_config, "48.0").session
+            is not flow_sessions[1],
+            "refreshes": self.org_config.refresh_oauth_token.call_count,
+        }
+
+
+class _TaskSetsOrgConfig(BaseTask):
+    task_options = {"key": {"description": "The org config key to set"}}
+
+    def _run_task(self):
+        self.org_config.config[self.options["key"]] = os.getpid()
+
+
 class _SfdcTask(BaseTask):
     salesforce_task = True
 
@@ -112,6 +145,18 @@ class SimpleTestFlowCoordinator(AbstractFlowCoordinatorTest, unittest.TestCase):
                 "description": "An sfdc task",
                 "class_path": "cumulusci.core.tests.test_flowrunner._SfdcTask",
             },
+            "pid": {
+                "description": "Returns the process id",
+                "class_path": "cumulusci.core.tests.test_flowrunner._TaskReturnsPid",
+            },
+            "check_connections": {
+                "description": "Checks the connections to the org",
+                "class_path": "cumulusci.core.tests.test_flowrunner._TaskChecksConnections",
+            },
+            "set_org_config": {
+                "description": "Sets a value in the org config",
+                "class_path": "cumulusci.core.tests.test_flowrunner._TaskSetsOrgConfig",
+            },
         }
         self.project_config.config["flows"] = {
             "nested_flow": {
@@ -524,6 +569,260 @@ class SimpleTestFlowCoordinator(AbstractFlowCoordinatorTest, unittest.TestCase):
 
         save.assert_called_once()
 
+    def test_init__parallel(self):
+        self.project_config.config["flows"]["test"] = {
+            "steps": {
+                1: {"task": "pass_name"},
+                2: {"parallel": {1: {"task": "pid"}, 2: {"flow": "nested_flow_2"}}},
+            }
+        }
+        flow_config = self.project_config.get_flow("test")
+        flow = FlowCoordinator(self.project_config, flow_config)
+
+        assert [(str(step.step_num), step.parallel) for step in flow.steps] == [
+            ("1", ()),
+            ("2/1", ("2",)),
+            ("2/2/1", ("2",)),
+            ("2/2/2/1", ("2",)),
+        ]
+        assert flow.get_flow_steps(for_docs=True) == [
+            "1) task: pass_name",
+            "2) parallel:",
+            "    1) task: pid",
+            "    2) flow: nested_flow_2",
+            "        1) task: pass_name",
+            "        2) flow: nested_flow",
+            "            1) task: pass_name",
+        ]
+
+    def test_init__parallel_ambiguous_step(self):
+        flow_config = FlowConfig(
+            {"steps": {1: {"task": "pass_name", "parallel": {1: {"task": "pid"}}}}}
+        )
+        with self.assertRaises(FlowConfigError):
+            FlowCoordinator(self.project_config, flow_config)
+
+    def test_run__parallel(self):
+        self.project_config.config["flows"]["test"] = {
+            "steps": {
+                1: {"task": "pass_name"},
+                2: {
+                    "parallel": {
+                        1: {"task": "pid", "options": {"name": "^^pass_name.name"}},
+                        2: {"flow": "nested_flow_2"},
+                        3: {"task": "pid", "when": "False"},
+                    }
+                },
+                3: {"task": "name_response", "options": {"response": "^^pid.pid"}},
+            }
+        }
+        flow_config = self.project_config.get_flow("test")
+        callbacks = mock.Mock()
+        flow = FlowCoordinator(self.project_config, flow_config, callbacks=callbacks)
+        flow.run(self.org_config)
+
+        assert [str(result.step_num) for result in flow.results] == [
+            "1",
+            "2/1",
+            "2/2/1",
+            "2/2/2/1",
+            "3",
+        ]
+        assert [call[0][0] for call in callbacks.pre_task.call_args_list] == [
+            step for step in flow.steps if str(step.step_num) != "2/3"
+        ]
+        assert callbacks.post_task.call_count == 5
+        pid_result = flow.results[1]
+        assert pid_result.return_values["name"] == "supername"
+        assert pid_result.return_values["pid"] != os.getpid()
+        assert flow.results[-1].result == pid_result.return_values["pid"]
+
+    def test_run__parallel_failure(self):
+        flow_config = FlowConfig(
+            {
+                "steps": {
+                    1: {
+                        "parallel": {
+                            1: {"task": "pass_name"},
+                            2: {"task": "raise_exception"},
+                            3: {"task": "raise_exception", "ignore_failure": True},
+                        }
+                    },
+                    2: {"task": "pass_name"},
+                }
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        with self.assertRaises(Exception) as e:
+            flow.run(self.org_config)
+
+        assert str(e.exception) == "Test raised exception as expected"
+        assert [str(result.step_num) for result in flow.results] == [
+            "1/1",
+            "1/2",
+            "1/3",
+        ]
+
+    def test_run__parallel_ignore_failure(self):
+        flow_config = FlowConfig(
+            {
+                "steps": {
+                    1: {
+                        "parallel": {
+                            1: {"task": "raise_exception", "ignore_failure": True},
+                            2: {"task": "pass_name"},
+                        }
+                    },
+                    2: {"task": "pass_name"},
+                }
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        flow.run(self.org_config)
+
+        assert len(flow.results) == 3
+        assert flow.results[0].exception is not None
+
+    def test_run__parallel_error(self):
+        flow_config = FlowConfig(
+            {
+                "steps": {
+                    1: {
+                        "parallel": {
+                            1: {"task": "pass_name"},
+                            2: {
+                                "task": "name_response",
+                                "options": {"response": "^^bogus.name"},
+                            },
+                        }
+                    }
+                }
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        with self.assertRaises(NameError):
+            flow.run(self.org_config)
+
+    def test_run__parallel_org(self):
+        self.org_config.config.update(
+            {"instance_url": "https://example.com", "access_token": "TOKEN"}
+        )
+        flow_sessions = (
+            get_mdapi_session(self.org_config),
+            get_org_connection(self.org_config, "48.0").session,
+        )
+        step = {
+            "task": "check_connections",
+            "options": {"flow_sessions": flow_sessions},
+        }
+        flow_config = FlowConfig({"steps": {1: {"parallel": {1: step, 2: step}}}})
+        flow = FlowCoordinator(self.project_config, flow_config)
+        self.org_config._installed_packages = {}
+        flow.run(self.org_config)
+
+        # Credentials are refreshed when the flow starts and before the
+        # group, but not by the workers
+        assert self.org_config.refresh_oauth_token.call_count == 2
+        for result in flow.results:
+            assert result.return_values == {"fresh_sessions": True, "refreshes": 2}
+        # The workers may have installed packages
+        assert self.org_config._installed_packages is None
+
+    def test_run__parallel_org_config_changes(self):
+        self.org_config.save = mock.Mock()
+        flow_config = FlowConfig(
+            {
+                "steps": {
+                    1: {
+                        "parallel": {
+                            1: {"task": "set_org_config", "options": {"key": "a"}},
+                            2: {"task": "set_org_config", "options": {"key": "b"}},
+                        }
+                    }
+                }
+            }
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        flow.run(self.org_config)
+
+        # Changes the workers made are copied back and saved
+        assert self.org_config.a not in (None, os.getpid())
+        assert self.org_config.b not in (None, os.getpid(), self.org_config.a)
+        self.org_config.save.assert_called_once()
+
+    @mock.patch("threading.active_count", return_value=1)
+    @mock.patch("multiprocessing.get_all_start_methods", return_value=["fork"])
+    def test_can_fork(self, get_all_start_methods, active_count):
+        with mock.patch("sys.platform", "linux"):
+            assert flowrunner._can_fork()
+        with mock.patch("sys.platform", "darwin"):
+            assert not flowrunner._can_fork()
+        active_count.return_value = 2
+        assert not flowrunner._can_fork()
+
+    @mock.patch("cumulusci.core.flowrunner._can_fork", return_value=False)
+    def test_run__parallel_without_fork(self, _can_fork):
+        flow_config = FlowConfig(
+            {"steps": {1: {"parallel": {1: {"task": "pid"}, 2: {"task": "pid"}}}}}
+        )
+        flow = FlowCoordinator(self.project_config, flow_config)
+        flow.run(self.org_config)
+
+        assert [result.return_values["pid"] for result in flow.results] == [
+            os.getpid(),
+            os.getpid(),
+        ]
+
+    def test_run__metrics(self):
+        flow_config = FlowConfig(
+            {
+                "steps": {
+                    1: {"task": "pass_name"},
+                    2: {"parallel": {1: {"task": "pid"}, 2: {"task": "pid"}}},
+                }
+            }
+        )
+        with temporary_dir() as d:
+            flow = FlowCoordinator(
+                self.project_config,
+                flow_config,
+                name="test",
+                callbacks=MetricsFlowCallback(os.path.join(d, "metrics.json")),
+            )
+            flow.run(self.org_config)
+            with open(os.path.join(d, "metrics.json")) as f:
+                report = json.load(f)
+
+        assert report["flow"] == "test"
+        assert [step["step_num"] for step in report["steps"]] == ["1", "2/1", "2/2"]
+        assert flow.results[1].metrics.pid == flow.results[1].return_values["pid"]
+        assert flow.results[2].metrics.wall_time > 0
+
+    def test_run__metrics_chrome(self):
+        flow_config = FlowConfig({"steps": {1: {"task": "pass_name"}}})
+        with temporary_dir():
+            flow = FlowCoordinator(
+                self.project_config,
+                flow_config,
+                callbacks=MetricsFlowCallback("trace.json", format="chrome"),
+            )
+            flow.run(self.org_config)
+            with open("trace.json") as f:
+                trace = json.load(f)
+
+        assert trace["traceEvents"][0]["name"] == "1 pass_name"
+
+    def test_run__no_metrics(self):
+        flow_config = FlowConfig({"steps": {1: {"task": "pass_name"}}})
+        flow = FlowCoordinator(self.project_config, flow_config)
+        flow.run(self.org_config)
+
+        assert flow.results[0].metrics is None
+
+    def test_metrics_callback__unknown_format(self):
+        with self.assertRaises(ValueError):
+            MetricsFlowCallback("metrics.txt", format="csv")
+
 
 class StepSpecTest(unittest.TestCase):
     def test_repr(self):
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import responses
+
+from cumulusci.core.flowrunner import StepResult
+from cumulusci.core.instrumentation import chrome_trace
+from cumulusci.core.instrumentation import metrics_report
+from cumulusci.core.instrumentation import record_step_metrics
+
+URL = "https://test.salesforce.com/services/data/v48.0/query/"
+
+
+class TestRecordStepMetrics:
+    @responses.activate
+    def test_http(self):
+        responses.add(
+            "GET",
+            URL,
+            body="0123456789",
+            headers={"Sforce-Limit-Info": "api-usage=5/100"},
+        )
+        responses.add(
+            "POST",
+            URL,
+            json={},
+            headers={"Sforce-Limit-Info": "per-app-api-usage=1/5, api-usage=9/100"},
+        )
+        responses.add("GET", "https://api.github.com/repos", json=[])
+
+        with record_step_metrics() as metrics:
+            requests.get(URL)
+            requests.post(URL, data="abc")
+            requests.get("https://api.github.com/repos")
+        requests.get(URL)
+
+        assert metrics.http == {
+            "test.salesforce.com": {
+                "requests": 2,
+                "bytes_sent": 3,
+                "bytes_received": 12,
+            },
+            "api.github.com": {"requests": 1, "bytes_sent": 0, "bytes_received": 2},
+        }
+        assert metrics.api_calls == 5
+        assert metrics.api_limit == 100
+        assert metrics.as_dict()["http_requests"] == 3
+
+    def test_sleep(self):
+        with record_step_metrics() as metrics:
+            time.sleep(2)
+            time.sleep(0.5)
+        time.sleep(1)
+
+        assert metrics.wait_time == 2.5
+        assert metrics.wall_time > 0
+        assert metrics.api_calls == 0
+
+    @responses.activate
+    def test_worker_threads(self):
+        responses.add("GET", URL, json={})
+
+        with record_step_metrics() as metrics:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(requests.get, [URL, URL, URL]))
+            thread = threading.Thread(target=time.sleep, args=(1,))
+            thread.start()
+            thread.join()
+
+        assert metrics.http["test.salesforce.com"]["requests"] == 3
+        assert metrics.wait_time == 1
+
+    def test_hooks_removed(self):
+        send = requests.Session.send
+        sleep = time.sleep
+        with record_step_metrics():
+            with record_step_metrics():
+                assert time.sleep is not sleep
+            assert time.sleep is not sleep
+        assert requests.Session.send is send
+        assert time.sleep is sleep
+
+
+class TestReports:
+    def _results(self):
+        with record_step_metrics() as metrics:
+            time.sleep(1)
+        return [
+            StepResult("1", "deploy", "deploy", None, {}, None, metrics),
+            StepResult("2", "run_tests", "run_tests", None, {}, Exception(), metrics),
+            StepResult("3", "unrecorded", "unrecorded", None, {}, None),
+        ]
+
+    def test_metrics_report(self):
+        report = metrics_report(self._results(), name="ci_feature")
+
+        assert report["flow"] == "ci_feature"
+        assert [step["path"] for step in report["steps"]] == ["deploy", "run_tests"]
+        assert report["steps"][0]["status"] == "success"
+        assert report["steps"][0]["wait_time"] == 1
+        assert report["steps"][1]["status"] == "failure"
+
+    def test_chrome_trace(self):
+        results = self._results()
+        trace = chrome_trace(results, name="ci_feature")
+
+        events = trace["traceEvents"]
+        assert [event["name"] for event in events] == ["1 deploy", "2 run_tests"]
+        assert events[0]["ph"] == "X"
+        assert events[0]["ts"] == int(results[0].metrics.start * 1000000)
+        assert events[0]["args"]["wait_time"] == 1
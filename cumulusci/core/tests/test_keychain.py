@@ -1,3 +1,4 @@
+import datetime
 import json
 import os
 import tempfile
@@ -576,3 +577,108 @@ class TestEncryptedFileProjectKeychain(ProjectKeychainTestMixin):
     def test_get_default_org__outside_project(self):
         keychain = self.keychain_class(self.universal_config, self.key)
         assert keychain.get_default_org() == (None, None)
+
+    def test_get_org__cached(self):
+        keychain = self.keychain_class(self.project_config, self.key)
+        keychain.set_org(self.org_config)
+        with mock.patch.object(
+            keychain, "_decrypt_config", wraps=keychain._decrypt_config
+        ) as decrypt:
+            org_config = keychain.get_org("test")
+            assert keychain.get_org("test") is org_config
+            assert decrypt.call_count == 1
+
+            org_config.config["foo"] = "baz"
+            org_config.save()
+            assert keychain.get_org("test").config["foo"] == "baz"
+            assert decrypt.call_count == 2
+
+    def test_get_org_summary(self):
+        keychain = self.keychain_class(self.project_config, self.key)
+        date_created = datetime.datetime(2020, 7, 1, 12, 30)
+        keychain.set_org(
+            ScratchOrgConfig(
+                {
+                    "scratch": True,
+                    "config_name": "dev",
+                    "days": 7,
+                    "date_created": date_created,
+                    "instance_url": "https://test.my.salesforce.com",
+                    "access_token": "TOKEN",
+                },
+                "dev",
+            )
+        )
+        keychain.set_org(
+            OrgConfig(
+                {
+                    "userinfo": {"preferred_username": "test@example.com"},
+                    "expires": "Persistent",
+                    "refresh_token": "TOKEN",
+                },
+                "prod",
+                global_org=True,
+            ),
+            global_org=True,
+        )
+
+        new_keychain = self.keychain_class(self.project_config, self.key)
+        with mock.patch.object(new_keychain, "_decrypt_config") as decrypt:
+            dev = new_keychain.get_org_summary("dev")
+            prod = new_keychain.get_org_summary("prod")
+        decrypt.assert_not_called()
+
+        assert isinstance(dev, ScratchOrgConfig)
+        assert dev.date_created == date_created
+        assert dev.config_name == "dev"
+        assert dev.get_domain() == "test.my.salesforce.com"
+        assert "access_token" not in dev.config
+        assert prod.global_org
+        assert prod.username == "test@example.com"
+        assert prod.expires == "Persistent"
+        assert "refresh_token" not in prod.config
+
+    def test_get_org_summary__stale_index(self):
+        keychain = self.keychain_class(self.project_config, self.key)
+        keychain.set_org(self.org_config)
+        index_path = Path(self.tempdir_home, ".cumulusci", "TestProject")
+        index_path = index_path / "orgs.index.json"
+        index_path.unlink()
+
+        # An org that isn't in the index is decrypted and added to it
+        new_keychain = self.keychain_class(self.project_config, self.key)
+        assert new_keychain.get_org_summary("test").config["foo"] == "bar"
+        assert "test" in json.loads(index_path.read_text())
+
+        # An org that was changed by something else is decrypted again
+        other_keychain = self.keychain_class(self.project_config, self.key)
+        org_config = other_keychain.get_org("test")
+        org_config.config["default"] = True
+        other_keychain._set_encrypted_org(
+            "test", other_keychain._encrypt_config(org_config), False
+        )
+        new_keychain = self.keychain_class(self.project_config, self.key)
+        assert new_keychain.get_org_summary("test").default
+
+    def test_get_org_summary__not_found(self):
+        keychain = self.keychain_class(self.project_config, self.key)
+        with self.assertRaises(OrgNotFound):
+            keychain.get_org_summary("test")
+
+    @mock.patch("cumulusci.core.utils.cleanup_org_cache_dirs")
+    def test_remove_org__removes_from_index(self, cleanup_org_cache_dirs):
+        keychain = self.keychain_class(self.project_config, self.key)
+        keychain.set_org(self.org_config)
+        keychain.remove_org("test")
+        index_path = Path(self.tempdir_home, ".cumulusci", "TestProject")
+        assert json.loads((index_path / "orgs.index.json").read_text()) == {}
+
+    @mock.patch("sarge.Command")
+    def test_get_default_org_name(self, Command):
+        keychain = self.keychain_class(self.project_config, self.key)
+        keychain.set_org(self.org_config)
+        assert keychain.get_default_org_name() is None
+        keychain.set_default_org("test")
+        with mock.patch.object(keychain, "_decrypt_config") as decrypt:
+            assert keychain.get_default_org_name() == "test"
+        decrypt.assert_not_called()
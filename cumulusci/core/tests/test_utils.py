@@ -130,7 +130,7 @@ class TestCleanupCacheDir:
         keychain.list_orgs.return_value = ["qa", "dev"]
         org = mock.Mock()
         org.config.get.return_value = "http://foo.my.salesforce.com/"
-        keychain.get_org.return_value = org
+        keychain.get_org_summary.return_value = org
         project_config = mock.Mock()
         with TemporaryDirectory() as temp_for_global:
             keychain.global_config_dir = Path(temp_for_global)
@@ -154,7 +154,7 @@ class TestCleanupCacheDir:
             keychain=keychain,
             global_org=False,
         )
-        keychain.get_org.return_value = org
+        keychain.get_org_summary.return_value = org
         project_config = mock.Mock()
         with TemporaryDirectory() as temp_for_global:
             keychain.global_config_dir = Path(temp_for_global)
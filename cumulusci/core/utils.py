@@ -7,6 +7,7 @@ decode_to_unicode: get unicode string from sf api """
 from datetime import datetime
 import copy
 import glob
+from pathlib import Path
 import pytz
 import time
 from shutil import rmtree
@@ -29,6 +30,19 @@ def import_global(path):
 import_class = import_global
 
 
+def default_cumulusci_dir():
+    """Get the root directory for storing persistent data (~/.cumulusci)
+
+    Creates it if it doesn't exist yet.
+    """
+    config_dir = Path.home() / ".cumulusci"
+
+    if not config_dir.exists():
+        config_dir.mkdir(parents=True)
+
+    return config_dir
+
+
 def parse_datetime(dt_str, format):
     """Create a timezone-aware datetime object from a datetime string."""
     t = time.strptime(dt_str, format)
@@ -206,8 +220,7 @@ def cleanup_org_cache_dirs(keychain, project_config):
         return
     domains = set()
     for org in keychain.list_orgs():
-        org_config = keychain.get_org(org)
-        domain = org_config.get_domain()
+        domain = keychain.get_org_summary(org).get_domain()
         if domain:
             domains.add(domain)
 
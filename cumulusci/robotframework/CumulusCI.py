@@ -192,10 +192,9 @@ class CumulusCI(object):
         return self._run_task(task_class, task_config)
 
     def _init_api(self, base_url=None):
-        client = get_simple_salesforce_connection(self.project_config, self.org)
-        if base_url is not None:
-            client.base_url += base_url
-        return client
+        return get_simple_salesforce_connection(
+            self.project_config, self.org, base_url=base_url
+        )
 
     def _init_task(self, class_path, options, task_config):
         task_class = import_global(class_path)
@@ -0,0 +1,144 @@
+import json
+import threading
+import time
+from email.utils import formatdate
+
+from simple_salesforce.exceptions import SalesforceGeneralError
+
+# Describes fetched or revalidated by this process less than this many seconds
+# ago are used without asking Salesforce whether they have changed.
+DEFAULT_DESCRIBE_TTL = 300
+GLOBAL_DESCRIBE = "_global"
+
+
+class DescribeCache:
+    """Cache of sObject describe results for a single org.
+
+    Entries are keyed by API version and sObject name (or the global describe)
+    and kept both in memory and, when the org has a keychain, on disk under the
+    org's orginfo cache dir so that they can be shared across tasks and runs.
+
+    The TTL only applies to entries this process has fetched or revalidated
+    itself. Entries older than the TTL, and all entries read from disk (which
+    another process or tool may have made stale), are revalidated with an
+    If-Modified-Since request, so an unchanged schema costs a 304 response
+    instead of a full describe. Tasks that change the org's schema should call
+    reset()."""
+
+    cache_name = "describe"
+
+    def __init__(self, org_config, ttl=DEFAULT_DESCRIBE_TTL):
+        self.org_config = org_config
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    def describe(self, sf, sobject=None):
+        """Return the describe for sobject (or the global describe if sobject
+        is None), using the API version of the simple_salesforce client sf."""
+        key = (str(sf.sf_version), sobject or GLOBAL_DESCRIBE)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry["fetched"] < self.ttl:
+                return entry["describe"]
+            if entry is None:
+                entry = self._read_entry(key)
+
+        fetched = time.time()
+        result = self._fetch(sf, sobject, entry)
+        entry = {
+            "fetched": fetched,
+            "describe": entry["describe"] if result is None else result,
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._write_entry(key, entry)
+        return entry["describe"]
+
+    def reload(self):
+        """Forget the entries held in memory, so they're read from disk (and
+        revalidated) again."""
+        with self._lock:
+            self._entries = {}
+
+    def reset(self, sobjects=None):
+        """Discard cached describes for the given sObjects, or all of them
+        (including the global describe) if sobjects is None."""
+        with self._lock:
+            if sobjects is None:
+                self._entries = {}
+            else:
+                names = set(sobjects) | {GLOBAL_DESCRIBE}
+                self._entries = {
+                    key: entry
+                    for key, entry in self._entries.items()
+                    if key[1] not in names
+                }
+            with self._cache_dir() as cache_dir:
+                if cache_dir is None or not cache_dir.exists():
+                    return
+                if sobjects is None:
+                    cache_dir.removetree()
+                    return
+                for filename in cache_dir.fs.listdir(cache_dir.filename):
+                    if filename.split("_", 1)[-1][: -len(".json")] in names:
+                        (cache_dir / filename).unlink()
+
+    def _fetch(self, sf, sobject, entry):
+        """Fetch a describe from Salesforce. Returns None if Salesforce reports
+        that the cached entry has not been modified."""
+        headers = {}
+        if entry:
+            headers["If-Modified-Since"] = formatdate(entry["fetched"], usegmt=True)
+
+        try:
+            if sobject:
+                return getattr(sf, sobject).describe(headers=headers or None)
+            elif headers:
+                return sf.describe(headers=headers)
+            else:
+                return sf.describe()
+        except SalesforceGeneralError as e:
+            if entry and e.status == 304:
+                return None
+            raise
+
+    def _cache_dir(self):
+        if self.org_config.keychain is None:
+            return _NoCacheDir()
+        return self.org_config.get_orginfo_cache_dir(self.cache_name)
+
+    def _read_entry(self, key):
+        with self._cache_dir() as cache_dir:
+            if cache_dir is None:
+                return None
+            path = cache_dir / _entry_filename(key)
+            if not path.exists():
+                return None
+            try:
+                with path.open("r") as f:
+                    return json.load(f)
+            except ValueError:
+                return None
+
+    def _write_entry(self, key, entry):
+        with self._cache_dir() as cache_dir:
+            if cache_dir is None:
+                return
+            with (cache_dir / _entry_filename(key)).open("w") as f:
+                json.dump(entry, f)
+
+
+def _entry_filename(key):
+    version, name = key
+    return f"{version}_{name}.json"
+
+
+class _NoCacheDir:
+    """Stand-in for the orginfo cache dir of orgs without a keychain."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        pass
@@ -10,7 +10,9 @@ based on mrbelvedere/mpinstaller/mdapi.py
 import base64
 import http.client
 import re
+import threading
 import time
+import weakref
 from collections import defaultdict
 from xml.dom.minidom import parseString
 from xml.sax.saxutils import escape
@@ -39,6 +41,34 @@ else:
 
 retry_policy = Retry(backoff_factor=0.3)
 
+_mdapi_sessions = weakref.WeakKeyDictionary()
+_mdapi_sessions_lock = threading.Lock()
+
+
+def get_mdapi_session(org_config):
+    """Return the requests Session shared by all Metadata API calls to an org.
+
+    The session lives as long as the org config (e.g. for the whole flow),
+    so its pooled keep-alive connections are reused across calls and status
+    polls instead of opening a new TLS connection for every request."""
+    with _mdapi_sessions_lock:
+        session = _mdapi_sessions.get(org_config)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=retry_policy))
+            _mdapi_sessions[org_config] = session
+        return session
+
+
+def reset_mdapi_sessions():
+    """Forget the shared Metadata API sessions.
+
+    A process forked from one that used them must call this before making
+    any calls, so that it doesn't send requests over the parent's sockets."""
+    global _mdapi_sessions, _mdapi_sessions_lock
+    _mdapi_sessions = weakref.WeakKeyDictionary()
+    _mdapi_sessions_lock = threading.Lock()
+
 
 class BaseMetadataApiCall(object):
     check_interval = 1
@@ -116,9 +146,7 @@ class BaseMetadataApiCall(object):
         # Insert the session id
         session_id = self.task.org_config.access_token
         auth_envelope = envelope.replace("###SESSION_ID###", session_id)
-        session = requests.Session()
-        http_adapter = HTTPAdapter(max_retries=retry_policy)
-        session.mount("https://", http_adapter)
+        session = get_mdapi_session(self.task.org_config)
         response = session.post(
             self._build_endpoint_url(),
             headers=headers,
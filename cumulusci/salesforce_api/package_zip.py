@@ -1,22 +1,25 @@
 from base64 import b64encode
 from xml.sax.saxutils import escape
 import contextlib
+import hashlib
 import html
 import functools
 import io
+import json
 import logging
 import os
 import pathlib
 import zipfile
 
+from cumulusci import __version__
 from cumulusci.core.sfdx import sfdx
 from cumulusci.utils import cd
 from cumulusci.utils import inject_namespace
-from cumulusci.utils import process_text_in_zipfile
+from cumulusci.utils import remove_xml_element_string
 from cumulusci.utils import strip_namespace
 from cumulusci.utils import temporary_dir
 from cumulusci.utils import tokenize_namespace
-from cumulusci.utils import zip_clean_metaxml
+from cumulusci.utils import META_XML_CLEAN_DIRS
 from cumulusci.utils.xml import metadata_tree
 from cumulusci.utils.ziputils import hash_zipfile_contents
 
@@ -176,26 +179,58 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
         # otherwise we hit a bug in Windows where ZipInfo objects have the wrong path separators.
         fp = self.zf.fp
         self.zf.close()
-        self.zf = zipfile.ZipFile(fp, "r")
+        zf_src = zipfile.ZipFile(fp, "r")
 
-        self._process_namespace_tokens()
-        self._clean_meta_xml()
-        self._bundle_staticresources()
-        self._remove_feature_parameters()
+        # Each file is read once, passed through all of the transforms,
+        # and written once to the new zip.
+        text_transforms = self._get_namespace_transforms()
+        clean_meta_xml = self._should_clean_meta_xml()
+        static_resources_path = self._get_static_resources_path()
+        remove_feature_parameters = self.options.get("package_type") == "Unlocked"
 
-    def _process_namespace_tokens(self):
-        zipf = self.zf
+        self._open_zip()
+        package_xml = None
+        for name in zf_src.namelist():
+            content = zf_src.read(name)
+            if text_transforms:
+                name, content = self._transform_text(name, content, text_transforms)
+            if clean_meta_xml:
+                content = self._clean_meta_xml(name, content)
+            if remove_feature_parameters and name.startswith("featureParameters/"):
+                # Remove feature parameters from unlocked packages only
+                self.logger.info(f"Skipping {name} in unlocked package")
+                continue
+            if name == "package.xml" and (
+                static_resources_path or remove_feature_parameters
+            ):
+                # package.xml is rewritten and added last.
+                package_xml = content
+                continue
+            self.zf.writestr(name, content)
+        zf_src.close()
+
+        if package_xml is not None or static_resources_path:
+            Package = metadata_tree.parse(io.BytesIO(package_xml))
+            if static_resources_path:
+                self._bundle_staticresources(static_resources_path, Package)
+            if remove_feature_parameters:
+                self._remove_feature_parameters(Package)
+            self.zf.writestr("package.xml", Package.tostring(xml_declaration=True))
+
+    def _get_namespace_transforms(self):
+        """Return the text transforms for the namespace options, in the order
+        in which they are applied."""
+        transforms = []
         if self.options.get("namespace_tokenize"):
             self.logger.info(
                 f"Tokenizing namespace prefix {self.options['namespace_tokenize']}__"
             )
-            zipf = process_text_in_zipfile(
-                zipf,
+            transforms.append(
                 functools.partial(
                     tokenize_namespace,
                     namespace=self.options["namespace_tokenize"],
                     logger=self.logger,
-                ),
+                )
             )
         if self.options.get("namespace_inject"):
             managed = not self.options.get("unmanaged", True)
@@ -208,52 +243,69 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
                 self.logger.info(
                     "Stripping namespace tokens from metadata for unmanaged deployment"
                 )
-            zipf = process_text_in_zipfile(
-                zipf,
+            transforms.append(
                 functools.partial(
                     inject_namespace,
                     namespace=self.options["namespace_inject"],
                     managed=managed,
                     namespaced_org=self.options.get("namespaced_org", False),
                     logger=self.logger,
-                ),
+                )
             )
         if self.options.get("namespace_strip"):
             self.logger.info("Stripping namespace tokens from metadata")
-            zipf = process_text_in_zipfile(
-                zipf,
+            transforms.append(
                 functools.partial(
                     strip_namespace,
                     namespace=self.options["namespace_strip"],
                     logger=self.logger,
-                ),
+                )
             )
-        self.zf = zipf
-
-    def _clean_meta_xml(self):
+        return transforms
+
+    def _transform_text(self, name, content, transforms):
+        """Apply text transforms to a file. Files with content that cannot
+        be decoded as UTF-8 are left unchanged."""
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            # Probably a binary file; don't change it
+            return name, content
+        for transform in transforms:
+            name, text = transform(name, text)
+        return name, text.encode("utf-8")
+
+    def _should_clean_meta_xml(self):
         if not self.options.get("clean_meta_xml", True):
-            return
+            return False
         self.logger.info(
             "Cleaning meta.xml files of packageVersion elements for deploy"
         )
-        zf = zip_clean_metaxml(self.zf)
-        self.zf.close()
-        self.zf = zf
+        return True
+
+    def _clean_meta_xml(self, name, content):
+        """Strip packageVersions elements from a meta.xml file."""
+        if name.startswith(META_XML_CLEAN_DIRS) and name.endswith("-meta.xml"):
+            try:
+                content.decode("utf-8")
+            except UnicodeDecodeError:
+                # if we cannot decode the content, it may be binary;
+                # don't try and replace it.
+                pass
+            else:
+                content = remove_xml_element_string("packageVersions", content)
+        return content
 
-    def _bundle_staticresources(self):
+    def _get_static_resources_path(self):
         relpath = self.options.get("static_resource_path")
         if not relpath or not os.path.exists(relpath):
-            return
-        path = os.path.realpath(relpath)
+            return None
+        return relpath
 
-        # Copy existing files to new zipfile
-        zip_dest = zipfile.ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED)
-        for name in self.zf.namelist():
-            if name == "package.xml":
-                package_xml = self.zf.open(name)
-            else:
-                content = self.zf.read(name)
-                zip_dest.writestr(name, content)
+    def _bundle_staticresources(self, relpath, Package):
+        """Add a static resource bundle for each directory in relpath
+        to the package, and list them in package.xml."""
+        path = os.path.realpath(relpath)
 
         # Build static resource bundles and add to package
         with temporary_dir():
@@ -272,7 +324,7 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
                 meta_name = "{}.resource-meta.xml".format(name)
                 meta_path = os.path.join(path, meta_name)
                 with open(meta_path, "rb") as f:
-                    zip_dest.writestr("staticresources/{}".format(meta_name), f.read())
+                    self.zf.writestr("staticresources/{}".format(meta_name), f.read())
 
                 # Add bundle
                 zip_path = os.path.join("staticresources", "{}.resource".format(name))
@@ -284,11 +336,10 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
                                 resource_file = os.path.join(root, f)
                                 bundle_zip.write(resource_file)
                     bundle_zip.close()
-                zip_dest.write(zip_path)
+                self.zf.write(zip_path)
                 bundles.append(name)
 
         # Update package.xml
-        Package = metadata_tree.parse(package_xml)
         sections = Package.findall("types", name="StaticResource")
         section = sections[0] if sections else None
         if not section:
@@ -296,47 +347,69 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
             section.append("name", text="StaticResource")
         for name in bundles:
             section.insert_before(section.find("name"), tag="members", text=name)
-        package_xml = Package.tostring(xml_declaration=True)
-        zip_dest.writestr("package.xml", package_xml)
-
-        self.zf.close()
-        self.zf = zip_dest
-
-    def _remove_feature_parameters(self):
-        # Remove feature parameters from unlocked packages only
-        if self.options.get("package_type") != "Unlocked":
-            return
 
-        # Copy existing files to new zipfile
-        package_xml = None
-        zip_dest = zipfile.ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED)
-        for name in self.zf.namelist():
-            if name == "package.xml":
-                package_xml = self.zf.open(name)
-            elif name.startswith("featureParameters/"):
-                # skip feature parameters
-                self.logger.info(f"Skipping {name} in unlocked package")
-                continue
-            else:
-                content = self.zf.read(name)
-                zip_dest.writestr(name, content)
-
-        # Remove from package.xml
-        if package_xml is not None:
-            Package = metadata_tree.parse(package_xml)
-            for mdtype in (
-                "FeatureParameterInteger",
-                "FeatureParameterString",
-                "FeatureParameterBoolean",
-            ):
-                section = Package.find("types", name=mdtype)
-                if section is not None:
-                    Package.remove(section)
-            package_xml = Package.tostring(xml_declaration=True)
-            zip_dest.writestr("package.xml", package_xml)
-
-        self.zf.close()
-        self.zf = zip_dest
+    def _remove_feature_parameters(self, Package):
+        """Remove feature parameter types from package.xml."""
+        for mdtype in (
+            "FeatureParameterInteger",
+            "FeatureParameterString",
+            "FeatureParameterBoolean",
+        ):
+            section = Package.find("types", name=mdtype)
+            if section is not None:
+                Package.remove(section)
+
+
+# The MetadataPackageZipBuilder options that affect the content of the zip
+PACKAGE_CONTENT_OPTIONS = (
+    "clean_meta_xml",
+    "namespace_inject",
+    "namespace_strip",
+    "namespace_tokenize",
+    "namespaced_org",
+    "package_type",
+    "static_resource_path",
+    "unmanaged",
+)
+
+
+def hash_package_source(path, options, project_files=(), settings=None):
+    """Return a fast hash of the inputs to a MetadataPackageZipBuilder.
+
+    This covers the path, size and modification time of every file in the
+    source and static resource directories, the builder options that affect
+    the zip's content and the CumulusCI version, without reading the source
+    files. The contents of project_files (such as sfdx-project.json and
+    .forceignore, which change how sfdx format source is converted) and any
+    other settings the build depends on are included too."""
+    h = hashlib.blake2b()
+    h.update(__version__.encode("utf-8"))
+    content_options = {
+        name: options[name] for name in PACKAGE_CONTENT_OPTIONS if name in options
+    }
+    h.update(
+        json.dumps(
+            [content_options, settings or {}], sort_keys=True, default=str
+        ).encode("utf-8")
+    )
+    for file_path in project_files:
+        h.update(os.path.basename(file_path).encode("utf-8"))
+        if os.path.isfile(file_path):
+            with open(file_path, "rb") as f:
+                h.update(b"\0" + f.read())
+    for source in (path, options.get("static_resource_path")):
+        if not source or not os.path.exists(source):
+            continue
+        source = os.path.realpath(source)
+        h.update(source.encode("utf-8"))
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for f in sorted(files):
+                file_path = os.path.join(root, f)
+                relpath = os.path.relpath(file_path, source)
+                stat = os.stat(file_path)
+                h.update(f"{relpath}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+    return h.hexdigest()
 
 
 class CreatePackageZipBuilder(BasePackageZipBuilder):
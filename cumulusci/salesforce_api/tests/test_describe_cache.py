@@ -0,0 +1,141 @@
+import json
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import responses
+from simple_salesforce import Salesforce
+from simple_salesforce.exceptions import SalesforceGeneralError
+
+from cumulusci.core.config import OrgConfig
+from cumulusci.salesforce_api.describe_cache import DescribeCache
+from cumulusci.tests.util import DummyKeychain
+
+BASE_URL = "https://example.com/services/data/v48.0/sobjects"
+ACCOUNT_DESCRIBE = {"name": "Account", "fields": [{"name": "Id"}]}
+
+
+@pytest.fixture
+def sf():
+    return Salesforce(
+        instance_url="https://example.com", session_id="abc123", version="48.0"
+    )
+
+
+@pytest.fixture
+def org_config():
+    return OrgConfig(
+        {"instance_url": "https://example.com", "username": "test@example.com"},
+        "test",
+    )
+
+
+@pytest.fixture
+def cached_org_config(tmp_path):
+    with mock.patch("cumulusci.tests.util.DummyKeychain.cache_dir", Path(tmp_path)):
+        yield OrgConfig(
+            {"instance_url": "https://example.com", "username": "test@example.com"},
+            "test",
+            keychain=DummyKeychain(),
+        )
+
+
+class TestDescribeCache:
+    @responses.activate
+    def test_describe__cached_in_memory(self, sf, org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+        responses.add("GET", f"{BASE_URL}", json={"sobjects": [{"name": "Account"}]})
+
+        assert org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+        assert org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+        assert org_config.describe(sf=sf) == {"sobjects": [{"name": "Account"}]}
+        assert org_config.describe(sf=sf) == {"sobjects": [{"name": "Account"}]}
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_describe__revalidates_after_ttl(self, sf, org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+        responses.add("GET", f"{BASE_URL}/Account/describe", status=304)
+        cache = DescribeCache(org_config, ttl=0)
+
+        assert cache.describe(sf, "Account") == ACCOUNT_DESCRIBE
+        assert cache.describe(sf, "Account") == ACCOUNT_DESCRIBE
+
+        assert len(responses.calls) == 2
+        assert "If-Modified-Since" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-Modified-Since"].endswith("GMT")
+
+    @responses.activate
+    def test_describe__revalidation_returns_new_describe(self, sf, org_config):
+        new_describe = {"name": "Account", "fields": [{"name": "Foo__c"}]}
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=new_describe)
+        cache = DescribeCache(org_config, ttl=0)
+
+        assert cache.describe(sf, "Account") == ACCOUNT_DESCRIBE
+        assert cache.describe(sf, "Account") == new_describe
+
+    @responses.activate
+    def test_describe__not_modified_without_entry(self, sf, org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", status=304)
+
+        with pytest.raises(SalesforceGeneralError):
+            org_config.describe("Account", sf=sf)
+
+    @responses.activate
+    def test_describe__persisted(self, sf, cached_org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+
+        assert cached_org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+
+        with cached_org_config.get_orginfo_cache_dir("describe") as cache_dir:
+            with (cache_dir / "48.0_Account.json").open("r") as f:
+                assert json.load(f)["describe"] == ACCOUNT_DESCRIBE
+
+        # A new org config for the same org reads the cached describe, but
+        # checks that it is still current
+        responses.add("GET", f"{BASE_URL}/Account/describe", status=304)
+        other_org_config = OrgConfig(
+            cached_org_config.config, "other", keychain=cached_org_config.keychain
+        )
+        assert other_org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+        assert other_org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+        assert len(responses.calls) == 2
+        assert "If-Modified-Since" in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_reset(self, sf, cached_org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+        responses.add("GET", f"{BASE_URL}/Contact/describe", json={"name": "Contact"})
+
+        cached_org_config.describe("Account", sf=sf)
+        cached_org_config.describe("Contact", sf=sf)
+        cached_org_config.reset_describe_cache(["Account"])
+        cached_org_config.describe("Account", sf=sf)
+        cached_org_config.describe("Contact", sf=sf)
+        assert len(responses.calls) == 3
+
+        cached_org_config.reset_describe_cache()
+        cached_org_config.describe("Contact", sf=sf)
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_reload(self, sf, cached_org_config):
+        responses.add("GET", f"{BASE_URL}/Account/describe", json=ACCOUNT_DESCRIBE)
+        cached_org_config.describe("Account", sf=sf)
+        # as if another process had reset the cache and described it again
+        stale = {"fetched": time.time(), "describe": {"name": "Stale"}}
+        cached_org_config._describe_cache._entries[("48.0", "Account")] = stale
+
+        cached_org_config.reload_cached_info()
+
+        # Read again from disk, and revalidated
+        responses.add("GET", f"{BASE_URL}/Account/describe", status=304)
+        assert cached_org_config.describe("Account", sf=sf) == ACCOUNT_DESCRIBE
+        assert len(responses.calls) == 2
+
+    def test_reset__no_keychain(self, org_config):
+        org_config.reset_describe_cache()
+        org_config.reset_describe_cache(["Account"])
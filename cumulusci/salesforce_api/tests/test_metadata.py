@@ -1,10 +1,12 @@
 import http.client
 import io
 import unittest
+from unittest import mock
 from collections import defaultdict
 from xml.dom.minidom import parseString
 import datetime
 
+import requests
 from requests import Response
 import responses
 import pytest
@@ -23,6 +25,8 @@ from cumulusci.salesforce_api.metadata import ApiListMetadata
 from cumulusci.salesforce_api.metadata import ApiRetrieveUnpackaged
 from cumulusci.salesforce_api.metadata import ApiRetrieveInstalledPackages
 from cumulusci.salesforce_api.metadata import ApiRetrievePackaged
+from cumulusci.salesforce_api.metadata import get_mdapi_session
+from cumulusci.salesforce_api.metadata import reset_mdapi_sessions
 from cumulusci.salesforce_api.package_zip import BasePackageZipBuilder
 from cumulusci.salesforce_api.package_zip import CreatePackageZipBuilder
 from cumulusci.salesforce_api.package_zip import InstallPackageZipBuilder
@@ -572,6 +576,43 @@ class TestBaseMetadataApiCall(BaseTestMetadataApi):
         resp = api._get_response()
         self.assertEqual(resp.content, response)
 
+    @responses.activate
+    def test_call_mdapi__shares_session_per_org(self):
+        org_config = {
+            "instance_url": "https://na12.salesforce.com",
+            "id": "https://login.salesforce.com/id/00D000000000000ABC/005000000000000ABC",
+            "access_token": "0123456789",
+        }
+        task = self._create_task(org_config=org_config)
+        other_task = self._create_task(org_config=org_config)
+        api = self._create_instance(task)
+        response = b'<?xml version="1.0" encoding="UTF-8"?><foo />'
+        self._mock_call_mdapi(api, response)
+        self._mock_call_mdapi(api, response)
+
+        with mock.patch(
+            "cumulusci.salesforce_api.metadata.requests.Session",
+            wraps=requests.Session,
+        ) as Session:
+            api._call_mdapi({}, "")
+            self._create_instance(task)._call_mdapi({}, "")
+            assert Session.call_count == 1
+
+            self._create_instance(other_task)._call_mdapi({}, "")
+            assert Session.call_count == 2
+
+        assert get_mdapi_session(task.org_config) is not get_mdapi_session(
+            other_task.org_config
+        )
+
+    def test_reset_mdapi_sessions(self):
+        task = self._create_task()
+        session = get_mdapi_session(task.org_config)
+
+        reset_mdapi_sessions()
+
+        assert get_mdapi_session(task.org_config) is not session
+
 
 class TestApiDeploy(BaseTestMetadataApi):
     api_class = ApiDeploy
@@ -377,6 +377,65 @@ class TestMetadataPackageZipBuilder:
             package_xml = builder.zf.read("package.xml")
             assert b"FeatureParameterInteger" not in package_xml
 
+    def test_process__single_pass(self):
+        with temporary_dir() as path:
+            pathlib.Path(path, "package.xml").write_text(
+                """<?xml version="1.0" encoding="utf-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <types>
+        <members>%%%NAMESPACE%%%Test__c</members>
+        <name>CustomObject</name>
+    </types>
+    <types>
+        <name>FeatureParameterBoolean</name>
+    </types>
+</Package>"""
+            )
+            classes = pathlib.Path(path, "classes")
+            classes.mkdir()
+            (classes / "___NAMESPACE___Test.cls").write_text("%%%NAMESPACE%%%Test__c")
+            (classes / "___NAMESPACE___Test.cls-meta.xml").write_text(
+                """<?xml version="1.0" encoding="UTF-8"?>
+<ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
+    <packageVersions>
+        <namespace>other</namespace>
+    </packageVersions>
+</ApexClass>"""
+            )
+            (classes / "binary.cls").write_bytes(b"\xff%%%NAMESPACE%%%")
+            featureParameters = pathlib.Path(path, "featureParameters")
+            featureParameters.mkdir()
+            (featureParameters / "test.featureParameterBoolean").touch()
+
+            zf = mock.Mock(wraps=zipfile.ZipFile)
+            with mock.patch("zipfile.ZipFile", zf):
+                builder = MetadataPackageZipBuilder(
+                    path=path,
+                    options={
+                        "namespace_inject": "ns",
+                        "unmanaged": False,
+                        "package_type": "Unlocked",
+                    },
+                )
+
+            # The files on disk are zipped, reopened for reading,
+            # and written once to the processed package.
+            assert zf.call_count == 3
+            assert set(builder.zf.namelist()) == {
+                "package.xml",
+                "classes/ns__Test.cls",
+                "classes/ns__Test.cls-meta.xml",
+                "classes/binary.cls",
+            }
+            assert builder.zf.read("classes/ns__Test.cls") == b"ns__Test__c"
+            assert builder.zf.read("classes/binary.cls") == b"\xff%%%NAMESPACE%%%"
+            assert b"packageVersions" not in builder.zf.read(
+                "classes/ns__Test.cls-meta.xml"
+            )
+            package_xml = builder.zf.read("package.xml")
+            assert b"<members>ns__Test__c</members>" in package_xml
+            assert b"FeatureParameterBoolean" not in package_xml
+
 
 class TestCreatePackageZipBuilder(unittest.TestCase):
     def test_init__missing_name(self):
@@ -1,11 +1,20 @@
 from json import JSONDecodeError
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
+from cumulusci.salesforce_api.utils import get_org_connection
 from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
+from cumulusci.salesforce_api.utils import reset_org_connections
 from cumulusci.core.exceptions import ServiceNotConfigured
 from cumulusci import __version__
 
 
+def test_plain_dicts():
+    from simple_salesforce import api, bulk
+
+    assert api.OrderedDict is dict
+    assert bulk.OrderedDict is dict
+
+
 def test_connection():
     org_config = Mock()
     proj_config = Mock()
@@ -19,6 +28,7 @@ def test_connection():
             instance_url=org_config.instance_url,
             session_id=org_config.access_token,
             version=proj_config.project__package__api_version,
+            session=ANY,
         )
 
         mock_sf.return_value.headers.setdefault.assert_called_once_with(
@@ -39,6 +49,7 @@ def test_connection__explicit_api_version():
             instance_url=org_config.instance_url,
             session_id=org_config.access_token,
             version="42.0",
+            session=ANY,
         )
 
         mock_sf.return_value.headers.setdefault.assert_called_once_with(
@@ -90,3 +101,68 @@ def test_sf_api_retries(mock_http_response):
             pass
 
         assert 2 == _make_request.call_count
+
+
+def test_connection__shared():
+    org_config = Mock()
+    org_config.instance_url = "https://example.com"
+    org_config.access_token = "token"
+    proj_config = Mock()
+    proj_config.keychain.get_service.side_effect = ServiceNotConfigured
+
+    sf = get_simple_salesforce_connection(proj_config, org_config, api_version="48.0")
+    tooling = get_simple_salesforce_connection(
+        proj_config, org_config, api_version="48.0", base_url="tooling"
+    )
+
+    assert get_org_connection(org_config, "48.0") is sf
+    assert (
+        get_simple_salesforce_connection(
+            proj_config, org_config, api_version="48.0", base_url="/tooling/"
+        )
+        is tooling
+    )
+    assert tooling is not sf
+    assert tooling.base_url == "https://example.com/services/data/v48.0/tooling/"
+    assert tooling.session is sf.session
+    assert get_org_connection(org_config, "47.0") is not sf
+
+    other_org_config = Mock(instance_url="https://example.com", access_token="token")
+    assert get_org_connection(other_org_config, "48.0").session is not sf.session
+
+
+def test_connection__client_name():
+    org_config = Mock(instance_url="https://example.com", access_token="token")
+    proj_config = Mock()
+    proj_config.keychain.get_service.return_value = Mock(client_id="TEST")
+
+    sf = get_org_connection(org_config, "48.0")
+    app_sf = get_org_connection(org_config, "48.0", project_config=proj_config)
+
+    assert app_sf is not sf
+    assert app_sf.session is sf.session
+    assert sf.headers["Sforce-Call-Options"] == f"client=CumulusCI/{__version__}"
+    assert app_sf.headers["Sforce-Call-Options"] == "client=TEST"
+    assert get_org_connection(org_config, "48.0", project_config=proj_config) is app_sf
+
+
+def test_connection__reset():
+    org_config = Mock(instance_url="https://example.com", access_token="token")
+    sf = get_org_connection(org_config, "48.0")
+
+    reset_org_connections()
+
+    assert get_org_connection(org_config, "48.0").session is not sf.session
+
+
+def test_connection__refreshes_token():
+    org_config = Mock()
+    org_config.instance_url = "https://example.com"
+    org_config.access_token = "token"
+
+    sf = get_org_connection(org_config, "48.0")
+    org_config.access_token = "new_token"
+
+    assert get_org_connection(org_config, "48.0") is sf
+    assert sf.session_id == "new_token"
+    assert sf.headers["Authorization"] == "Bearer new_token"
@@ -1,38 +1,115 @@
+import threading
+import weakref
+
+import requests
 import simple_salesforce
 from cumulusci import __version__
 from cumulusci.core.exceptions import ServiceNotConfigured, ServiceNotValid
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
+from simple_salesforce import api, bulk
+
+# Have simple_salesforce return plain dicts rather than OrderedDicts. This is
+# done here, rather than when cumulusci is imported, so that the CLI can start
+# without importing simple_salesforce; everything that gets a client from an
+# org imports this module first.
+api.OrderedDict = dict
+bulk.OrderedDict = dict
 
 CALL_OPTS_HEADER_KEY = "Sforce-Call-Options"
 
+_org_connections = weakref.WeakKeyDictionary()
+_org_connections_lock = threading.Lock()
+
+
+class _OrgConnections:
+    """The HTTP session and simple_salesforce clients shared by everything
+    that talks to one org."""
+
+    def __init__(self):
+        # Retry on long-running metadeploy jobs
+        retries = Retry(total=5, status_forcelist=(502, 503, 504), backoff_factor=0.3)
+        adapter = HTTPAdapter(max_retries=retries)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.clients = {}
+
+
+def reset_org_connections():
+    """Forget the shared HTTP sessions and clients of all orgs.
+
+    A process forked from one that used them must call this before making
+    any calls, so that it doesn't send requests over the parent's sockets."""
+    global _org_connections, _org_connections_lock
+    _org_connections = weakref.WeakKeyDictionary()
+    _org_connections_lock = threading.Lock()
+
 
 def get_simple_salesforce_connection(
     project_config, org_config, api_version=None, base_url: str = None
 ):
-    # Retry on long-running metadeploy jobs
-    retries = Retry(total=5, status_forcelist=(502, 503, 504), backoff_factor=0.3)
-    adapter = HTTPAdapter(max_retries=retries)
+    return get_org_connection(
+        org_config,
+        api_version or project_config.project__package__api_version,
+        base_url=base_url,
+        project_config=project_config,
+    )
+
+
+def get_org_connection(org_config, api_version, base_url=None, project_config=None):
+    """Return a simple_salesforce client for org_config.
+
+    Clients are kept for as long as the org config (e.g. for a whole flow) and
+    handed out to every caller that asks for the same API version and base URL
+    on behalf of the same client (connected app), and all of an org's clients
+    share one keep-alive HTTP session. The client's
+    session id is updated whenever the org's access token has been refreshed."""
+    if base_url:
+        base_url = (
+            base_url.strip("/") + "/"
+        )  # exactly one training slash and no leading slashes
+    client_name = _get_client_name(project_config)
+    key = (str(api_version), base_url, client_name)
+
+    with _org_connections_lock:
+        connections = _org_connections.get(org_config)
+        if connections is None:
+            connections = _org_connections[org_config] = _OrgConnections()
+        sf = connections.clients.get(key)
+        if sf is None:
+            sf = connections.clients[key] = _connect(
+                org_config, api_version, base_url, client_name, connections.session
+            )
+
+    access_token = org_config.access_token
+    if sf.session_id != access_token:
+        sf.session_id = access_token
+        sf.headers["Authorization"] = f"Bearer {access_token}"
+    return sf
 
+
+def _connect(org_config, api_version, base_url, client_name, session):
     sf = simple_salesforce.Salesforce(
         instance_url=org_config.instance_url,
         session_id=org_config.access_token,
-        version=api_version or project_config.project__package__api_version,
+        version=api_version,
+        session=session,
     )
-    try:
-        app = project_config.keychain.get_service("connectedapp")
-        client_name = app.client_id
-    except (ServiceNotValid, ServiceNotConfigured):
-        client_name = "CumulusCI/{}".format(__version__)
-
     sf.headers.setdefault(CALL_OPTS_HEADER_KEY, "client={}".format(client_name))
-    sf.session.mount("http://", adapter)
-    sf.session.mount("https://", adapter)
 
     if base_url:
-        base_url = (
-            base_url.strip("/") + "/"
-        )  # exactly one training slash and no leading slashes
         sf.base_url += base_url
 
     return sf
+
+
+def _get_client_name(project_config):
+    if project_config is not None:
+        try:
+            app = project_config.keychain.get_service("connectedapp")
+            return app.client_id
+        except (ServiceNotValid, ServiceNotConfigured):
+            pass
+    return "CumulusCI/{}".format(__version__)
@@ -1,9 +1,13 @@
 """ CumulusCI Tasks for running Apex Tests """
 
+import heapq
 import html
+import itertools
 import io
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 from cumulusci.core.exceptions import (
@@ -76,6 +80,8 @@ FROM ApexTestResult
 WHERE AsyncApexJobId='{}'
 """
 
+QUEUE_ITEM_FINISHED_STATUSES = ("Completed", "Failed", "Aborted")
+
 
 class RunApexTests(BaseSalesforceApiTask):
     """Task to run Apex tests with the Tooling API and report results.
@@ -107,7 +113,20 @@ class RunApexTests(BaseSalesforceApiTask):
 
     Some projects' unit tests produce so many concurrency errors that
     it's faster to execute the entire run in serial mode than to use retries.
-    Serial and parallel mode are configured in the scratch org definition file."""
+    Serial and parallel mode are configured in the scratch org definition file.
+
+    With ``stream_results`` enabled, the results of each test class are
+    fetched as soon as the class finishes rather than once the whole run is
+    complete, the JUnit and JSON output files are rewritten as results
+    arrive, and retries of retriable failures start (one at a time) while
+    other classes are still running.
+
+    The ``shard_orgs`` option splits the test classes between the task's org
+    and the listed orgs, which run their shares at the same time. Classes are
+    balanced between the orgs by how long they took in the previous run (as
+    recorded in the JSON output, or in the file named by ``test_durations``).
+    The results are merged into one report and any retries run in the task's
+    org. All of the orgs must have the same code deployed."""
 
     api_version = "38.0"
     name = "RunApexTests"
@@ -167,6 +186,20 @@ class RunApexTests(BaseSalesforceApiTask):
             "description": "By default, only failures get detailed output. "
             "Set verbose to True to see all passed test methods."
         },
+        "stream_results": {
+            "description": "If True, fetch the results of each test class as soon as "
+            "it finishes, write the output files as results arrive and start "
+            "retries while other classes are still running. Defaults to False."
+        },
+        "shard_orgs": {
+            "description": "A list of names of other orgs to run a share of the test "
+            "classes in, at the same time as the task's org. The orgs must "
+            "have the same code deployed. stream_results is not used when sharding."
+        },
+        "test_durations": {
+            "description": "JSON output from a previous run, used to balance test "
+            "classes between shard_orgs by their durations. Defaults to json_output."
+        },
     }
 
     def _init_options(self, kwargs):
@@ -215,6 +248,15 @@ class RunApexTests(BaseSalesforceApiTask):
             self.options.get("retry_always") or False
         )
         self.verbose = process_bool_arg(self.options.get("verbose") or False)
+        self.options["stream_results"] = process_bool_arg(
+            self.options.get("stream_results") or False
+        )
+        self.options["shard_orgs"] = process_list_arg(
+            self.options.get("shard_orgs") or []
+        )
+        self.options["test_durations"] = (
+            self.options.get("test_durations") or self.options["json_output"]
+        )
 
         self.counts = {}
 
@@ -230,6 +272,12 @@ class RunApexTests(BaseSalesforceApiTask):
         else:
             self.code_coverage_level = None
 
+        if self.code_coverage_level and self.options["shard_orgs"]:
+            raise TaskOptionsError(
+                "required_org_code_coverage_percent cannot be used with shard_orgs "
+                "because each org only runs some of the tests."
+            )
+
     # pylint: disable=W0201
     def _init_class(self):
         self.classes_by_id = {}
@@ -238,6 +286,7 @@ class RunApexTests(BaseSalesforceApiTask):
         self.results_by_class_name = {}
         self.result = None
         self.retry_details = None
+        self.retry_results = {}
 
     def _get_namespace_filter(self):
         if self.options["managed"]:
@@ -284,22 +333,33 @@ class RunApexTests(BaseSalesforceApiTask):
         return result
 
     def _get_test_methods_for_class(self, class_name):
-        result = self.tooling.query(
-            f"SELECT SymbolTable FROM ApexClass WHERE Name='{class_name}'"
+        return self._get_test_methods_for_classes([class_name])[class_name]
+
+    def _get_test_methods_for_classes(self, class_names):
+        """Return {class name: [test method names]} using one symbol table query."""
+        names = ",".join("'{}'".format(class_name) for class_name in class_names)
+        result = self.tooling.query_all(
+            f"SELECT Name, SymbolTable FROM ApexClass WHERE Name IN ({names})"
         )
-        test_methods = []
+        symbol_tables = {
+            record.get("Name"): record.get("SymbolTable")
+            for record in result["records"]
+        }
 
-        try:
-            methods = result["records"][0]["SymbolTable"]["methods"]
-        except (TypeError, IndexError, KeyError):
-            raise CumulusCIException(
-                f"Unable to acquire symbol table for failed Apex class {class_name}"
-            )
-        for m in methods:
-            for a in m.get("annotations", []):
-                if a["name"].lower() in ["istest", "testmethod"]:
-                    test_methods.append(m["name"])
-                    break
+        test_methods = {}
+        for class_name in class_names:
+            try:
+                methods = symbol_tables[class_name]["methods"]
+            except (TypeError, KeyError):
+                raise CumulusCIException(
+                    f"Unable to acquire symbol table for failed Apex class {class_name}"
+                )
+            test_methods[class_name] = []
+            for m in methods:
+                for a in m.get("annotations", []):
+                    if a["name"].lower() in ["istest", "testmethod"]:
+                        test_methods[class_name].append(m["name"])
+                        break
 
         return test_methods
 
@@ -334,15 +394,24 @@ class RunApexTests(BaseSalesforceApiTask):
         if allow_retries:
             self.retry_details = {}
 
-        for test_result in result["records"]:
+        self._record_test_results(result["records"])
+        self._record_class_level_errors(class_level_errors)
+
+        if allow_retries:
+            self._record_retry_details(self.results_by_class_name.keys())
+
+    def _record_test_results(self, records):
+        for test_result in records:
             class_name = self.classes_by_id[test_result["ApexClassId"]]
             self.results_by_class_name[class_name][
                 test_result["MethodName"]
             ] = test_result
             self.counts[test_result["Outcome"]] += 1
 
+    def _record_class_level_errors(self, class_level_errors):
         # If we have class-level failures that did not come with line-level
         # failure details, report those as well.
+        class_names = []
         for class_id, error in class_level_errors.items():
             class_name = self.classes_by_id[class_id]
 
@@ -356,10 +425,16 @@ class RunApexTests(BaseSalesforceApiTask):
                     f"Cannot access symbol table for managed class {class_name}. Failure will not be retried."
                 )
                 continue
+            class_names.append(class_name)
+
+        if not class_names:
+            return
 
-            # Get all the method names for this class
-            test_methods = self._get_test_methods_for_class(class_name)
-            for test_method in test_methods:
+        # Get all the method names for these classes
+        test_methods_by_class = self._get_test_methods_for_classes(class_names)
+        for class_id, error in class_level_errors.items():
+            class_name = self.classes_by_id[class_id]
+            for test_method in test_methods_by_class.get(class_name, []):
                 # If this method was not run due to a class-level failure,
                 # synthesize a failed result.
                 # If we're retrying and fail again, do the same.
@@ -378,43 +453,42 @@ class RunApexTests(BaseSalesforceApiTask):
                     }
                     self.counts["Fail"] += 1
 
-        if allow_retries:
-            for class_name, results in self.results_by_class_name.items():
-                for test_result in results.values():
-                    # Determine whether this failure is retriable.
-                    if test_result["Outcome"] == "Fail" and allow_retries:
-                        can_retry_this_failure = self._is_retriable_failure(test_result)
-                        if can_retry_this_failure:
-                            self.counts["Retriable"] += 1
-
-                        # Even if this failure is not retriable per se,
-                        # persist its details if we might end up retrying
-                        # all failures.
-                        if self.options["retry_always"] or can_retry_this_failure:
-                            self.retry_details.setdefault(
-                                test_result["ApexClassId"], []
-                            ).append(test_result["MethodName"])
+    def _record_retry_details(self, class_names):
+        for class_name in class_names:
+            for test_result in self.results_by_class_name[class_name].values():
+                # Determine whether this failure is retriable.
+                if test_result["Outcome"] == "Fail":
+                    can_retry_this_failure = self._is_retriable_failure(test_result)
+                    if can_retry_this_failure:
+                        self.counts["Retriable"] += 1
+
+                    # Even if this failure is not retriable per se,
+                    # persist its details if we might end up retrying
+                    # all failures.
+                    if self.options["retry_always"] or can_retry_this_failure:
+                        self.retry_details.setdefault(
+                            test_result["ApexClassId"], []
+                        ).append(test_result["MethodName"])
+
+    def _able_to_retry(self):
+        return bool(
+            (self.counts["Retriable"] and self.options["retry_always"])
+            or (
+                self.counts["Retriable"]
+                and self.counts["Retriable"] == self.counts["Fail"]
+            )
+        )
 
-    def _process_test_results(self):
+    def _format_test_results(self):
         test_results = []
         class_names = list(self.results_by_class_name.keys())
         class_names.sort()
         for class_name in class_names:
-            has_failures = any(
-                result["Outcome"] in ["Fail", "CompileFail"]
-                for result in self.results_by_class_name[class_name].values()
-            )
-            if has_failures or self.verbose:
-                self.logger.info(f"Class: {class_name}")
             method_names = list(self.results_by_class_name[class_name].keys())
             method_names.sort()
             for method_name in method_names:
                 result = self.results_by_class_name[class_name][method_name]
-                message = f"\t{result['Outcome']}: {result['MethodName']}"
-                duration = result["RunTime"]
                 result["stats"] = self._get_stats_from_result(result)
-                if duration:
-                    message += f" ({duration}ms)"
                 test_results.append(
                     {
                         "Children": result.get("children", None),
@@ -427,6 +501,24 @@ class RunApexTests(BaseSalesforceApiTask):
                         "TestTimestamp": result.get("TestTimestamp", None),
                     }
                 )
+        return test_results
+
+    def _process_test_results(self):
+        test_results = self._format_test_results()
+        for class_name, class_results in itertools.groupby(
+            test_results, key=lambda result: result["ClassName"]
+        ):
+            class_results = list(class_results)
+            has_failures = any(
+                result["Outcome"] in ["Fail", "CompileFail"] for result in class_results
+            )
+            if has_failures or self.verbose:
+                self.logger.info(f"Class: {class_name}")
+            for result in class_results:
+                message = f"\t{result['Outcome']}: {result['Method']}"
+                duration = result["Stats"]["duration"]
+                if duration:
+                    message += f" ({duration}ms)"
                 if result["Outcome"] in ["Fail", "CompileFail"]:
                     self.logger.info(message)
                     self.logger.info(f"\tMessage: {result['Message']}")
@@ -501,30 +593,29 @@ class RunApexTests(BaseSalesforceApiTask):
             self.classes_by_id[test_class["Id"]] = test_class["Name"]
             self.classes_by_name[test_class["Name"]] = test_class["Id"]
             self.results_by_class_name[test_class["Name"]] = {}
-        self.logger.info("Queuing tests for execution...")
+        self._init_counts()
 
-        self.counts = {
-            "Pass": 0,
-            "Fail": 0,
-            "CompileFail": 0,
-            "Skip": 0,
-            "Retriable": 0,
-        }
-        self.job_id = self._enqueue_test_run(
-            (str(id) for id in self.classes_by_id.keys())
-        )
+        if self.options["shard_orgs"]:
+            self._run_shards()
+        else:
+            self.logger.info("Queuing tests for execution...")
+            self.job_id = self._enqueue_test_run(
+                (str(id) for id in self.classes_by_id.keys())
+            )
 
-        self._wait_for_tests()
-        self._get_test_results()
+            if self.options["stream_results"]:
+                self._stream_tests()
+            else:
+                self._wait_for_tests()
+                self._get_test_results()
 
         # Did we get back retriable test results? Check our retry policy,
         # then enqueue new runs individually, until either (a) all retriable
         # tests succeed or (b) a test fails.
-        able_to_retry = (self.counts["Retriable"] and self.options["retry_always"]) or (
-            self.counts["Retriable"] and self.counts["Retriable"] == self.counts["Fail"]
-        )
-        if not able_to_retry:
+        if not self._able_to_retry():
             self.counts["Retriable"] = 0
+        elif self.options["stream_results"]:
+            self._apply_retry_results()
         else:
             self._attempt_retries()
 
@@ -550,6 +641,127 @@ class RunApexTests(BaseSalesforceApiTask):
                 "No code coverage level specified; not checking code coverage."
             )
 
+    def _init_counts(self):
+        self.counts = {
+            "Pass": 0,
+            "Fail": 0,
+            "CompileFail": 0,
+            "Skip": 0,
+            "Retriable": 0,
+        }
+
+    def _get_class_durations(self):
+        """Return {class name: milliseconds} from a previous run's JSON output."""
+        path = self.options["test_durations"]
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with io.open(path, encoding="utf-8") as f:
+                test_results = json.load(f)
+        except ValueError:
+            self.logger.warning(f"Unable to read test durations from {path}")
+            return {}
+
+        durations = {}
+        for result in test_results:
+            duration = (result.get("Stats") or {}).get("duration") or 0
+            class_name = result["ClassName"]
+            durations[class_name] = durations.get(class_name, 0) + duration
+        return durations
+
+    def _get_shards(self, class_names, count):
+        """Split class_names into count lists with similar total durations.
+
+        Classes without a recorded duration are assumed to take the average
+        time of those with one."""
+        durations = self._get_class_durations()
+        known = [durations[name] for name in class_names if name in durations]
+        default = sum(known) / len(known) if known else 1
+
+        # Longest classes first, each into the shard with the least work so far
+        shards = [(0, i, []) for i in range(count)]
+        for class_name in sorted(
+            class_names, key=lambda name: (-durations.get(name, default), name)
+        ):
+            total, i, shard = heapq.heappop(shards)
+            shard.append(class_name)
+            heapq.heappush(
+                shards, (total + durations.get(class_name, default), i, shard)
+            )
+        return [shard for total, i, shard in sorted(shards, key=lambda s: s[1])]
+
+    def _run_shards(self):
+        org_configs = [self.org_config] + [
+            self.project_config.keychain.get_org(org_name)
+            for org_name in self.options["shard_orgs"]
+        ]
+        shard_classes = self._get_shards(
+            list(self.classes_by_name.keys()), len(org_configs)
+        )
+
+        shards = []
+        for org_config, class_names in zip(org_configs, shard_classes):
+            if not class_names:
+                continue
+            shard = self.__class__(self.project_config, self.task_config, org_config)
+            shard.logger = self.logger.getChild(org_config.name or "org")
+            shard.options["shard_orgs"] = []
+            shard.options["stream_results"] = False
+            if org_config is not self.org_config:
+                shard._update_credentials()
+            shard._init_task()
+            shards.append((shard, class_names))
+
+        self.logger.info(
+            f"Queuing tests for execution in {len(shards)} orgs: "
+            + ", ".join(
+                f"{len(class_names)} classes in {shard.org_config.name}"
+                for shard, class_names in shards
+            )
+        )
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(shard._run_shard, class_names)
+                for shard, class_names in shards
+            ]
+        for future in futures:
+            future.result()
+
+        # Merge the shards' results. Retries run in this org, so retry
+        # details need this org's class Ids.
+        self.retry_details = {}
+        for shard, class_names in shards:
+            self.results_by_class_name.update(shard.results_by_class_name)
+            for outcome, count in shard.counts.items():
+                self.counts[outcome] += count
+            for class_id, test_list in shard.retry_details.items():
+                class_id = self.classes_by_name[shard.classes_by_id[class_id]]
+                self.retry_details.setdefault(class_id, []).extend(test_list)
+
+    def _run_shard(self, class_names):
+        """Run the named test classes in this task's org, as one of several
+        shards of a test run. The results are left for the caller to merge."""
+        self._init_counts()
+        result = self._get_test_classes()
+        for test_class in result["records"]:
+            if test_class["Name"] in class_names:
+                self.classes_by_id[test_class["Id"]] = test_class["Name"]
+                self.classes_by_name[test_class["Name"]] = test_class["Id"]
+                self.results_by_class_name[test_class["Name"]] = {}
+
+        missing = set(class_names) - set(self.classes_by_name)
+        if missing:
+            raise CumulusCIException(
+                f"Apex test classes not found in org {self.org_config.name}: "
+                + ", ".join(sorted(missing))
+            )
+
+        self.job_id = self._enqueue_test_run(
+            (str(id) for id in self.classes_by_id.keys())
+        )
+        self._wait_for_tests()
+        self._get_test_results()
+
     def _check_code_coverage(self):
         result = self.tooling.query("SELECT PercentCovered FROM ApexOrgWideCoverage")
         coverage = result["records"][0]["PercentCovered"]
@@ -586,17 +798,56 @@ class RunApexTests(BaseSalesforceApiTask):
         if self.counts["Fail"]:
             self.logger.error("Test retry failed.")
 
+    def _apply_retry_results(self):
+        """Replace the retried failures with the results of the retries run by
+        _stream_tests, once the retry policy is known to allow them."""
+        self.counts["Fail"] = 0
+        for class_id, test_list in self.retry_details.items():
+            class_name = self.classes_by_id[class_id]
+            for each_test in test_list:
+                result = self.retry_results[class_id, each_test]
+                self.results_by_class_name[class_name][each_test] = result
+                self.counts[result["Outcome"]] += 1
+
+        if self.counts["Fail"]:
+            self.logger.error("Test retry failed.")
+
     def _wait_for_tests(self):
         self.poll_complete = False
         self.poll_interval_s = int(self.options.get("poll_interval", 1))
         self.poll_count = 0
         self._poll()
 
+    def _stream_tests(self):
+        """Wait for the test run, collecting results class by class.
+
+        Retries are run here as well (one at a time, as soon as the retry
+        policy allows them given the failures seen so far), but their results
+        are kept in retry_results until the whole run is known to be
+        retriable."""
+        self.retry_details = {}
+        self.retry_results = {}
+        self.finished_queue_items = set()
+        self.main_run_complete = False
+        self.retry_job = None  # (job id, class id, method name)
+        self.stream_progress = False
+        self._wait_for_tests()
+
     def _poll_action(self):
+        if self.options["stream_results"]:
+            self._stream_poll_action()
+            return
+
         self.result = self.tooling.query_all(
             "SELECT Id, Status, ApexClassId FROM ApexTestQueueItem "
             + "WHERE ParentJobId = '{}'".format(self.job_id)
         )
+        if self._log_queue_status(self.result):
+            self.logger.info("Apex tests completed")
+            self.poll_complete = True
+
+    def _log_queue_status(self, result):
+        """Log the progress of a test run and return whether it has finished."""
         counts = {
             "Aborted": 0,
             "Completed": 0,
@@ -607,8 +858,8 @@ class RunApexTests(BaseSalesforceApiTask):
             "Queued": 0,
         }
         processing_class_id = None
-        total_test_count = self.result["totalSize"]
-        for test_queue_item in self.result["records"]:
+        total_test_count = result["totalSize"]
+        for test_queue_item in result["records"]:
             counts[test_queue_item["Status"]] += 1
             if test_queue_item["Status"] == "Processing":
                 processing_class_id = test_queue_item["ApexClassId"]
@@ -623,12 +874,120 @@ class RunApexTests(BaseSalesforceApiTask):
                 counts["Queued"],
             )
         )
-        if (
+        return (
             total_test_count
             == counts["Completed"] + counts["Failed"] + counts["Aborted"]
+        )
+
+    def _stream_poll_action(self):
+        self.stream_progress = False
+
+        if not self.main_run_complete:
+            self.result = self.tooling.query_all(
+                "SELECT Id, Status, ExtendedStatus, ApexClassId FROM ApexTestQueueItem "
+                + "WHERE ParentJobId = '{}'".format(self.job_id)
+            )
+            finished = [
+                item
+                for item in self.result["records"]
+                if item["Status"] in QUEUE_ITEM_FINISHED_STATUSES
+                and item["Id"] not in self.finished_queue_items
+            ]
+            if finished:
+                self._get_class_results(finished)
+            if self._log_queue_status(self.result):
+                self.logger.info("Apex tests completed")
+                self.main_run_complete = True
+
+        if self.retry_job is not None:
+            self._check_retry()
+
+        if self.retry_job is None:
+            self._start_next_retry()
+
+        if self.stream_progress:
+            self._write_output(self._format_test_results())
+
+        self.poll_complete = self.main_run_complete and self.retry_job is None
+
+    def _get_class_results(self, queue_items):
+        """Record the results of the test classes of finished queue items."""
+        class_ids = ",".join("'{}'".format(item["ApexClassId"]) for item in queue_items)
+        result = self.tooling.query_all(
+            TEST_RESULT_QUERY.format(self.job_id)
+            + "AND ApexClassId IN ({})".format(class_ids)
+        )
+        self._record_test_results(result["records"])
+        self._record_class_level_errors(
+            {
+                item["ApexClassId"]: item["ExtendedStatus"]
+                for item in queue_items
+                if item["Status"] == "Failed"
+            }
+        )
+        self._record_retry_details(
+            {self.classes_by_id[item["ApexClassId"]] for item in queue_items}
+        )
+        self.finished_queue_items.update(item["Id"] for item in queue_items)
+        self.stream_progress = True
+
+    def _start_next_retry(self):
+        # The failures seen so far only grow, so once they rule out retries
+        # (a failure that isn't retriable), no retry will be needed.
+        if not self._able_to_retry():
+            return
+        for class_id, test_list in self.retry_details.items():
+            for each_test in test_list:
+                if (class_id, each_test) not in self.retry_results:
+                    self.logger.warning(
+                        "Retrying {}.{}".format(self.classes_by_id[class_id], each_test)
+                    )
+                    job_id = self._enqueue_test_run({class_id: [each_test]})
+                    self.retry_job = (job_id, class_id, each_test)
+                    return
+
+    def _check_retry(self):
+        job_id, class_id, each_test = self.retry_job
+        result = self.tooling.query_all(
+            "SELECT Id, Status, ExtendedStatus, ApexClassId FROM ApexTestQueueItem "
+            + "WHERE ParentJobId = '{}'".format(job_id)
+        )
+        if not all(
+            item["Status"] in QUEUE_ITEM_FINISHED_STATUSES for item in result["records"]
         ):
-            self.logger.info("Apex tests completed")
-            self.poll_complete = True
+            return
+
+        class_name = self.classes_by_id[class_id]
+        test_results = self.tooling.query_all(TEST_RESULT_QUERY.format(job_id))
+        retry_result = None
+        for test_result in test_results["records"]:
+            if test_result["MethodName"] == each_test:
+                retry_result = test_result
+        failed = [item for item in result["records"] if item["Status"] == "Failed"]
+        if failed and (retry_result is None or retry_result["Outcome"] == "Fail"):
+            retry_result = {
+                "ApexClassId": class_id,
+                "MethodName": each_test,
+                "Outcome": "Fail",
+                "Message": f"Containing class {class_name} failed with message {failed[0]['ExtendedStatus']}",
+                "StackTrace": "",
+                "RunTime": 0,
+            }
+        if retry_result is None:
+            # Keep the original failure if the retry produced nothing.
+            retry_result = self.results_by_class_name[class_name][each_test]
+        self.retry_results[class_id, each_test] = retry_result
+        self.retry_job = None
+        self.stream_progress = True
+
+    def _poll_update_interval(self):
+        if self.options["stream_results"] and self.stream_progress:
+            # Results are arriving; keep checking at the initial interval.
+            self.poll_count = 0
+            self.poll_interval_level = 0
+            self.poll_interval_s = int(self.options.get("poll_interval", 1))
+            return
+        super()._poll_update_interval()
 
     def _write_output(self, test_results):
         junit_output = self.options["junit_output"]
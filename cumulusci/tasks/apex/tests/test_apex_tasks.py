@@ -1,5 +1,6 @@
 from distutils.version import StrictVersion
 import http.client
+import json
 import os
 import shutil
 import tempfile
@@ -30,6 +31,7 @@ from cumulusci.tasks.apex.anon import AnonymousApexTask
 from cumulusci.tasks.apex.batch import BatchApexWait
 from cumulusci.tasks.apex.testrunner import RunApexTests
 from cumulusci.core.tests.utils import MockLoggerMixin
+from cumulusci.utils import temporary_dir
 
 
 @patch(
@@ -232,32 +234,37 @@ class TestRunApexTests(MockLoggerMixin, unittest.TestCase):
     def _mock_get_symboltable(self):
         url = (
             self.base_tooling_url
-            + "query/?q=SELECT+SymbolTable+FROM+ApexClass+WHERE+Name%3D%27TestClass_TEST%27"
+            + "query/?q=SELECT+Name%2C+SymbolTable+FROM+ApexClass+WHERE+Name+IN+%28%27TestClass_TEST%27%29"
         )
 
         responses.add(
             responses.GET,
             url,
             json={
+                "done": True,
+                "totalSize": 1,
                 "records": [
                     {
+                        "Name": "TestClass_TEST",
                         "SymbolTable": {
                             "methods": [
                                 {"name": "test1", "annotations": [{"name": "isTest"}]}
                             ]
-                        }
+                        },
                     }
-                ]
+                ],
             },
         )
 
     def _mock_get_symboltable_failure(self):
         url = (
             self.base_tooling_url
-            + "query/?q=SELECT+SymbolTable+FROM+ApexClass+WHERE+Name%3D%27TestClass_TEST%27"
+            + "query/?q=SELECT+Name%2C+SymbolTable+FROM+ApexClass+WHERE+Name+IN+%28%27TestClass_TEST%27%29"
         )
 
-        responses.add(responses.GET, url, json={"records": []})
+        responses.add(
+            responses.GET, url, json={"done": True, "totalSize": 0, "records": []}
+        )
 
     def _mock_tests_complete(self, job_id="JOB_ID1234567"):
         url = (
@@ -291,6 +298,42 @@ class TestRunApexTests(MockLoggerMixin, unittest.TestCase):
             responses.GET, url, match_querystring=True, json=expected_response
         )
 
+    def _mock_stream_queue_items(
+        self, status, job_id="JOB_ID1234567", extended_status=None
+    ):
+        url = (
+            self.base_tooling_url
+            + "query/?q=SELECT+Id%2C+Status%2C+ExtendedStatus%2C+"
+            + "ApexClassId+FROM+ApexTestQueueItem+WHERE+ParentJobId+%3D+%27"
+            + "{}%27".format(job_id)
+        )
+        expected_response = {
+            "done": True,
+            "totalSize": 1,
+            "records": [
+                {
+                    "Id": "709" + job_id,
+                    "Status": status,
+                    "ExtendedStatus": extended_status,
+                    "ApexClassId": 1,
+                }
+            ],
+        }
+        responses.add(
+            responses.GET, url, match_querystring=True, json=expected_response
+        )
+
+    def _mock_stream_test_results(
+        self, outcome="Pass", message="Test Passed", job_id="JOB_ID1234567"
+    ):
+        url = self._get_mock_test_query_url(job_id) + "AND+ApexClassId+IN+%28%271%27%29"
+        expected_response = self._get_mock_test_query_results(
+            ["TestMethod"], [outcome], [message]
+        )
+        responses.add(
+            responses.GET, url, match_querystring=True, json=expected_response
+        )
+
     def _mock_run_tests(self, success=True, body="JOB_ID1234567"):
         url = self.base_tooling_url + "runTestsAsynchronous"
         if success:
@@ -370,11 +413,11 @@ class TestRunApexTests(MockLoggerMixin, unittest.TestCase):
         }
 
         task = RunApexTests(self.project_config, task_config, self.org_config)
-        task._get_test_methods_for_class = Mock()
+        task._get_test_methods_for_classes = Mock()
 
         task()
 
-        task._get_test_methods_for_class.assert_not_called()
+        task._get_test_methods_for_classes.assert_not_called()
 
     @responses.activate
     def test_run_task__retry_tests(self):
@@ -760,6 +803,257 @@ class TestRunApexTests(MockLoggerMixin, unittest.TestCase):
         task()
         self.assertIsNone(task.result)
 
+    @responses.activate
+    def test_run_task__stream_results(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_stream_queue_items("Processing")
+        self._mock_stream_queue_items("Completed")
+        self._mock_stream_test_results()
+        self.task_config.config["options"]["stream_results"] = True
+        with temporary_dir():
+            task = RunApexTests(self.project_config, self.task_config, self.org_config)
+            task()
+
+            with open("test_results.json") as f:
+                results = json.load(f)
+        assert [result["Outcome"] for result in results] == ["Pass"]
+        assert len(responses.calls) == 5
+        assert task.counts["Pass"] == 1
+
+    @responses.activate
+    def test_run_task__stream_results__class_level_failure(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_stream_queue_items("Failed", extended_status="Double-plus ungood")
+        self._mock_stream_test_results()
+        self._mock_get_symboltable()
+        self.task_config.config["options"]["stream_results"] = True
+        with temporary_dir():
+            task = RunApexTests(self.project_config, self.task_config, self.org_config)
+            with self.assertRaises(ApexTestException):
+                task()
+
+        assert task.results_by_class_name["TestClass_TEST"]["test1"]["Message"] == (
+            "Containing class TestClass_TEST failed with message Double-plus ungood"
+        )
+
+    @responses.activate
+    def test_run_task__stream_results__retry_tests(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_run_tests(body="JOBID_9999")
+        self._mock_stream_queue_items("Completed")
+        self._mock_stream_test_results("Fail", "UNABLE_TO_LOCK_ROW")
+        self._mock_stream_queue_items("Completed", job_id="JOBID_9999")
+        self._mock_get_test_results(job_id="JOBID_9999")
+        self.task_config.config["options"].update(
+            {"stream_results": True, "retry_failures": ["UNABLE_TO_LOCK_ROW"]}
+        )
+        with temporary_dir():
+            task = RunApexTests(self.project_config, self.task_config, self.org_config)
+            task()
+
+        assert task.counts["Fail"] == 0
+        assert task.counts["Retriable"] == 1
+        assert (
+            task.results_by_class_name["TestClass_TEST"]["TestMethod"]["Outcome"]
+            == "Pass"
+        )
+
+    @responses.activate
+    def test_run_task__stream_results__retry_not_allowed(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_stream_queue_items("Completed")
+        self._mock_stream_test_results("Fail", "DUPLICATES_DETECTED")
+        self.task_config.config["options"].update(
+            {"stream_results": True, "retry_failures": ["UNABLE_TO_LOCK_ROW"]}
+        )
+        with temporary_dir():
+            task = RunApexTests(self.project_config, self.task_config, self.org_config)
+            with self.assertRaises(ApexTestException):
+                task()
+
+        # No retry was enqueued
+        assert len(responses.calls) == 4
+        assert task.counts["Retriable"] == 0
+
+    def test_poll_update_interval__stream_results(self):
+        self.task_config.config["options"]["stream_results"] = True
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+        task.poll_count = 6
+        task.poll_interval_level = 1
+        task.poll_interval_s = 3
+        task.stream_progress = True
+        task._poll_update_interval()
+        assert task.poll_interval_s == 1
+
+        task.stream_progress = False
+        task.poll_count = 3
+        task._poll_update_interval()
+        assert task.poll_interval_s == 2
+
+    def _mock_shard_org(self, instance_url, class_ids, job_id, method_outcomes):
+        tooling_url = "{}/services/data/v{}/tooling/".format(
+            instance_url, self.api_version
+        )
+        responses.add(
+            responses.GET,
+            tooling_url
+            + "query/?q=SELECT+Id%2C+Name+FROM+ApexClass+WHERE+NamespacePrefix+%3D+null"
+            + "+AND+%28Name+LIKE+%27%25_TEST%27%29",
+            match_querystring=True,
+            json={
+                "done": True,
+                "totalSize": len(class_ids),
+                "records": [
+                    {"Id": class_id, "Name": name}
+                    for name, class_id in class_ids.items()
+                ],
+            },
+        )
+        responses.add(responses.POST, tooling_url + "runTestsAsynchronous", json=job_id)
+        responses.add(
+            responses.GET,
+            tooling_url
+            + "query/?q=SELECT+Id%2C+Status%2C+ApexClassId+FROM+ApexTestQueueItem"
+            + f"+WHERE+ParentJobId+%3D+%27{job_id}%27",
+            match_querystring=True,
+            json={"done": True, "totalSize": 1, "records": [{"Status": "Completed"}]},
+        )
+        responses.add(
+            responses.GET,
+            tooling_url
+            + "query/?q=SELECT+Id%2C+Status%2C+ExtendedStatus%2C+ApexClassId+FROM+"
+            + f"ApexTestQueueItem+WHERE+ParentJobId+%3D+%27{job_id}%27+AND+Status+%3D+%27Failed%27",
+            match_querystring=True,
+            json={"done": True, "totalSize": 0, "records": []},
+        )
+        results = {"done": True, "totalSize": 0, "records": []}
+        for class_name, (method_name, outcome, message) in method_outcomes.items():
+            record = self._get_mock_test_query_results(
+                [method_name], [outcome], [message]
+            )["records"][0]
+            record["ApexClassId"] = class_ids[class_name]
+            results["records"].append(record)
+        responses.add(
+            responses.GET,
+            self._get_mock_test_query_url(job_id).replace(
+                self.base_tooling_url, tooling_url
+            ),
+            match_querystring=True,
+            json=results,
+        )
+
+    def _shard_task(self, **options):
+        self.project_config.keychain.set_org(
+            OrgConfig(
+                {
+                    "instance_url": "https://other.example.com",
+                    "access_token": "abc123",
+                },
+                "other",
+            )
+        )
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "shard_orgs": "other",
+        }
+        task_config.config["options"].update(options)
+        return RunApexTests(self.project_config, task_config, self.org_config)
+
+    def test_get_shards(self):
+        with temporary_dir():
+            with open("test_results.json", "w") as f:
+                json.dump(
+                    [
+                        {"ClassName": "A_TEST", "Stats": {"duration": 100}},
+                        {"ClassName": "A_TEST", "Stats": {"duration": 100}},
+                        {"ClassName": "B_TEST", "Stats": {"duration": 150}},
+                        {"ClassName": "C_TEST", "Stats": {"duration": 50}},
+                        {"ClassName": "D_TEST", "Stats": None},
+                    ],
+                    f,
+                )
+            task = self._shard_task()
+            shards = task._get_shards(
+                ["A_TEST", "B_TEST", "C_TEST", "D_TEST", "E_TEST"], 2
+            )
+
+        # E_TEST has no recorded duration, so counts as the average (100ms)
+        assert shards == [["A_TEST", "C_TEST", "D_TEST"], ["B_TEST", "E_TEST"]]
+
+    def test_get_shards__no_durations(self):
+        with temporary_dir():
+            task = self._shard_task()
+            shards = task._get_shards(["A_TEST", "B_TEST", "C_TEST"], 2)
+
+        assert shards == [["A_TEST", "C_TEST"], ["B_TEST"]]
+
+    def test_shard_orgs__code_coverage(self):
+        with self.assertRaises(TaskOptionsError):
+            self._shard_task(required_org_code_coverage_percent="75")
+
+    @responses.activate
+    def test_run_task__shard_orgs(self):
+        class_ids = {"A_TEST": "01pA", "B_TEST": "01pB"}
+        self._mock_shard_org(
+            self.org_config.instance_url,
+            class_ids,
+            "JOB_ID1",
+            {"A_TEST": ("testA", "Fail", "UNABLE_TO_LOCK_ROW")},
+        )
+        self._mock_shard_org(
+            "https://other.example.com",
+            {"A_TEST": "01pX", "B_TEST": "01pY"},
+            "JOB_ID2",
+            {"B_TEST": ("testB", "Pass", "")},
+        )
+        # The retry runs in the task's own org
+        self._mock_run_tests(body="JOB_ID3")
+        self._mock_tests_complete(job_id="JOB_ID3")
+        self._mock_get_failed_test_classes(job_id="JOB_ID3")
+        retry_results = self._get_mock_test_query_results(["testA"], ["Pass"], [""])
+        retry_results["records"][0]["ApexClassId"] = "01pA"
+        responses.add(
+            responses.GET,
+            self._get_mock_test_query_url("JOB_ID3"),
+            match_querystring=True,
+            json=retry_results,
+        )
+
+        with temporary_dir():
+            with open("test_results.json", "w") as f:
+                json.dump(
+                    [
+                        {"ClassName": "A_TEST", "Stats": {"duration": 100}},
+                        {"ClassName": "B_TEST", "Stats": {"duration": 90}},
+                    ],
+                    f,
+                )
+            task = self._shard_task(retry_failures=["UNABLE_TO_LOCK_ROW"])
+            task()
+
+            with open("test_results.json") as f:
+                results = json.load(f)
+
+        assert [(r["ClassName"], r["Method"], r["Outcome"]) for r in results] == [
+            ("A_TEST", "testA", "Pass"),
+            ("B_TEST", "testB", "Pass"),
+        ]
+        enqueued = [
+            json.loads(call.request.body)
+            for call in responses.calls
+            if call.request.url.endswith("runTestsAsynchronous")
+        ]
+        assert {"classids": "01pA"} in enqueued
+        assert {"classids": "01pY"} in enqueued
+        assert {"tests": [{"classId": "01pA", "testMethods": ["testA"]}]} in enqueued
+
 
 @patch(
     "cumulusci.tasks.salesforce.BaseSalesforceTask._update_credentials",
@@ -1,7 +1,17 @@
+import functools
+import itertools
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from cumulusci.tasks.bulkdata.step import DataOperationType
 
+# Dates in a dataset are highly repetitive, so we keep a bounded cache
+# of converted values per column type.
+CONVERSION_CACHE_SIZE = 65536
+# Matches the time portion of a Salesforce-style datetime, which is
+# carried over unchanged when the date portion is shifted.
+SALESFORCE_TIME_SUFFIX = re.compile(r"T\d{2}:\d{2}:\d{2}\.\d{3}\+0000$")
+
 
 def adjust_relative_dates(
     mapping,
@@ -51,6 +61,79 @@ def adjust_relative_dates(
     return r
 
 
+class RelativeDateAdjuster:
+    """Batched equivalent of adjust_relative_dates().
+
+    Rows are adjusted in place, one column at a time, and converted values are
+    cached so that each distinct date is only parsed and formatted once."""
+
+    def __init__(self, mapping, context, operation: DataOperationType):
+        date_fields, date_time_fields, today = context
+
+        if operation is DataOperationType.QUERY:
+            self.current_anchor = today
+            self.target_anchor = mapping.anchor_date
+            # Query results carry the Id field in the first column.
+            offset = 1
+        else:
+            self.current_anchor = mapping.anchor_date
+            self.target_anchor = today
+            offset = 0
+
+        self.date_indexes = [index + offset for index in date_fields]
+        self.date_time_indexes = [index + offset for index in date_time_fields]
+
+        self.convert_date = functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)(
+            self._convert_date
+        )
+        self.convert_date_time = functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)(
+            self._convert_date_time
+        )
+
+    def _convert_date(self, value: str) -> str:
+        return date_to_iso(
+            _offset_date(self.target_anchor, self.current_anchor, iso_to_date(value))
+        )
+
+    def _convert_date_time(self, value: str) -> str:
+        # Salesforce datetimes only need their date portion shifted, which lets
+        # us share the (much smaller) date cache instead of parsing each value.
+        if SALESFORCE_TIME_SUFFIX.match(value, 10):
+            return self.convert_date(value[:10]) + value[10:]
+
+        return salesforce_from_datetime(
+            _offset_datetime(
+                self.target_anchor,
+                self.current_anchor,
+                datetime_from_salesforce(value),
+            )
+        )
+
+    def adjust_batch(self, records: List[List[Optional[str]]]):
+        """Adjust the date and datetime columns of a list of rows in place."""
+        for indexes, convert in (
+            (self.date_indexes, self.convert_date),
+            (self.date_time_indexes, self.convert_date_time),
+        ):
+            for index in indexes:
+                for record in records:
+                    value = record[index]
+                    if value:
+                        record[index] = convert(value)
+
+        return records
+
+    def adjust_records(self, records: Iterable[List], batch_size: int = 10000):
+        """Adjust an iterable of mutable rows in chunks of batch_size,
+        yielding each row once its chunk has been converted."""
+        records = iter(records)
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                return
+            yield from self.adjust_batch(batch)
+
+
 # The Salesforce API returns datetimes with millisecond resolution, but milliseconds
 # are always zero (that is, .000). Python does parse this with strptime.
 # Python renders datetimes into ISO8601 with microsecond resolution (.123456),
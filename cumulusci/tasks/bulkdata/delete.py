@@ -86,8 +86,7 @@ class DeleteData(BaseSalesforceApiTask):
         """Perform namespace injection and ensure that we can successfully delete all of the selected objects."""
 
         global_describe = {
-            entry["name"]: entry
-            for entry in self.org_config.salesforce_client.describe()["sobjects"]
+            entry["name"]: entry for entry in self.org_config.describe()["sobjects"]
         }
 
         # Namespace injection
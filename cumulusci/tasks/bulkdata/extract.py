@@ -14,6 +14,8 @@ from cumulusci.core.exceptions import TaskOptionsError, BulkDataException
 from cumulusci.tasks.bulkdata.utils import (
     SqlAlchemyMixin,
     create_table,
+    open_sql_script,
+    sqlite_dump_script,
 )
 from cumulusci.core.utils import process_bool_arg
 
@@ -23,7 +25,7 @@ from cumulusci.tasks.bulkdata.step import (
     DataOperationType,
     get_query_operation,
 )
-from cumulusci.tasks.bulkdata.dates import adjust_relative_dates
+from cumulusci.tasks.bulkdata.dates import RelativeDateAdjuster
 from cumulusci.utils import os_friendly_path, log_progress
 from cumulusci.tasks.bulkdata.mapping_parser import (
     parse_from_yaml,
@@ -45,7 +47,14 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
         },
         "sql_path": {
             "description": "If set, an SQL script will be generated at the path provided "
-            + "This is useful for keeping data in the repository and allowing diffs."
+            + "This is useful for keeping data in the repository and allowing diffs. "
+            + "If the path ends in .gz, the script is gzip compressed "
+            + "(or with .zst, Zstandard compressed, if the zstandard package is installed)."
+        },
+        "sql_rows_per_insert": {
+            "description": "The number of rows to write in each INSERT statement of the SQL script. "
+            + "Larger values make the script much smaller and faster to write and load. "
+            + "Defaults to 1 (one INSERT per row)."
         },
         "inject_namespaces": {
             "description": "If True, the package namespace prefix will be "
@@ -69,6 +78,12 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
                 "You must set either the database_url or sql_path option."
             )
 
+        self.options["sql_rows_per_insert"] = int(
+            self.options.get("sql_rows_per_insert") or 1
+        )
+        if self.options["sql_rows_per_insert"] < 1:
+            raise TaskOptionsError("sql_rows_per_insert must be a positive integer.")
+
         inject_namespaces = self.options.get("inject_namespaces")
         self.options["inject_namespaces"] = process_bool_arg(
             True if inject_namespaces is None else inject_namespaces
@@ -148,7 +163,10 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
             sobject=mapping.sf_object,
             api=mapping.api,
             fields=list(mapping.get_complete_field_map(include_id=True).keys()),
-            api_options={},
+            api_options={
+                "pk_chunking": mapping.pk_chunk_size,
+                "bulk_concurrency": mapping.bulk_concurrency,
+            },
             context=self,
             query=soql,
         )
@@ -188,12 +206,10 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
         if mapping.anchor_date:
             date_context = mapping.get_relative_date_context(self.org_config)
             if date_context[0] or date_context[1]:
-                record_iterator = (
-                    adjust_relative_dates(
-                        mapping, date_context, record, DataOperationType.QUERY
-                    )
-                    for record in record_iterator
+                date_adjuster = RelativeDateAdjuster(
+                    mapping, date_context, DataOperationType.QUERY
                 )
+                record_iterator = date_adjuster.adjust_records(record_iterator)
 
         # Set Name field as blank for Person Account "Account" records.
         if (
@@ -343,7 +359,9 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
 
     def _sqlite_dump(self):
         """Write a SQLite script output file."""
-        path = self.options["sql_path"]
-        with open(path, "w", encoding="utf-8") as f:
-            for line in self.session.connection().connection.iterdump():
-                f.write(line + "\n")
+        with open_sql_script(self.options["sql_path"], "w") as f:
+            sqlite_dump_script(
+                self.session.connection().connection,
+                f,
+                self.options["sql_rows_per_insert"],
+            )
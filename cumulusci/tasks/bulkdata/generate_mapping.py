@@ -1,5 +1,7 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
+import time
 
 import click
 import yaml
@@ -53,6 +55,9 @@ class GenerateMapping(BaseSalesforceApiTask):
 
     core_fields = ["Name", "FirstName", "LastName"]
 
+    # Number of sObject describes to request at once.
+    describe_concurrency = 10
+
     def _init_options(self, kwargs):
         super(GenerateMapping, self)._init_options(kwargs)
         if "namespace_prefix" not in self.options:
@@ -91,7 +96,7 @@ class GenerateMapping(BaseSalesforceApiTask):
         self.mapping_objects = self.options["include"]
 
         # Cache the global describe, which we'll walk.
-        self.global_describe = self.sf.describe()
+        self.global_describe = self.org_config.describe(sf=self.sf)
 
         sobject_names = set(obj["name"] for obj in self.global_describe["sobjects"])
 
@@ -104,9 +109,11 @@ class GenerateMapping(BaseSalesforceApiTask):
         # (a) custom, no namespace
         # (b) custom, with our namespace
         # (c) not ours (standard or other package), but have fields with our namespace or no namespace
-        self.describes = {}  # Cache per-object describes for efficiency
+        # Cache per-object describes for efficiency
+        self.describes = self._describe_sobjects(
+            [obj["name"] for obj in self.global_describe["sobjects"]]
+        )
         for obj in self.global_describe["sobjects"]:
-            self.describes[obj["name"]] = getattr(self.sf, obj["name"]).describe()
             if self._is_our_custom_api_name(obj["name"]) or self._has_our_custom_fields(
                 self.describes[obj["name"]]
             ):
@@ -138,6 +145,25 @@ class GenerateMapping(BaseSalesforceApiTask):
 
             index += 1
 
+    def _describe_sobjects(self, sobject_names):
+        """Fetch describes for all of the given sObjects concurrently,
+        returning a dict of describes keyed by sObject name."""
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.describe_concurrency) as executor:
+            describes = dict(
+                zip(
+                    sobject_names,
+                    executor.map(
+                        lambda name: self.org_config.describe(name, sf=self.sf),
+                        sobject_names,
+                    ),
+                )
+            )
+        self.logger.info(
+            f"Described {len(describes)} sObjects in {time.monotonic() - start:.1f}s"
+        )
+        return describes
+
     def _build_schema(self):
         """Convert self.mapping_objects into a schema, including field details and interobject references,
         in self.schema and self.refs"""
@@ -1,11 +1,14 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from unittest.mock import MagicMock
 from typing import Union
+import itertools
 import tempfile
+import threading
 from contextlib import contextmanager
 
 from sqlalchemy import Column, MetaData, Table, Unicode, create_engine, text, func
-from sqlalchemy.orm import aliased, Session
+from sqlalchemy.orm import aliased, scoped_session, sessionmaker, Session
 from sqlalchemy.ext.automap import automap_base
 
 from cumulusci.core.exceptions import BulkDataException, TaskOptionsError
@@ -13,8 +16,10 @@ from cumulusci.core.utils import process_bool_arg
 from cumulusci.tasks.bulkdata.utils import (
     SqlAlchemyMixin,
     RowErrorChecker,
+    open_sql_script,
+    sqlite_import_script,
 )
-from cumulusci.tasks.bulkdata.dates import adjust_relative_dates
+from cumulusci.tasks.bulkdata.dates import RelativeDateAdjuster
 from cumulusci.tasks.bulkdata.step import (
     DataOperationStatus,
     DataOperationType,
@@ -48,7 +53,8 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             "required": False,
         },
         "sql_path": {
-            "description": "If specified, a database will be created from an SQL script at the provided path"
+            "description": "If specified, a database will be created from an SQL script at the provided path. "
+            + "The script may be gzip (.gz) or Zstandard (.zst) compressed."
         },
         "ignore_row_errors": {
             "description": "If True, allow the load to continue even if individual rows fail to load."
@@ -68,6 +74,11 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         "drop_missing_schema": {
             "description": "Set to True to skip any missing objects or fields instead of stopping with an error."
         },
+        "max_concurrent_steps": {
+            "description": "The maximum number of mapping steps to load at the same time. "
+            "Steps are only run concurrently when they do not depend on one another. "
+            "Defaults to 1 (steps are loaded one at a time, in order)."
+        },
     }
     row_warning_limit = 10
 
@@ -101,37 +112,130 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         self.options["drop_missing_schema"] = process_bool_arg(
             self.options.get("drop_missing_schema") or False
         )
+        try:
+            self.max_concurrent_steps = int(
+                self.options.get("max_concurrent_steps") or 1
+            )
+        except ValueError:
+            raise TaskOptionsError("max_concurrent_steps must be an integer")
+        if self.max_concurrent_steps < 1:
+            raise TaskOptionsError("max_concurrent_steps must be at least 1")
+
+        # Serializes writes to the local database when steps run concurrently.
+        self._db_lock = threading.RLock()
 
     def _run_task(self):
         self._init_mapping()
         with self._init_db():
             self._expand_mapping()
 
-            start_step = self.options.get("start_step")
-            started = False
-            for name, mapping in self.mapping.items():
-                # Skip steps until start_step
-                if not started and start_step and name != start_step:
-                    self.logger.info(f"Skipping step: {name}")
-                    continue
-
-                started = True
-
-                self.logger.info(f"Running step: {name}")
-                result = self._execute_step(mapping)
-                if result.status is DataOperationStatus.JOB_FAILURE:
-                    raise BulkDataException(
-                        f"Step {name} did not complete successfully: {','.join(result.job_errors)}"
-                    )
+            steps = self._get_step_sequence()
+            if self.max_concurrent_steps > 1:
+                self._run_steps_concurrently(steps)
+            else:
+                for name, mapping, after in steps:
+                    self._run_step(name, mapping, after)
+
+    def _get_step_sequence(self):
+        """Return a list of (name, mapping, after) tuples for each step to run,
+        in load order. Post-load steps follow the step named by `after`."""
+        start_step = self.options.get("start_step")
+        started = False
+        steps = []
+        for name, mapping in self.mapping.items():
+            # Skip steps until start_step
+            if not started and start_step and name != start_step:
+                self.logger.info(f"Skipping step: {name}")
+                continue
+
+            started = True
+            steps.append((name, mapping, None))
+
+            if name in self.after_steps:
+                for after_name, after_step in self.after_steps[name].items():
+                    steps.append((after_name, after_step, name))
+
+        return steps
+
+    def _get_step_dependencies(self, steps):
+        """Given steps in load order, return a dict of step name to the set of
+        names of earlier steps that must complete before it can run.
+
+        A step depends upon each earlier step that loads a table it looks up or
+        that works with the same table or sObject. A post-load step also
+        depends upon the step it follows."""
+        dependencies = {}
+        for index, (name, mapping, after) in enumerate(steps):
+            lookup_tables = {
+                lookup.table for lookup in mapping.lookups.values() if not lookup.after
+            }
+            dependencies[name] = {
+                prior_name
+                for prior_name, prior_mapping, _ in steps[:index]
+                if prior_mapping.table in lookup_tables
+                or prior_mapping.table == mapping.table
+                or prior_mapping.sf_object == mapping.sf_object
+            }
+            if after:
+                dependencies[name].add(after)
+
+        return dependencies
+
+    def _run_steps_concurrently(self, steps):
+        """Run steps as soon as the steps they depend on have completed,
+        with at most max_concurrent_steps running at once.
+
+        If a step fails, no further steps are started; steps already
+        running are allowed to finish before the failure is raised."""
+        dependencies = self._get_step_dependencies(steps)
+        pending = list(steps)
+        running = {}
+        completed = set()
+        error = None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_steps) as executor:
+            while running or (pending and not error):
+                if not error:
+                    for step in list(pending):
+                        if len(running) >= self.max_concurrent_steps:
+                            break
+                        if dependencies[step[0]] <= completed:
+                            pending.remove(step)
+                            future = executor.submit(self._run_step_in_thread, *step)
+                            running[future] = step[0]
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        error = error or e
+                    else:
+                        completed.add(name)
+
+        if error:
+            raise error
+
+    def _run_step_in_thread(self, name, mapping, after):
+        try:
+            self._run_step(name, mapping, after)
+        finally:
+            # Release this worker thread's database session.
+            self.session.remove()
+
+    def _run_step(self, name, mapping, after=None):
+        """Run a single step, raising BulkDataException if the job fails."""
+        if after:
+            self.logger.info(f"Running post-load step: {name}")
+        else:
+            self.logger.info(f"Running step: {name}")
 
-                if name in self.after_steps:
-                    for after_name, after_step in self.after_steps[name].items():
-                        self.logger.info(f"Running post-load step: {after_name}")
-                        result = self._execute_step(after_step)
-                        if result.status is DataOperationStatus.JOB_FAILURE:
-                            raise BulkDataException(
-                                f"Step {after_name} did not complete successfully: {','.join(result.job_errors)}"
-                            )
+        result = self._execute_step(mapping)
+        if result.status is DataOperationStatus.JOB_FAILURE:
+            raise BulkDataException(
+                f"Step {name} did not complete successfully: {','.join(result.job_errors)}"
+            )
 
     def _execute_step(
         self, mapping: MappingStep
@@ -139,16 +243,21 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         """Load data for a single step."""
 
         if "RecordTypeId" in mapping.fields:
-            conn = self.session.connection()
-            self._load_record_types([mapping.sf_object], conn)
-            self.session.commit()
+            with self._db_lock:
+                conn = self.session.connection()
+                self._load_record_types([mapping.sf_object], conn)
+                self.session.commit()
 
         query = self._query_db(mapping)
         bulk_mode = mapping.bulk_mode or self.bulk_mode or "Parallel"
         step = get_dml_operation(
             sobject=mapping.sf_object,
             operation=mapping.action,
-            api_options={"batch_size": mapping.batch_size, "bulk_mode": bulk_mode},
+            api_options={
+                "batch_size": mapping.batch_size,
+                "bulk_mode": bulk_mode,
+                "bulk_concurrency": mapping.bulk_concurrency,
+            },
             context=self,
             fields=mapping.get_field_list(),
             api=mapping.api,
@@ -162,7 +271,8 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
 
             if step.job_result.status is not DataOperationStatus.JOB_FAILURE:
                 local_ids.seek(0)
-                self._process_job_results(mapping, step, local_ids)
+                with self._db_lock:
+                    self._process_job_results(mapping, step, local_ids)
 
             return step.job_result
 
@@ -172,26 +282,37 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         statics = self._get_statics(mapping)
         total_rows = 0
 
+        date_adjuster = None
         if mapping.anchor_date:
             date_context = mapping.get_relative_date_context(self.org_config)
-
-        for row in query.yield_per(10000):
-            total_rows += 1
-            # Add static values to row
-            pkey = row[0]
-            row = list(row[1:]) + statics
-            if mapping.anchor_date and (date_context[0] or date_context[1]):
-                row = adjust_relative_dates(
-                    mapping, date_context, row, DataOperationType.INSERT
+            if date_context[0] or date_context[1]:
+                date_adjuster = RelativeDateAdjuster(
+                    mapping, date_context, DataOperationType.INSERT
                 )
-            if mapping.action is DataOperationType.UPDATE:
-                if len(row) > 1 and all([f is None for f in row[1:]]):
-                    # Skip update rows that contain no values
-                    total_rows -= 1
-                    continue
 
-            local_ids.write(str(pkey) + "\n")
-            yield row
+        batch_size = 10000
+        query_results = iter(query.yield_per(batch_size))
+        while True:
+            batch = list(itertools.islice(query_results, batch_size))
+            if not batch:
+                break
+
+            # Add static values to rows
+            rows = [list(row[1:]) + statics for row in batch]
+            if date_adjuster:
+                date_adjuster.adjust_batch(rows)
+
+            for db_row, row in zip(batch, rows):
+                pkey = db_row[0]
+                total_rows += 1
+                if mapping.action is DataOperationType.UPDATE:
+                    if len(row) > 1 and all([f is None for f in row[1:]]):
+                        # Skip update rows that contain no values
+                        total_rows -= 1
+                        continue
+
+                local_ids.write(str(pkey) + "\n")
+                yield row
 
         self.logger.info(
             f"Prepared {total_rows} rows for {mapping['action']} to {mapping['sf_object']}."
@@ -398,13 +519,8 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
     def _sqlite_load(self):
         """Read a SQLite script and initialize the in-memory database."""
         conn = self.session.connection()
-        cursor = conn.connection.cursor()
-        with open(self.options["sql_path"], "r", encoding="utf-8") as f:
-            try:
-                cursor.executescript(f.read())
-            finally:
-                cursor.close()
-        # self.session.flush()
+        with open_sql_script(self.options["sql_path"]) as f:
+            sqlite_import_script(conn.connection, f)
 
     @contextmanager
     def _init_db(self):
@@ -414,7 +530,17 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             self.engine = create_engine(database_url)
 
             # initialize the DB session
-            self.session = Session(self.engine)
+            if self.max_concurrent_steps > 1 and self._is_in_memory_sqlite():
+                self.logger.warning(
+                    "Steps cannot be loaded concurrently from an in-memory database. "
+                    "Loading steps one at a time."
+                )
+                self.max_concurrent_steps = 1
+            if self.max_concurrent_steps > 1:
+                # Each worker thread gets its own session and connection.
+                self.session = scoped_session(sessionmaker(bind=self.engine))
+            else:
+                self.session = Session(self.engine)
 
             if self.options.get("sql_path"):
                 self._sqlite_load()
@@ -441,7 +567,32 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             self.metadata.create_all()
 
             self._validate_org_has_person_accounts_enabled_if_person_account_data_exists()
+
+            if self.max_concurrent_steps > 1 and self.engine.name == "sqlite":
+                # Write-ahead logging lets steps read the database
+                # while another step stores its results.
+                with self._sqlite_journal_mode("WAL"):
+                    yield
+            else:
+                yield
+
+    def _is_in_memory_sqlite(self):
+        return self.engine.name == "sqlite" and self.engine.url.database in (
+            None,
+            "",
+            ":memory:",
+        )
+
+    @contextmanager
+    def _sqlite_journal_mode(self, journal_mode):
+        """Temporarily switch a SQLite database to the given journal mode."""
+        previous_mode = self.engine.execute("PRAGMA journal_mode").scalar()
+        self.engine.execute(f"PRAGMA journal_mode={journal_mode}")
+        try:
             yield
+        finally:
+            self.session.remove()
+            self.engine.execute(f"PRAGMA journal_mode={previous_mode}")
 
     def _init_mapping(self):
         """Load a YAML mapping file."""
@@ -81,6 +81,8 @@ class MappingStep(CCIDictModel):
     bulk_mode: Optional[
         Literal["Serial", "Parallel"]
     ] = None  # default should come from task options
+    bulk_concurrency: int = 1
+    pk_chunk_size: Optional[int] = None
     anchor_date: Optional[str] = None
 
     def get_oid_as_pk(self):
@@ -118,7 +120,7 @@ class MappingStep(CCIDictModel):
         return fields
 
     def get_fields_by_type(self, field_type: str, org_config: OrgConfig):
-        describe = getattr(org_config.salesforce_client, self.sf_object).describe()
+        describe = org_config.describe(self.sf_object)
         describe = CaseInsensitiveDict(
             {entry["name"]: entry for entry in describe["fields"]}
         )
@@ -171,6 +173,18 @@ class MappingStep(CCIDictModel):
         assert v <= 200 and v > 0
         return v
 
+    @validator("bulk_concurrency")
+    @classmethod
+    def validate_bulk_concurrency(cls, v):
+        assert v > 0
+        return v
+
+    @validator("pk_chunk_size")
+    @classmethod
+    def validate_pk_chunk_size(cls, v):
+        assert v is None or (v > 0 and v <= 250000)
+        return v
+
     @validator("anchor_date")
     @classmethod
     def validate_anchor_date(cls, v):
@@ -394,10 +408,7 @@ class MappingStep(CCIDictModel):
             inject = strip = None
 
         global_describe = CaseInsensitiveDict(
-            {
-                entry["name"]: entry
-                for entry in org_config.salesforce_client.describe()["sobjects"]
-            }
+            {entry["name"]: entry for entry in org_config.describe()["sobjects"]}
         )
 
         if not self._validate_sobject(global_describe, inject, operation):
@@ -406,7 +417,7 @@ class MappingStep(CCIDictModel):
 
         # Validate, inject, and drop (if configured) fields.
         # By this point, we know the attribute is valid.
-        describe = getattr(org_config.salesforce_client, self.sf_object).describe()
+        describe = org_config.describe(self.sf_object)
         describe = CaseInsensitiveDict(
             {entry["name"]: entry for entry in describe["fields"]}
         )
@@ -480,7 +491,7 @@ def validate_and_inject_mapping(
 
         # Remove any remaining lookups to dropped objects.
         for m in mapping.values():
-            describe = getattr(org_config.salesforce_client, m.sf_object).describe()
+            describe = org_config.describe(m.sf_object)
             describe = {entry["name"]: entry for entry in describe["fields"]}
 
             for field in list(m.lookups.keys()):
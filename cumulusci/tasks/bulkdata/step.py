@@ -1,11 +1,11 @@
 from abc import ABCMeta, abstractmethod
-from collections import namedtuple
-from contextlib import contextmanager
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager, ExitStack
 import csv
 from enum import Enum
 import io
-import os
-import pathlib
+import itertools
 import tempfile
 import time
 from typing import Dict, Any, List
@@ -16,6 +16,7 @@ import requests
 from cumulusci.core.exceptions import BulkDataException
 from cumulusci.core.utils import process_bool_arg
 from cumulusci.tasks.bulkdata.utils import get_batch_iterator
+from cumulusci.utils.waiting import retry
 
 
 class DataOperationType(Enum):
@@ -53,36 +54,189 @@ DataOperationJobResult = namedtuple(
 )
 
 
+class ResumableDownload(io.RawIOBase):
+    """A readable byte stream over a Bulk API result file.
+
+    Bytes are read straight from the HTTP response as they arrive. If the
+    connection drops, the remainder of the file is downloaded into a spooled
+    temporary file, resuming from the last byte received, and reading
+    continues from there."""
+
+    chunk_size = 65536
+    spool_max_size = 10 * 1024 * 1024
+
+    def __init__(self, uri, bulk_api):
+        self.uri = uri
+        self.bulk_api = bulk_api
+        self.position = 0
+        self.buffer = memoryview(b"")
+        self.spool = None
+
+        self.response = requests.get(uri, headers=bulk_api.headers(), stream=True)
+        self.response.raise_for_status()
+        self.chunks = self.response.iter_content(chunk_size=self.chunk_size)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self.buffer:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                return 0
+            except requests.exceptions.RequestException:
+                if self.spool is not None:
+                    raise
+                self._resume()
+                continue
+
+            self.position += len(chunk)
+            self.buffer = memoryview(chunk)
+
+        count = min(len(b), len(self.buffer))
+        b[:count] = self.buffer[:count]
+        self.buffer = self.buffer[count:]
+        return count
+
+    def _resume(self):
+        """Download the rest of the file, from the current position, into a spooled file."""
+        self.response.close()
+        self.spool = retry(
+            self._download_remainder,
+            should_retry=lambda e: isinstance(e, requests.exceptions.RequestException),
+            retries=3,
+            retry_interval=1,
+            retry_interval_add=2,
+        )
+        self.chunks = iter(lambda: self.spool.read(self.chunk_size), b"")
+
+    def _download_remainder(self):
+        # Ask for unencoded content so that byte ranges match the decoded bytes already read.
+        headers = self.bulk_api.headers(
+            {"Range": f"bytes={self.position}-", "Accept-Encoding": "identity"}
+        )
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_max_size)
+        try:
+            with requests.get(self.uri, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                # Servers that don't support ranges send the whole file again.
+                skip = self.position if response.status_code != 206 else 0
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if skip:
+                        skipped = min(skip, len(chunk))
+                        chunk = chunk[skipped:]
+                        skip -= skipped
+                    spool.write(chunk)
+        except Exception:
+            spool.close()
+            raise
+
+        spool.seek(0)
+        return spool
+
+    def close(self):
+        self.response.close()
+        if self.spool is not None:
+            self.spool.close()
+        super().close()
+
+
 @contextmanager
 def download_file(uri, bulk_api):
+    """Stream the Bulk API result file for a single batch,
+    decoding it as it is read."""
+    with ResumableDownload(uri, bulk_api) as stream:
+        yield io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8", newline="")
+
+
+class _SpoolReader(io.RawIOBase):
+    """A readable byte stream over a SpooledTemporaryFile, which doesn't
+    implement the full io interface itself."""
+
+    def __init__(self, spool):
+        self.spool = spool
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self.spool.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self.spool.close()
+        super().close()
+
+
+@contextmanager
+def spool_file(uri, bulk_api):
     """Download the Bulk API result file for a single batch,
-    and remove it when the context manager exits."""
-    try:
-        (handle, path) = tempfile.mkstemp(text=False)
-        resp = requests.get(uri, headers=bulk_api.headers(), stream=True)
-        resp.raise_for_status()
-        f = os.fdopen(handle, "wb")
-        for chunk in resp.iter_content(chunk_size=None):
-            f.write(chunk)
-
-        f.close()
-        with open(path, "r", newline="", encoding="utf-8") as f:
-            yield f
-    finally:
-        pathlib.Path(path).unlink()
+    and discard it when the context manager exits.
+
+    The file is kept in memory unless it is larger than
+    ResumableDownload.spool_max_size."""
+    spool = tempfile.SpooledTemporaryFile(max_size=ResumableDownload.spool_max_size)
+    with io.TextIOWrapper(
+        io.BufferedReader(_SpoolReader(spool)), encoding="utf-8", newline=""
+    ) as f:
+        with requests.get(uri, headers=bulk_api.headers(), stream=True) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_content(chunk_size=ResumableDownload.chunk_size):
+                spool.write(chunk)
+        spool.seek(0)
+        yield f
+
+
+def prefetch_file(uri, bulk_api):
+    """Download a Bulk API result file, returning the open file
+    and an ExitStack which discards it when closed.
+
+    The whole file is spooled before returning, so downloads
+    can run in worker threads ahead of the code that reads them."""
+    with ExitStack() as stack:
+        f = stack.enter_context(spool_file(uri, bulk_api))
+        return stack.pop_all(), f
 
 
 class BulkJobMixin:
     """Provides mixin utilities for classes that manage Bulk API jobs."""
 
+    # With PK Chunking, the original batch of a query job is never processed;
+    # its results are delivered by the chunk batches Salesforce creates.
+    pk_chunking = False
+
     def _job_state_from_batches(self, job_id):
         """Query for batches under job_id and return overall status
         inferred from batch-level status values."""
         uri = f"{self.bulk.endpoint}/job/{job_id}/batch"
         response = requests.get(uri, headers=self.bulk.headers())
         response.raise_for_status()
+        self._process_batch_info(response.content)
         return self._parse_job_state(response.content)
 
+    def _process_batch_info(self, xml):
+        """Hook for subclasses to act upon batch-level status while a job is polled."""
+        pass
+
+    def _get_batch_states(self, job_id):
+        """Return a dict of batch id to state for every batch under job_id."""
+        uri = f"{self.bulk.endpoint}/job/{job_id}/batch"
+        response = requests.get(uri, headers=self.bulk.headers())
+        response.raise_for_status()
+        return self._parse_batch_states(response.content)
+
+    def _parse_batch_states(self, xml):
+        """Parse the Bulk API batch info list into a dict of batch id to state."""
+        tree = ET.fromstring(xml)
+        return {
+            el.findtext("{%s}id" % self.bulk.jobNS): el.findtext(
+                "{%s}state" % self.bulk.jobNS
+            )
+            for el in tree.iterfind(".//{%s}batchInfo" % self.bulk.jobNS)
+        }
+
     def _parse_job_state(self, xml):
         """Parse the Bulk API return value and generate a summary status record for the job."""
         tree = ET.fromstring(xml)
@@ -91,13 +245,18 @@ class BulkJobMixin:
             el.text for el in tree.iterfind(".//{%s}stateMessage" % self.bulk.jobNS)
         ]
 
-        failures = tree.find(".//{%s}numberRecordsFailed" % self.bulk.jobNS)
-        record_failure_count = int(failures.text) if failures is not None else 0
-        processed = tree.find(".//{%s}numberRecordsProcessed" % self.bulk.jobNS)
-        records_processed = int(processed.text) if processed is not None else 0
+        record_failure_count = sum(
+            int(el.text)
+            for el in tree.iterfind(".//{%s}numberRecordsFailed" % self.bulk.jobNS)
+        )
+        records_processed = sum(
+            int(el.text)
+            for el in tree.iterfind(".//{%s}numberRecordsProcessed" % self.bulk.jobNS)
+        )
+
+        if self.pk_chunking:
+            statuses = [status for status in statuses if status != "Not Processed"]
 
-        # FIXME: "Not Processed" to be expected for original batch with PK Chunking Query
-        # PK Chunking is not currently supported.
         if "Not Processed" in statuses:
             return DataOperationJobResult(
                 DataOperationStatus.ABORTED, [], records_processed, record_failure_count
@@ -196,31 +355,91 @@ class BaseQueryOperation(BaseDataOperation, metaclass=ABCMeta):
 class BulkApiQueryOperation(BaseQueryOperation, BulkJobMixin):
     """Operation class for Bulk API query jobs."""
 
+    def __init__(self, *, sobject, api_options, context, query):
+        super().__init__(
+            sobject=sobject, api_options=api_options, context=context, query=query
+        )
+        # pk_chunking may be True, to use Salesforce's default chunk size,
+        # or the number of records per chunk.
+        self.pk_chunking = self.api_options.get("pk_chunking") or False
+        self.concurrency = self.api_options.get("bulk_concurrency") or 1
+
     def query(self):
-        self.job_id = self.bulk.create_query_job(self.sobject, contentType="CSV")
+        if self.pk_chunking:
+            self.job_id = self.bulk.create_query_job(
+                self.sobject, contentType="CSV", pk_chunking=self.pk_chunking
+            )
+        else:
+            self.job_id = self.bulk.create_query_job(self.sobject, contentType="CSV")
         self.logger.info(f"Created Bulk API query job {self.job_id}")
         self.batch_id = self.bulk.query(self.job_id, self.soql)
 
         self.job_result = self._wait_for_job(self.job_id)
         self.bulk.close_job(self.job_id)
 
-    def get_results(self):
-        # FIXME: For PK Chunking, need to get new batch Ids
-        # and retrieve their results. Original batch will not be processed.
+    def _get_result_batch_ids(self):
+        """Return the ids of the batches holding this query's results."""
+        if not self.pk_chunking:
+            return [self.batch_id]
 
-        result_ids = self.bulk.get_query_batch_result_ids(
-            self.batch_id, job_id=self.job_id
-        )
-        for result_id in result_ids:
-            uri = f"{self.bulk.endpoint}/job/{self.job_id}/batch/{self.batch_id}/result/{result_id}"
+        # Chunk batches are listed in the order they were created, which follows the PK ranges.
+        return [
+            batch_id
+            for batch_id in self._get_batch_states(self.job_id)
+            if batch_id != self.batch_id
+        ]
 
-            with download_file(uri, self.bulk) as f:
-                reader = csv.reader(f)
-                self.headers = next(reader)
-                if "Records not found for this query" in self.headers:
-                    return
+    def _get_result_uris(self):
+        for batch_id in self._get_result_batch_ids():
+            result_ids = self.bulk.get_query_batch_result_ids(
+                batch_id, job_id=self.job_id
+            )
+            for result_id in result_ids:
+                yield f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result/{result_id}"
 
-                yield from reader
+    def get_results(self):
+        uris = self._get_result_uris()
+        if self.concurrency > 1:
+            yield from self._get_prefetched_results(uris)
+        else:
+            for uri in uris:
+                with download_file(uri, self.bulk) as f:
+                    yield from self._read_results(f)
+
+    def _get_prefetched_results(self, uris):
+        """Yield rows from every result file in order, downloading up to
+        `concurrency` files ahead of the rows being read."""
+        downloads = deque()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                for uri in itertools.islice(uris, self.concurrency):
+                    downloads.append(executor.submit(prefetch_file, uri, self.bulk))
+
+                while downloads:
+                    stack, f = downloads.popleft().result()
+                    uri = next(uris, None)
+                    if uri is not None:
+                        downloads.append(executor.submit(prefetch_file, uri, self.bulk))
+
+                    with stack:
+                        yield from self._read_results(f)
+            finally:
+                # Remove any files downloaded ahead of an early exit.
+                for future in downloads:
+                    try:
+                        stack, f = future.result()
+                    except Exception:
+                        continue
+                    stack.close()
+
+    def _read_results(self, f):
+        reader = csv.reader(f)
+        self.headers = next(reader)
+        if "Records not found for this query" in self.headers:
+            return
+
+        yield from reader
 
 
 class RestApiQueryOperation(BaseQueryOperation):
@@ -303,6 +522,14 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         )
         self.csv_buff = io.StringIO(newline="")
         self.csv_writer = csv.writer(self.csv_buff)
+        self.batch_ids = []
+        # Batches are uploaded, and (with a concurrency above 1) the results of
+        # the first few downloaded while the job runs, by a bounded pool of
+        # worker threads. The pool is started when the first batch is uploaded
+        # and shut down by end(), or when the upload fails.
+        self.concurrency = self.api_options.get("bulk_concurrency") or 1
+        self.executor = None
+        self.result_downloads = {}
 
     def start(self):
         self.job_id = self.bulk.create_job(
@@ -313,15 +540,166 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         )
 
     def end(self):
-        self.bulk.close_job(self.job_id)
-        self.job_result = self._wait_for_job(self.job_id)
+        """Close the job and wait for it to finish.
+
+        Result downloads still running when the job finishes are waited for.
+        If the job didn't succeed, callers don't read its results, so any
+        downloaded result files are removed."""
+        try:
+            self.bulk.close_job(self.job_id)
+            self.job_result = self._wait_for_job(self.job_id)
+        except BaseException:
+            self._discard_results()
+            raise
+        finally:
+            self._shutdown_executor()
+
+        if self.job_result.status not in (
+            DataOperationStatus.SUCCESS,
+            DataOperationStatus.ROW_FAILURE,
+        ):
+            self._discard_results()
+
+    def _submit(self, fn, *args):
+        """Run fn in the worker pool, starting the pool if needed."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        return self.executor.submit(fn, *args)
+
+    def _shutdown_executor(self):
+        """Stop the worker pool once the tasks it's running have finished."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def _discard_results(self):
+        """Cancel result downloads that haven't been read, and remove the
+        files of those that already finished."""
+        downloads, self.result_downloads = self.result_downloads, {}
+        for future in downloads.values():
+            if future.cancel():
+                continue
+            try:
+                stack, f = future.result()
+            except Exception:
+                continue  # Nothing was left on disk
+            stack.close()
 
     def load_records(self, records):
-        self.batch_ids = []
+        """Serialize records into batches and upload them concurrently.
+
+        At most `concurrency` batches are held in memory awaiting upload at any time.
+        Batch ids are recorded in the order the batches were serialized, so that
+        results line up with the order of the input records."""
+        futures = []
+        in_flight = set()
+
+        try:
+            for count, csv_batch in enumerate(self._batch(records)):
+                if len(in_flight) >= self.concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()  # Surface upload errors promptly
+
+                self.context.logger.info(f"Uploading batch {count + 1}")
+                future = self._submit(
+                    self.bulk.post_batch, self.job_id, iter(csv_batch)
+                )
+                futures.append(future)
+                in_flight.add(future)
+
+            self.batch_ids = [future.result() for future in futures]
+        except BaseException:
+            # end() won't be called, so stop the pool here.
+            for future in futures:
+                future.cancel()
+            self._shutdown_executor()
+            raise
+
+    def _process_batch_info(self, xml):
+        """Begin downloading the results of the first `concurrency` batches,
+        which get_results() reads first, as soon as each completes.
+
+        With a concurrency of 1, nothing is downloaded ahead; get_results()
+        streams each result file instead."""
+        if self.concurrency == 1:
+            return
+        states = self._parse_batch_states(xml)
+        for batch_id in self.batch_ids[: self.concurrency]:
+            if (
+                states.get(batch_id) == "Completed"
+                and batch_id not in self.result_downloads
+            ):
+                self.result_downloads[batch_id] = self._submit(
+                    self._prefetch_results, batch_id
+                )
+
+    def _get_results_url(self, batch_id):
+        return f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result"
+
+    def _prefetch_results(self, batch_id):
+        """Download the result file for a batch in a worker thread."""
+        result = prefetch_file(self._get_results_url(batch_id), self.bulk)
+        self.logger.info(f"Downloaded results for batch {batch_id}")
+        return result
+
+    @contextmanager
+    def _stream_results(self, batch_id):
+        """Yield the result file for a batch, streamed as it is read."""
+        with download_file(self._get_results_url(batch_id), self.bulk) as f:
+            self.logger.info(f"Downloaded results for batch {batch_id}")
+            yield f
+
+    @contextmanager
+    def _prefetched_results(self, future):
+        """Yield the result file downloaded by future, removing it afterwards."""
+        stack, f = future.result()
+        with stack:
+            yield f
+
+    def _get_result_files(self):
+        """Yield each batch's id and a context manager that opens its result
+        file, in batch order.
 
-        for count, csv_batch in enumerate(self._batch(records)):
-            self.context.logger.info(f"Uploading batch {count + 1}")
-            self.batch_ids.append(self.bulk.post_batch(self.job_id, iter(csv_batch)))
+        With a concurrency above 1, up to `concurrency` result files are
+        downloaded ahead of the one being read, starting with any that were
+        prefetched while the job was polled."""
+        if self.concurrency == 1:
+            for batch_id in self.batch_ids:
+                yield batch_id, self._stream_results(batch_id)
+            return
+
+        batch_ids = iter(self.batch_ids)
+        downloads = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+
+            def fetch(batch_id):
+                future = self.result_downloads.pop(batch_id, None)
+                if future is None:
+                    future = executor.submit(self._prefetch_results, batch_id)
+                downloads.append((batch_id, future))
+
+            try:
+                for batch_id in itertools.islice(batch_ids, self.concurrency):
+                    fetch(batch_id)
+
+                while downloads:
+                    batch_id, future = downloads.popleft()
+                    next_batch_id = next(batch_ids, None)
+                    if next_batch_id is not None:
+                        fetch(next_batch_id)
+
+                    yield batch_id, self._prefetched_results(future)
+            finally:
+                # Remove any files downloaded ahead of an early exit.
+                for batch_id, future in downloads:
+                    if future.cancel():
+                        continue
+                    try:
+                        stack, f = future.result()
+                    except Exception:
+                        continue
+                    stack.close()
 
     def _batch(self, records, n=10000, char_limit=10000000):
         """Given an iterator of records, yields batches of
@@ -371,30 +749,29 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         return serialized
 
     def get_results(self):
-        for batch_id in self.batch_ids:
-            try:
-                results_url = (
-                    f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result"
-                )
-                # Download entire result file to a temporary file first
-                # to avoid the server dropping connections
-                with download_file(results_url, self.bulk) as f:
-                    self.logger.info(f"Downloaded results for batch {batch_id}")
-
-                    reader = csv.reader(f)
-                    next(reader)  # skip header
-
-                    for row in reader:
-                        success = process_bool_arg(row[1])
-                        yield DataOperationResult(
-                            row[0] if success else None,
-                            success,
-                            row[3] if not success else None,
-                        )
-            except Exception as e:
-                raise BulkDataException(
-                    f"Failed to download results for batch {batch_id} ({str(e)})"
-                )
+        try:
+            for batch_id, result_file in self._get_result_files():
+                try:
+                    with result_file as f:
+                        reader = csv.reader(f)
+                        next(reader)  # skip header
+
+                        for row in reader:
+                            success = process_bool_arg(row[1])
+                            yield DataOperationResult(
+                                row[0] if success else None,
+                                success,
+                                row[3] if not success else None,
+                            )
+                except Exception as e:
+                    raise BulkDataException(
+                        f"Failed to download results for batch {batch_id} ({str(e)})"
+                    )
+        finally:
+            # Remove the files of any batches left unread if the caller
+            # stopped early.
+            self._discard_results()
+            self._shutdown_executor()
 
 
 class RestApiDmlOperation(BaseDmlOperation):
@@ -412,7 +789,7 @@ class RestApiDmlOperation(BaseDmlOperation):
         # Because we send values in JSON, we must convert Booleans and nulls
         describe = {
             field["name"]: field
-            for field in getattr(context.sf, sobject).describe()["fields"]
+            for field in context.org_config.describe(sobject, sf=context.sf)["fields"]
         }
         self.boolean_fields = [f for f in fields if describe[f]["type"] == "boolean"]
 
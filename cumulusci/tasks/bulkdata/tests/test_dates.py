@@ -1,6 +1,7 @@
 from datetime import datetime, date, timedelta
 from cumulusci.tasks.bulkdata.dates import (
     adjust_relative_dates,
+    RelativeDateAdjuster,
     datetime_from_salesforce,
     salesforce_from_datetime,
 )
@@ -114,3 +115,47 @@ class TestRelativeDates:
             )
             == ["001000000000000", salesforce_from_datetime(target)]
         )
+
+
+class TestRelativeDateAdjuster:
+    def test_adjust_batch__matches_adjust_relative_dates(self):
+        mapping = MappingStep(
+            sf_object="Account",
+            fields=["Some_Date__c", "Some_Datetime__c"],
+            anchor_date="2020-07-01",
+        )
+        context = ([0], [1], date.today())
+        records = [
+            ["2020-07-08", "2020-07-08T09:37:57.373+0000"],
+            ["2020-07-08", "2020-06-30T23:59:59.000+0000"],
+            ["", None],
+            ["2019-12-31", "2020-07-01T00:00:00.000+00:00"],
+        ]
+
+        expected = [
+            adjust_relative_dates(mapping, context, r, DataOperationType.INSERT)
+            for r in records
+        ]
+        adjuster = RelativeDateAdjuster(mapping, context, DataOperationType.INSERT)
+
+        assert adjuster.adjust_batch(records) == expected
+        # Rows are adjusted in place.
+        assert records == expected
+        # Repeated values are served from the cache.
+        assert adjuster.convert_date.cache_info().hits >= 2
+
+    def test_adjust_records__extract(self):
+        mapping = MappingStep(
+            sf_object="Account", fields=["Some_Date__c"], anchor_date="2020-07-01"
+        )
+        context = ([0], [], date.today())
+        input_date = (date.today() + timedelta(days=7)).isoformat()
+        target = (mapping.anchor_date + timedelta(days=7)).isoformat()
+        adjuster = RelativeDateAdjuster(mapping, context, DataOperationType.QUERY)
+
+        records = (["001000000000000", input_date] for _ in range(5))
+
+        assert (
+            list(adjuster.adjust_records(records, batch_size=2))
+            == [["001000000000000", target]] * 5
+        )
@@ -13,7 +13,7 @@ from cumulusci.tasks.bulkdata.step import (
     DataOperationType,
     DataApi,
 )
-from cumulusci.tasks.bulkdata.tests.utils import _make_task
+from cumulusci.tasks.bulkdata.tests.utils import _make_task, mock_org_config
 from cumulusci.tests.util import mock_describe_calls
 
 
@@ -334,7 +334,7 @@ class TestDeleteData(unittest.TestCase):
     def test_validate_and_inject_namespace__packaged(self):
         task = _make_task(DeleteData, {"options": {"objects": "Contact,Test__c"}})
         task.project_config.project__package__namespace = "ns"
-        task.org_config = mock.Mock()
+        task.org_config = mock_org_config()
         task.org_config.salesforce_client.describe.return_value = {
             "sobjects": [
                 {"name": "ns__Test__c", "deletable": True},
@@ -349,7 +349,7 @@ class TestDeleteData(unittest.TestCase):
     def test_validate_and_inject_namespace__packaged_and_not(self):
         task = _make_task(DeleteData, {"options": {"objects": "Contact,Test__c"}})
         task.project_config.project__package__namespace = "ns"
-        task.org_config = mock.Mock()
+        task.org_config = mock_org_config()
         task.org_config.salesforce_client.describe.return_value = {
             "sobjects": [
                 {"name": "Test__c", "deletable": True},
@@ -1,5 +1,7 @@
 from datetime import date, timedelta
+import gzip
 import os
+import sqlite3
 from unittest import mock
 from tempfile import TemporaryDirectory
 from contextlib import contextmanager
@@ -20,6 +22,7 @@ from cumulusci.tasks.bulkdata.step import (
     DataApi,
 )
 from cumulusci.tasks.bulkdata.tests.utils import _make_task
+from cumulusci.tasks.bulkdata.utils import open_sql_script, sqlite_import_script
 from cumulusci.tests.util import assert_max_memory_usage
 from cumulusci.utils import temporary_dir
 from cumulusci.tasks.bulkdata.mapping_parser import MappingLookup, MappingStep
@@ -229,6 +232,65 @@ class TestExtractData:
                 "sqlite:///"
             ), ce_mock.mock_calls[0][1][0]
 
+    @responses.activate
+    @mock.patch("cumulusci.tasks.bulkdata.extract.get_query_operation")
+    def test_run__sql__gzip(self, query_op_mock):
+        base_path = os.path.dirname(__file__)
+        mapping_path = os.path.join(base_path, self.mapping_file_v1)
+        mock_describe_calls()
+
+        with temporary_dir():
+            task = _make_task(
+                ExtractData,
+                {
+                    "options": {
+                        "sql_path": "testdata.sql.gz",
+                        "sql_rows_per_insert": "10",
+                        "mapping": mapping_path,
+                    }
+                },
+            )
+            task.bulk = mock.Mock()
+            task.sf = mock.Mock()
+            task.org_config._is_person_accounts_enabled = False
+
+            mock_query_households = MockBulkQueryOperation(
+                sobject="Account",
+                api_options={},
+                context=task,
+                query="SELECT Id FROM Account",
+            )
+            mock_query_contacts = MockBulkQueryOperation(
+                sobject="Contact",
+                api_options={},
+                context=task,
+                query="SELECT Id, FirstName, LastName, Email, AccountId FROM Contact",
+            )
+            mock_query_households.results = [["1"]]
+            mock_query_contacts.results = [
+                ["2", "First☃", "Last", "test@example.com", "1"],
+                ["3", "First", "O'Last", "test3@example.com", "1"],
+            ]
+            query_op_mock.side_effect = [mock_query_households, mock_query_contacts]
+
+            task()
+
+            with gzip.open("testdata.sql.gz", "rt", encoding="utf-8") as f:
+                sql = f.read()
+            assert (
+                'INSERT INTO "contacts" VALUES\n'
+                "('2','First☃','Last','test@example.com','1'),\n"
+                "('3','First','O''Last','test3@example.com','1');\n"
+            ) in sql
+
+            conn = sqlite3.connect(":memory:")
+            with open_sql_script("testdata.sql.gz") as f:
+                sqlite_import_script(conn, f)
+            assert conn.execute("SELECT last_name FROM contacts").fetchall() == [
+                ("Last",),
+                ("O'Last",),
+            ]
+
     @responses.activate
     @mock.patch("cumulusci.tasks.bulkdata.extract.get_query_operation")
     def test_run__v2__person_accounts_disabled(self, query_op_mock):
@@ -818,7 +880,7 @@ class TestExtractData:
             sobject="Contact",
             fields=["Id"],
             api=DataApi.SMART,
-            api_options={},
+            api_options={"pk_chunking": None, "bulk_concurrency": 1},
             context=task,
             query="SELECT Id FROM Contact",
         )
@@ -843,7 +905,7 @@ class TestExtractData:
             sobject="Contact",
             fields=["Id"],
             api=DataApi.SMART,
-            api_options={},
+            api_options={"pk_chunking": None, "bulk_concurrency": 1},
             context=task,
             query="SELECT Id FROM Contact",
         )
@@ -866,6 +928,19 @@ class TestExtractData:
         with pytest.raises(TaskOptionsError):
             _make_task(ExtractData, {"options": {}})
 
+    def test_init_options__sql_rows_per_insert(self):
+        with pytest.raises(TaskOptionsError):
+            _make_task(
+                ExtractData,
+                {
+                    "options": {
+                        "sql_path": "testdata.sql",
+                        "sql_rows_per_insert": "-1",
+                        "mapping": "mapping.yml",
+                    }
+                },
+            )
+
     @mock.patch("cumulusci.tasks.bulkdata.extract.log_progress")
     def test_extract_respects_key_field(self, log_mock):
         task = _make_task(
@@ -305,6 +305,27 @@ class TestMappingGenerator(unittest.TestCase):
 
         self.assertEqual(set(["Account", "Custom__c"]), set(t.mapping_objects))
 
+    @responses.activate
+    def test_collect_objects__describes_concurrently(self):
+        t = _make_task(GenerateMapping, {"options": {"path": "t"}})
+        t.project_config.project__package__api_version = "45.0"
+        t.describe_concurrency = 3
+
+        describe_data = {
+            f"Custom{i}__c": {"fields": [self._mock_field("Name")]} for i in range(10)
+        }
+
+        self._prepare_describe_mock(t, describe_data)
+        t._init_task()
+        t.logger = mock.Mock()
+        t._collect_objects()
+
+        assert list(t.describes.keys()) == list(describe_data.keys())
+        assert all(
+            t.describes[name]["fields"][0]["name"] == "Name" for name in describe_data
+        )
+        assert t.logger.info.call_args[0][0].startswith("Described 10 sObjects in ")
+
     @responses.activate
     def test_collect_objects__force_include_objects(self):
         t = _make_task(
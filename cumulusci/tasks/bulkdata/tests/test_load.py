@@ -5,6 +5,7 @@ import json
 import shutil
 import random
 import string
+import threading
 import unittest
 from unittest import mock
 import tempfile
@@ -180,6 +181,234 @@ class TestLoadData(unittest.TestCase):
         with self.assertRaises(BulkDataException):
             task()
 
+    @responses.activate
+    @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
+    def test_run__concurrent_steps(self, dml_mock):
+        responses.add(
+            method="GET",
+            url="https://example.com/services/data/v46.0/query/?q=SELECT+Id+FROM+RecordType+WHERE+SObjectType%3D%27Account%27AND+DeveloperName+%3D+%27HH_Account%27+LIMIT+1",
+            body=json.dumps({"records": [{"Id": "1"}]}),
+            status=200,
+        )
+
+        base_path = os.path.dirname(__file__)
+        db_path = os.path.join(base_path, "testdata.db")
+        mapping_path = os.path.join(base_path, self.mapping_file)
+
+        with temporary_dir() as d:
+            tmp_db_path = os.path.join(d, "testdata.db")
+            shutil.copyfile(db_path, tmp_db_path)
+
+            task = _make_task(
+                LoadData,
+                {
+                    "options": {
+                        "database_url": f"sqlite:///{tmp_db_path}",
+                        "mapping": mapping_path,
+                        "max_concurrent_steps": "2",
+                    }
+                },
+            )
+
+            task.bulk = mock.Mock()
+            task.sf = mock.Mock()
+
+            step = FakeBulkAPIDmlOperation(
+                sobject="Contact",
+                operation=DataOperationType.INSERT,
+                api_options={},
+                context=task,
+                fields=[],
+            )
+            dml_mock.return_value = step
+
+            step.results = [
+                DataOperationResult("001000000000000", True, None),
+                DataOperationResult("003000000000000", True, None),
+                DataOperationResult("003000000000001", True, None),
+            ]
+
+            mock_describe_calls()
+            task()
+
+            # Contacts look up Households, so they are still loaded in order.
+            assert step.records == [
+                ["TestHousehold", "1"],
+                ["Test", "User", "test@example.com", "001000000000000"],
+                ["Error", "User", "error@example.com", "001000000000000"],
+            ]
+
+            hh_ids = task.session.query(
+                *task.metadata.tables["households_sf_ids"].columns
+            ).one()
+            assert hh_ids == ("1", "001000000000000")
+            assert task.engine.execute("PRAGMA journal_mode").scalar() == "delete"
+
+            task.session.close()
+            task.engine.dispose()
+
+    def test_init_options__max_concurrent_steps(self):
+        task = _make_task(
+            LoadData,
+            {"options": {"database_url": "sqlite://", "mapping": "mapping.yml"}},
+        )
+        assert task.max_concurrent_steps == 1
+
+        with self.assertRaises(TaskOptionsError):
+            _make_task(
+                LoadData,
+                {
+                    "options": {
+                        "database_url": "sqlite://",
+                        "mapping": "mapping.yml",
+                        "max_concurrent_steps": "many",
+                    }
+                },
+            )
+
+        with self.assertRaises(TaskOptionsError):
+            _make_task(
+                LoadData,
+                {
+                    "options": {
+                        "database_url": "sqlite://",
+                        "mapping": "mapping.yml",
+                        "max_concurrent_steps": "0",
+                    }
+                },
+            )
+
+    def test_init_db__concurrent_steps_in_memory(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "max_concurrent_steps": 4,
+                }
+            },
+        )
+        task.mapping = {}
+        task.logger = mock.Mock()
+        with task._init_db():
+            assert task.max_concurrent_steps == 1
+        task.logger.warning.assert_called_once()
+
+    def test_get_step_dependencies(self):
+        task = _make_task(
+            LoadData,
+            {"options": {"database_url": "sqlite://", "mapping": "mapping.yml"}},
+        )
+        accounts = MappingStep(sf_object="Account")
+        contacts = MappingStep(
+            sf_object="Contact",
+            lookups={"AccountId": MappingLookup(table="Account")},
+        )
+        widgets = MappingStep(
+            sf_object="Widget__c",
+            lookups={"Parent__c": MappingLookup(table="Gadget__c", after="Gadgets")},
+        )
+        gadgets = MappingStep(sf_object="Gadget__c")
+        widget_update = MappingStep(
+            sf_object="Widget__c",
+            action="update",
+            lookups={"Parent__c": MappingLookup(table="Gadget__c")},
+        )
+        account_update = MappingStep(sf_object="Account", action="update")
+
+        steps = [
+            ("Accounts", accounts, None),
+            ("Contacts", contacts, None),
+            ("Widgets", widgets, None),
+            ("Gadgets", gadgets, None),
+            ("Update Widget__c Dependencies After Gadgets", widget_update, "Gadgets"),
+            ("Update Accounts", account_update, None),
+        ]
+
+        assert task._get_step_dependencies(steps) == {
+            "Accounts": set(),
+            "Contacts": {"Accounts"},
+            "Widgets": set(),
+            "Gadgets": set(),
+            "Update Widget__c Dependencies After Gadgets": {"Widgets", "Gadgets"},
+            "Update Accounts": {"Accounts"},
+        }
+
+    def test_run_steps_concurrently(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "max_concurrent_steps": 2,
+                }
+            },
+        )
+        task.session = mock.Mock()
+        accounts = MappingStep(sf_object="Account")
+        widgets = MappingStep(sf_object="Widget__c")
+        contacts = MappingStep(
+            sf_object="Contact",
+            lookups={"AccountId": MappingLookup(table="Account")},
+        )
+        # Accounts and Widgets can only both pass the barrier if they run at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+        completed = []
+
+        def execute_step(mapping):
+            if mapping is not contacts:
+                barrier.wait()
+            else:
+                assert "Account" in completed
+            completed.append(mapping.sf_object)
+            return DataOperationJobResult(DataOperationStatus.SUCCESS, [], 0, 0)
+
+        task._execute_step = mock.Mock(side_effect=execute_step)
+        task._run_steps_concurrently(
+            [
+                ("Accounts", accounts, None),
+                ("Contacts", contacts, None),
+                ("Widgets", widgets, None),
+            ]
+        )
+
+        assert sorted(completed) == ["Account", "Contact", "Widget__c"]
+        assert completed[-1] == "Contact"
+        assert task.session.remove.call_count == 3
+
+    def test_run_steps_concurrently__failure(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "max_concurrent_steps": 2,
+                }
+            },
+        )
+        task.session = mock.Mock()
+        accounts = MappingStep(sf_object="Account")
+        contacts = MappingStep(
+            sf_object="Contact",
+            lookups={"AccountId": MappingLookup(table="Account")},
+        )
+        task._execute_step = mock.Mock(
+            return_value=DataOperationJobResult(
+                DataOperationStatus.JOB_FAILURE, ["Oops"], 0, 0
+            )
+        )
+
+        with self.assertRaises(BulkDataException) as e:
+            task._run_steps_concurrently(
+                [("Accounts", accounts, None), ("Contacts", contacts, None)]
+            )
+
+        assert "Step Accounts did not complete successfully: Oops" in str(e.exception)
+        task._execute_step.assert_called_once_with(accounts)
+
     @responses.activate
     @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
     def test_run__sql(self, dml_mock):
@@ -18,6 +18,7 @@ from cumulusci.tasks.bulkdata.mapping_parser import (
     CaseInsensitiveDict,
 )
 from cumulusci.tasks.bulkdata.step import DataOperationType
+from cumulusci.tasks.bulkdata.tests.utils import mock_org_config
 from cumulusci.tests.util import DummyOrgConfig, mock_describe_calls
 from cumulusci.tasks.bulkdata.step import DataApi
 
@@ -82,6 +83,20 @@ class TestMappingParser:
             with pytest.raises(ValidationError):
                 parse_from_yaml(StringIO(data))
 
+    def test_bad_mapping_bulk_concurrency(self):
+        base_path = Path(__file__).parent / "mapping_v2.yml"
+        with open(base_path, "r") as f:
+            data = f.read().replace("record_type: HH_Account", "bulk_concurrency: 0")
+            with pytest.raises(ValidationError):
+                parse_from_yaml(StringIO(data))
+
+    def test_bad_mapping_pk_chunk_size(self):
+        base_path = Path(__file__).parent / "mapping_v2.yml"
+        with open(base_path, "r") as f:
+            data = f.read().replace("record_type: HH_Account", "pk_chunk_size: 500000")
+            with pytest.raises(ValidationError):
+                parse_from_yaml(StringIO(data))
+
     def test_default_table_to_sobject_name(self):
         base_path = Path(__file__).parent / "mapping_v3.yml"
         with open(base_path, "r") as f:
@@ -146,7 +161,7 @@ class TestMappingParser:
             anchor_date="2020-07-01",
         )
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.Account.describe.return_value = {
             "fields": [
                 {"name": "Some_Date__c", "type": "date"},
@@ -368,7 +383,7 @@ class TestMappingParser:
             )
         )["Insert Accounts"]
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Account", "createable": True}]
         }
@@ -433,7 +448,7 @@ class TestMappingParser:
             )
         )["Insert Accounts"]
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Account", "createable": True}]
         }
@@ -502,7 +517,7 @@ class TestMappingParser:
             sf_object="Test__c", fields=["Field__c"], action=DataOperationType.INSERT
         )
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Test__c", "createable": True}]
         }
@@ -555,7 +570,7 @@ class TestMappingParser:
             sf_object="Test__c", fields=["Name"], action=DataOperationType.INSERT
         )
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Test__c", "createable": False}]
         }
@@ -589,7 +604,7 @@ class TestMappingParser:
             sf_object="Test__c", fields=["Name"], action=DataOperationType.INSERT
         )
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Test__c", "createable": True}]
         }
@@ -643,7 +658,7 @@ class TestMappingParser:
             )
         )["Insert Accounts"]
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Account", "createable": True}]
         }
@@ -723,7 +738,7 @@ class TestMappingParser:
             )
         )["Insert Accounts"]
 
-        org_config = mock.Mock()
+        org_config = mock_org_config()
         org_config.salesforce_client.describe.return_value = {
             "sobjects": [{"name": "Account", "createable": True}]
         }
@@ -1,14 +1,19 @@
+import contextlib
+import csv
 import io
 import json
 import unittest
 from unittest import mock
 
+import requests
 import responses
 import pytest
 
 from cumulusci.core.exceptions import BulkDataException
 from cumulusci.tasks.bulkdata.step import (
     download_file,
+    spool_file,
+    ResumableDownload,
     DataOperationType,
     DataOperationStatus,
     DataOperationResult,
@@ -51,6 +56,87 @@ class TestDownloadFile(unittest.TestCase):
             # make sure it was decoded as utf-8
             assert f.read() == "TEST\u2014"
 
+    def _mock_response(self, chunks, status_code=200):
+        def iter_content(chunk_size=None):
+            for chunk in chunks:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+
+        response = mock.MagicMock()
+        response.status_code = status_code
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = iter_content
+        return response
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.requests.get")
+    def test_download_file__resume(self, get_mock):
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.side_effect = lambda values={}: values
+        get_mock.side_effect = [
+            self._mock_response(
+                [
+                    b"Id,Name\n001,TEST\xe2",
+                    requests.exceptions.ChunkedEncodingError("Connection dropped"),
+                ]
+            ),
+            self._mock_response([b"\x80\x94\n002,Test2"], status_code=206),
+        ]
+
+        with download_file("https://example.com", bulk_mock) as f:
+            assert f.read() == "Id,Name\n001,TEST\u2014\n002,Test2"
+
+        get_mock.assert_called_with(
+            "https://example.com",
+            headers={"Range": "bytes=17-", "Accept-Encoding": "identity"},
+            stream=True,
+        )
+
+    @mock.patch("time.sleep")
+    @mock.patch("cumulusci.tasks.bulkdata.step.requests.get")
+    def test_download_file__resume_without_range_support(self, get_mock, sleep):
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.side_effect = lambda values={}: values
+        get_mock.side_effect = [
+            self._mock_response(
+                [b"Id\n001\n", requests.exceptions.ConnectionError("Reset")]
+            ),
+            self._mock_response(
+                [b"Id\n0", requests.exceptions.ConnectionError("Reset again")]
+            ),
+            self._mock_response([b"Id\n0", b"01\n002\n"]),
+        ]
+
+        with download_file("https://example.com", bulk_mock) as f:
+            assert list(csv.reader(f)) == [["Id"], ["001"], ["002"]]
+
+        assert get_mock.call_count == 3
+
+    @responses.activate
+    def test_spool_file(self):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+
+        responses.add(method="GET", url=url, body=b"TEST\xe2\x80\x94")
+        with mock.patch("tempfile.mkstemp") as mkstemp:
+            with spool_file(url, bulk_mock) as f:
+                # make sure it was decoded as utf-8
+                assert f.read() == "TEST\u2014"
+        # Small files are kept in memory
+        mkstemp.assert_not_called()
+
+    @responses.activate
+    def test_spool_file__large(self):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+
+        responses.add(method="GET", url=url, body=b"Id\n001\n002\n")
+        with mock.patch.object(ResumableDownload, "spool_max_size", 4):
+            with spool_file(url, bulk_mock) as f:
+                assert list(csv.reader(f)) == [["Id"], ["001"], ["002"]]
+
 
 class TestBulkDataJobTaskMixin(unittest.TestCase):
     @responses.activate
@@ -346,6 +432,117 @@ class TestBulkApiQueryOperation(unittest.TestCase):
 
         assert list(results) == []
 
+    def test_query__pk_chunking(self):
+        context = mock.Mock()
+        query = BulkApiQueryOperation(
+            sobject="Contact",
+            api_options={"pk_chunking": 50000},
+            context=context,
+            query="SELECT Id FROM Contact",
+        )
+        query._wait_for_job = mock.Mock()
+        query._wait_for_job.return_value = DataOperationJobResult(
+            DataOperationStatus.SUCCESS, [], 0, 0
+        )
+
+        query.query()
+
+        context.bulk.create_query_job.assert_called_once_with(
+            "Contact", contentType="CSV", pk_chunking=50000
+        )
+
+    def test_parse_job_state__pk_chunking(self):
+        context = mock.Mock()
+        context.bulk.jobNS = "http://ns"
+        query = BulkApiQueryOperation(
+            sobject="Contact",
+            api_options={"pk_chunking": True},
+            context=context,
+            query="SELECT Id FROM Contact",
+        )
+
+        assert query._parse_job_state(
+            '<root xmlns="http://ns">'
+            "  <batchInfo><state>Not Processed</state>"
+            "    <numberRecordsProcessed>0</numberRecordsProcessed></batchInfo>"
+            "  <batchInfo><state>Completed</state>"
+            "    <numberRecordsProcessed>10</numberRecordsProcessed></batchInfo>"
+            "  <batchInfo><state>Completed</state>"
+            "    <numberRecordsProcessed>5</numberRecordsProcessed></batchInfo>"
+            "</root>"
+        ) == DataOperationJobResult(DataOperationStatus.SUCCESS, [], 15, 0)
+
+    @responses.activate
+    @mock.patch("cumulusci.tasks.bulkdata.step.spool_file")
+    def test_get_results__pk_chunking(self, download_mock):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        context.bulk.jobNS = "http://ns"
+        context.bulk.headers.return_value = {}
+        context.bulk.create_query_job.return_value = "JOB"
+        context.bulk.query.return_value = "BATCH"
+        context.bulk.get_query_batch_result_ids.side_effect = lambda batch_id, job_id: [
+            f"{batch_id}_RESULT"
+        ]
+        responses.add(
+            "GET",
+            "https://test/job/JOB/batch",
+            body='<root xmlns="http://ns">'
+            "<batchInfo><id>BATCH</id><state>Not Processed</state></batchInfo>"
+            "<batchInfo><id>CHUNK1</id><state>Completed</state></batchInfo>"
+            "<batchInfo><id>CHUNK2</id><state>Completed</state></batchInfo>"
+            "<batchInfo><id>CHUNK3</id><state>Completed</state></batchInfo>"
+            "</root>",
+        )
+        files = {
+            "https://test/job/JOB/batch/CHUNK1/result/CHUNK1_RESULT": "Id\n001\n002",
+            "https://test/job/JOB/batch/CHUNK2/result/CHUNK2_RESULT": "Records not found for this query",
+            "https://test/job/JOB/batch/CHUNK3/result/CHUNK3_RESULT": "Id\n003",
+        }
+        download_mock.side_effect = lambda uri, bulk: io.StringIO(files[uri])
+
+        query = BulkApiQueryOperation(
+            sobject="Contact",
+            api_options={"pk_chunking": True, "bulk_concurrency": 2},
+            context=context,
+            query="SELECT Id FROM Contact",
+        )
+        query._wait_for_job = mock.Mock()
+        query._wait_for_job.return_value = DataOperationJobResult(
+            DataOperationStatus.SUCCESS, [], 3, 0
+        )
+        query.query()
+
+        assert list(query.get_results()) == [["001"], ["002"], ["003"]]
+        assert download_mock.call_count == 3
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.spool_file")
+    def test_get_results__early_exit(self, download_mock):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        context.bulk.get_query_batch_result_ids.return_value = ["RESULT1", "RESULT2"]
+        files = [mock.MagicMock(), mock.MagicMock()]
+        files[0].__enter__.return_value = io.StringIO("Id\n001\n002")
+        files[1].__enter__.return_value = io.StringIO("Id\n003")
+        download_mock.side_effect = files
+
+        query = BulkApiQueryOperation(
+            sobject="Contact",
+            api_options={"bulk_concurrency": 2},
+            context=context,
+            query="SELECT Id FROM Contact",
+        )
+        query.job_id = "JOB"
+        query.batch_id = "BATCH"
+
+        results = query.get_results()
+        assert next(results) == ["001"]
+        results.close()
+
+        # Both the file being read and the one downloaded ahead are removed.
+        files[0].__exit__.assert_called_once()
+        files[1].__exit__.assert_called_once()
+
 
 class TestBulkApiDmlOperation(unittest.TestCase):
     def test_start(self):
@@ -619,6 +816,280 @@ class TestBulkApiDmlOperation(unittest.TestCase):
             DataOperationResult(None, False, "error"),
         ]
 
+    @responses.activate
+    def test_end_to_end__results_not_written_to_disk(self):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        context.bulk.jobNS = "http://ns"
+        context.bulk.headers.return_value = {}
+        context.bulk.create_job.return_value = "JOB"
+        context.bulk.post_batch.return_value = "BATCH1"
+        responses.add(
+            "GET",
+            "https://test/job/JOB/batch/BATCH1/result",
+            body="id,success,created,error\n003000000000001,true,true,\n",
+        )
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=context,
+            fields=["LastName"],
+        )
+
+        def wait_for_job(job_id):
+            step._process_batch_info(
+                '<root xmlns="http://ns">'
+                "<batchInfo><id>BATCH1</id><state>Completed</state></batchInfo>"
+                "</root>"
+            )
+            return DataOperationJobResult(DataOperationStatus.SUCCESS, [], 1, 0)
+
+        step._wait_for_job = wait_for_job
+
+        with mock.patch("tempfile.mkstemp") as mkstemp:
+            with step:
+                step.load_records(iter([["Test"]]))
+            assert list(step.get_results()) == [
+                DataOperationResult("003000000000001", True, None)
+            ]
+
+        mkstemp.assert_not_called()
+
+    def test_load_records__concurrent(self):
+        context = mock.Mock()
+        context.bulk.create_job.return_value = "JOB"
+        context.bulk.post_batch.side_effect = lambda job_id, batch: next(batch)
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 3},
+            context=context,
+            fields=["LastName"],
+        )
+        step._batch = mock.Mock(return_value=iter([[f"BATCH{i}"] for i in range(1, 8)]))
+
+        step.start()
+        step.load_records(iter([]))
+
+        assert step.concurrency == 3
+        assert step.batch_ids == [f"BATCH{i}" for i in range(1, 8)]
+
+    def test_load_records__upload_failure(self):
+        context = mock.Mock()
+        context.bulk.post_batch.side_effect = Exception("Upload failed")
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+
+        with pytest.raises(Exception, match="Upload failed"):
+            step.load_records(iter([[f"Test{i}"] for i in range(3)]))
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_file")
+    @mock.patch("cumulusci.tasks.bulkdata.step.spool_file")
+    def test_process_batch_info__prefetches_completed_batches(
+        self, spool_mock, download_mock
+    ):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        context.bulk.jobNS = "http://ns"
+        files = {
+            f"https://test/job/JOB/batch/BATCH{n}/result": "id,success,created,error\n"
+            f"00300000000000{n},true,true,"
+            for n in range(1, 4)
+        }
+        spool_mock.side_effect = lambda uri, bulk: io.StringIO(files[uri])
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3"]
+
+        step._process_batch_info(
+            """<root xmlns="http://ns">
+<batchInfo><id>BATCH1</id><state>Completed</state></batchInfo>
+<batchInfo><id>BATCH2</id><state>InProgress</state></batchInfo>
+<batchInfo><id>BATCH3</id><state>Completed</state></batchInfo>
+</root>"""
+        )
+
+        # Only the batches get_results() reads first are downloaded ahead.
+        assert list(step.result_downloads) == ["BATCH1"]
+        step.result_downloads["BATCH1"].result()
+        spool_mock.assert_called_once_with(
+            "https://test/job/JOB/batch/BATCH1/result", context.bulk
+        )
+
+        # Already-started downloads are not repeated.
+        step._process_batch_info(
+            """<root xmlns="http://ns">
+<batchInfo><id>BATCH1</id><state>Completed</state></batchInfo>
+</root>"""
+        )
+        assert spool_mock.call_count == 1
+
+        # The other batches are downloaded as the results are read.
+        assert list(step.get_results()) == [
+            DataOperationResult("003000000000001", True, None),
+            DataOperationResult("003000000000002", True, None),
+            DataOperationResult("003000000000003", True, None),
+        ]
+        assert spool_mock.call_count == 3
+        download_mock.assert_not_called()
+        assert step.result_downloads == {}
+        assert step.executor is None
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.spool_file")
+    def test_process_batch_info__no_prefetch_by_default(self, spool_mock):
+        context = mock.Mock()
+        context.bulk.jobNS = "http://ns"
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1"]
+
+        step._process_batch_info(
+            """<root xmlns="http://ns">
+<batchInfo><id>BATCH1</id><state>Completed</state></batchInfo>
+</root>"""
+        )
+
+        assert step.result_downloads == {}
+        assert step.executor is None
+        spool_mock.assert_not_called()
+
+    def test_get_results__prefetch_bounded(self):
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 2},
+            context=mock.Mock(),
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = [f"BATCH{n}" for n in range(10)]
+        unread = set()
+        most_unread = 0
+
+        def prefetch_results(batch_id):
+            nonlocal most_unread
+            stack = contextlib.ExitStack()
+            stack.callback(unread.discard, batch_id)
+            unread.add(batch_id)
+            most_unread = max(most_unread, len(unread))
+            f = io.StringIO("id,success,created,error\n003000000000001,true,true,\n")
+            return stack, f
+
+        step._prefetch_results = prefetch_results
+
+        assert len(list(step.get_results())) == 10
+        # The file being read, plus at most `concurrency` downloaded ahead
+        assert most_unread <= 3
+        assert not unread
+
+    def _prefetching_step(self, job_result):
+        context = mock.Mock()
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2"]
+        removed = []
+
+        def prefetch_results(batch_id):
+            stack = contextlib.ExitStack()
+            stack.callback(removed.append, batch_id)
+            f = io.StringIO("id,success,created,error\n003000000000001,true,true,\n")
+            return stack, f
+
+        step._prefetch_results = prefetch_results
+
+        def wait_for_job(job_id):
+            for batch_id in step.batch_ids:
+                step.result_downloads[batch_id] = step._submit(
+                    step._prefetch_results, batch_id
+                )
+            return job_result
+
+        step._wait_for_job = wait_for_job
+        return step, removed
+
+    def test_end__shuts_down_executor(self):
+        step, removed = self._prefetching_step(
+            DataOperationJobResult(DataOperationStatus.SUCCESS, [], 2, 0)
+        )
+
+        step.end()
+
+        assert step.executor is None
+        assert list(step.result_downloads) == ["BATCH1", "BATCH2"]
+        assert len(list(step.get_results())) == 2
+        assert sorted(removed) == ["BATCH1", "BATCH2"]
+
+    def test_end__discards_results_of_failed_job(self):
+        step, removed = self._prefetching_step(
+            DataOperationJobResult(DataOperationStatus.JOB_FAILURE, ["err"], 0, 0)
+        )
+
+        step.end()
+
+        assert step.executor is None
+        assert step.result_downloads == {}
+        assert sorted(removed) == ["BATCH1", "BATCH2"]
+
+    def test_get_results__abandoned(self):
+        step, removed = self._prefetching_step(
+            DataOperationJobResult(DataOperationStatus.SUCCESS, [], 2, 0)
+        )
+        step.end()
+
+        results = step.get_results()
+        next(results)
+        results.close()
+
+        assert step.result_downloads == {}
+        assert sorted(removed) == ["BATCH1", "BATCH2"]
+
+    def test_load_records__upload_failure_shuts_down_executor(self):
+        context = mock.Mock()
+        context.bulk.post_batch.side_effect = Exception("Upload failed")
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"bulk_concurrency": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+
+        with pytest.raises(Exception, match="Upload failed"):
+            step.load_records(iter([[f"Test{i}"] for i in range(3)]))
+        assert step.executor is None
+
 
 class TestRestApiQueryOperation:
     def test_query(self):
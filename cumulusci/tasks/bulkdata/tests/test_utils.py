@@ -1,5 +1,8 @@
+import io
 import json
 import os
+import sqlite3
+import sys
 import unittest
 from unittest import mock
 
@@ -7,11 +10,18 @@ import responses
 from sqlalchemy import create_engine, MetaData, Integer, Unicode, Column, Table
 from sqlalchemy.orm import create_session, mapper
 
+from cumulusci.core.exceptions import BulkDataException
 from cumulusci.tasks import bulkdata
 from cumulusci.utils import temporary_dir
 from cumulusci.tasks.bulkdata.utils import (
     create_table,
     generate_batches,
+    iter_sql_chunks,
+    iter_sql_dump,
+    open_sql_script,
+    sqlite_dump_script,
+    sqlite_import_script,
+    strip_sql_transactions,
 )
 from cumulusci.tasks.bulkdata.mapping_parser import parse_from_yaml
 
@@ -187,3 +197,138 @@ class TestBatching(unittest.TestCase):
     def test_batching_with_remainder(self):
         batches = list(generate_batches(num_records=20, batch_size=7))
         assert batches == [(7, 0), (7, 1), (6, 2)]
+
+
+class TestSqlImport(unittest.TestCase):
+    def test_iter_sql_chunks(self):
+        script = io.StringIO(
+            "BEGIN TRANSACTION;\n"
+            "CREATE TABLE t (a VARCHAR(255));\n"
+            "INSERT INTO \"t\" VALUES('x;\n');\n"
+            "INSERT INTO \"t\" VALUES('y');\n"
+            "COMMIT;\n"
+        )
+
+        chunks = list(iter_sql_chunks(script, chunk_size=20))
+
+        # Never split in the middle of the string literal
+        assert chunks == [
+            "\nCREATE TABLE t (a VARCHAR(255));",
+            "\nINSERT INTO \"t\" VALUES('x;\n');",
+            "\nINSERT INTO \"t\" VALUES('y');\n\n",
+        ]
+        assert all(sqlite3.complete_statement(chunk) for chunk in chunks)
+
+    def test_iter_sql_chunks__no_transaction(self):
+        script = io.StringIO("CREATE TABLE t (a VARCHAR(255));")
+
+        assert list(iter_sql_chunks(script)) == ["CREATE TABLE t (a VARCHAR(255));"]
+
+    def test_sqlite_import_script(self):
+        sql_path = os.path.join(os.path.dirname(__file__), "testdata.sql")
+        with temporary_dir() as d:
+            conn = sqlite3.connect(os.path.join(d, "test.db"))
+            with open(sql_path, "r", encoding="utf-8") as f:
+                sqlite_import_script(conn, f)
+
+            assert conn.execute("SELECT first_name FROM contacts").fetchall() == [
+                ("Test☃",),
+                ("Error",),
+            ]
+            assert conn.execute("SELECT COUNT(*) FROM households").fetchone() == (1,)
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+            assert conn.execute("PRAGMA synchronous").fetchone() == (2,)
+            conn.close()
+
+    def test_sqlite_import_script__shell_dump(self):
+        # As written by the sqlite3 shell's .dump, with a transaction in the middle
+        script = io.StringIO(
+            "PRAGMA foreign_keys=OFF;\n"
+            "BEGIN TRANSACTION;\n"
+            "CREATE TABLE t (a VARCHAR(255));\n"
+            "INSERT INTO t VALUES('x');\n"
+            "COMMIT;\n"
+            "begin;\n"
+            "INSERT INTO t VALUES('\nCOMMIT;\n');\n"
+            "end transaction;\n"
+        )
+        conn = sqlite3.connect(":memory:")
+
+        sqlite_import_script(conn, script)
+
+        assert conn.execute("SELECT a FROM t").fetchall() == [("x",), ("\nCOMMIT;\n",)]
+
+    def test_strip_sql_transactions(self):
+        assert strip_sql_transactions("SELECT 1;\n") == "SELECT 1;\n"
+        assert (
+            strip_sql_transactions("BEGIN IMMEDIATE;\nSELECT 1;\nCOMMIT;")
+            == "\nSELECT 1;\n"
+        )
+
+    def test_sqlite_import_script__error(self):
+        conn = sqlite3.connect(":memory:")
+        script = io.StringIO(
+            "CREATE TABLE t (a VARCHAR(255) PRIMARY KEY);\n"
+            "INSERT INTO t VALUES('a');\n"
+            "INSERT INTO t VALUES('a');\n"
+        )
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            sqlite_import_script(conn, script)
+
+        assert not conn.in_transaction
+        assert conn.execute("PRAGMA synchronous").fetchone() == (2,)
+
+
+class TestSqlDump(unittest.TestCase):
+    def _create_db(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            'CREATE TABLE "my ""table""" (id INTEGER PRIMARY KEY, "na""me" TEXT)'
+        )
+        conn.execute('CREATE INDEX name_index ON "my ""table""" ("na""me")')
+        conn.executemany(
+            'INSERT INTO "my ""table""" VALUES (?, ?)',
+            [(1, "It's;\nhere"), (2, None), (3, "☃"), (4, "x" * 10)],
+        )
+        return conn
+
+    def test_iter_sql_dump(self):
+        statements = list(iter_sql_dump(self._create_db(), rows_per_insert=3))
+
+        assert statements == [
+            "BEGIN TRANSACTION;",
+            'CREATE TABLE "my ""table""" (id INTEGER PRIMARY KEY, "na""me" TEXT);',
+            'INSERT INTO "my ""table""" VALUES\n'
+            "(1,'It''s;\nhere'),\n(2,NULL),\n(3,'☃');",
+            'INSERT INTO "my ""table""" VALUES\n(4,\'xxxxxxxxxx\');',
+            'CREATE INDEX name_index ON "my ""table""" ("na""me");',
+            "COMMIT;",
+        ]
+
+    def test_iter_sql_dump__statement_size(self):
+        statements = list(iter_sql_dump(self._create_db(), statement_size=20))
+
+        assert [s.count("\n(") for s in statements if s.startswith("INSERT")] == [
+            2,
+            2,
+        ]
+
+    def test_round_trip(self):
+        conn = self._create_db()
+        for rows_per_insert in (1, 2):
+            with temporary_dir() as d:
+                sql_path = os.path.join(d, "test.sql.gz")
+                with open_sql_script(sql_path, "w") as f:
+                    sqlite_dump_script(conn, f, rows_per_insert, chunk_size=50)
+
+                new_conn = sqlite3.connect(":memory:")
+                with open_sql_script(sql_path) as f:
+                    sqlite_import_script(new_conn, f)
+
+                assert list(new_conn.iterdump()) == list(conn.iterdump())
+
+    def test_open_sql_script__zstandard_missing(self):
+        with mock.patch.dict(sys.modules, {"zstandard": None}):
+            with self.assertRaises(BulkDataException):
+                open_sql_script("test.sql.zst")
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from cumulusci.core.config import UniversalConfig, BaseProjectConfig, TaskConfig
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.tests import util as cci_test_utils
@@ -23,6 +25,19 @@ def _make_task(task_class, task_config):
     return task_class(project_config, task_config, org_config)
 
 
+def mock_org_config():
+    """Return a Mock OrgConfig whose describe() is answered by the
+    describe mocks configured on its salesforce_client."""
+    org_config = mock.Mock()
+
+    def describe(sobject=None, sf=None):
+        sf = sf or org_config.salesforce_client
+        return (getattr(sf, sobject) if sobject else sf).describe()
+
+    org_config.describe.side_effect = describe
+    return org_config
+
+
 class FakeBulkAPI:
     """Extremely simplistic mock of the bulk API
 
@@ -1,6 +1,9 @@
 import collections
+import gzip
 import itertools
 import logging
+import re
+import sqlite3
 import tempfile
 import typing
 from contextlib import contextmanager
@@ -184,3 +187,185 @@ def get_batch_iterator(n: int, iterable: typing.Iterable):
         if not chunk:
             return
         yield chunk
+
+
+SQL_DUMP_BEGIN = "BEGIN TRANSACTION;"
+SQL_DUMP_COMMIT = "COMMIT;"
+# A line that is a whole BEGIN, COMMIT or END statement
+SQL_TRANSACTION_RE = re.compile(
+    r"^(?:BEGIN(?:[ \t]+(?:DEFERRED|IMMEDIATE|EXCLUSIVE))?|COMMIT|END)"
+    r"(?:[ \t]+TRANSACTION)?[ \t]*;[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Settings for loading a SQL script into a scratch database. A failed load
+# leaves the database unusable, so there's no point paying for a rollback journal.
+SQL_IMPORT_PRAGMAS = {"journal_mode": "OFF", "synchronous": "OFF", "cache_size": -65536}
+
+
+def open_sql_script(path, mode: str = "r") -> typing.TextIO:
+    """Open a SQL script for reading or writing text.
+
+    Paths ending in .gz are gzip compressed, and paths ending in .zst are
+    Zstandard compressed (which needs the zstandard package)."""
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", compresslevel=6, encoding="utf-8")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise BulkDataException(
+                f"The zstandard package must be installed to use {path}"
+            )
+        return zstandard.open(path, mode + "t", encoding="utf-8")  # pragma: no cover
+    return open(path, mode, encoding="utf-8")
+
+
+def iter_sql_dump(
+    connection: sqlite3.Connection,
+    rows_per_insert: int = 500,
+    statement_size: int = 500_000,
+):
+    """Yield the statements of a SQL script that recreates a SQLite database.
+
+    This is like sqlite3's iterdump (leaving out SQLite's internal tables),
+    except that each INSERT adds up to rows_per_insert rows, one per line, as
+    long as the statement stays under about statement_size characters."""
+    cursor = connection.cursor()
+    yield SQL_DUMP_BEGIN
+    tables = cursor.execute(
+        """SELECT "name", "sql" FROM "sqlite_master"
+        WHERE "sql" NOT NULL AND "type" == 'table' ORDER BY "name"
+        """
+    ).fetchall()
+    for table_name, sql in tables:
+        if table_name.startswith("sqlite_"):
+            continue
+        yield f"{sql};"
+        table_ident = table_name.replace('"', '""')
+        columns = cursor.execute(f'PRAGMA table_info("{table_ident}")').fetchall()
+        # Let SQLite quote the values, which is much faster than doing it here
+        values = "||','||".join(
+            'quote("{}")'.format(column[1].replace('"', '""')) for column in columns
+        )
+        insert = f'INSERT INTO "{table_ident}" VALUES\n('
+        rows = []
+        size = 0
+        for (row,) in cursor.execute(f'SELECT {values} FROM "{table_ident}"'):
+            rows.append(row)
+            size += len(row)
+            if len(rows) >= rows_per_insert or size >= statement_size:
+                yield insert + "),\n(".join(rows) + ");"
+                rows = []
+                size = 0
+        if rows:
+            yield insert + "),\n(".join(rows) + ");"
+    for (sql,) in cursor.execute(
+        """SELECT "sql" FROM "sqlite_master"
+        WHERE "sql" NOT NULL AND "type" IN ('index', 'trigger', 'view')
+        """
+    ).fetchall():
+        yield f"{sql};"
+    yield SQL_DUMP_COMMIT
+
+
+def sqlite_dump_script(
+    connection: sqlite3.Connection,
+    f: typing.TextIO,
+    rows_per_insert: int = 500,
+    chunk_size: int = 4_000_000,
+):
+    """Write a SQL script that recreates a SQLite database to a file.
+
+    Statements are written in chunks of about chunk_size characters. With
+    rows_per_insert=1 the script is written by sqlite3's iterdump."""
+    if rows_per_insert == 1:
+        statements = connection.iterdump()
+    else:
+        statements = iter_sql_dump(connection, rows_per_insert)
+    chunk = []
+    chunk_length = 0
+    for statement in statements:
+        chunk.append(statement)
+        chunk_length += len(statement)
+        if chunk_length >= chunk_size:
+            f.write("\n".join(chunk) + "\n")
+            chunk = []
+            chunk_length = 0
+    if chunk:
+        f.write("\n".join(chunk) + "\n")
+
+
+def strip_sql_transactions(script: str) -> str:
+    """Remove the statements that begin and end transactions from a SQL script.
+
+    Only statements on lines of their own are found, which covers the
+    scripts written by sqlite3's iterdump and the sqlite3 shell's .dump."""
+    # Searching for the keywords is much faster than running the regex
+    upper = "\n" + script.upper()
+    if not any(f"\n{keyword}" in upper for keyword in ("BEGIN", "COMMIT", "END")):
+        return script
+    parts = []
+    start = 0
+    for match in SQL_TRANSACTION_RE.finditer(script):
+        # Leave alone anything that's part of a multi-line string literal
+        prefix = script[: match.start()]
+        if prefix.strip() and not sqlite3.complete_statement(prefix):
+            continue
+        parts.append(script[start : match.start()])
+        start = match.end()
+    if not parts:
+        return script
+    parts.append(script[start:])
+    return "".join(parts)
+
+
+def iter_sql_chunks(f: typing.TextIO, chunk_size: int = 4_000_000):
+    """Yield a SQL script read from a file in chunks of whole statements.
+
+    Each chunk is at least chunk_size characters long, except the last one.
+    The script's own transaction statements (like the BEGIN TRANSACTION and
+    COMMIT written around a whole dump) are left out."""
+    buffer = ""
+    block = f.read(chunk_size)
+    while block:
+        buffer += block
+        block = f.read(chunk_size)
+        # Split after the last semicolon that ends a statement (rather than
+        # one in a string literal). If there isn't one, read some more.
+        end = buffer.rfind(";\n") + 1
+        if block and end and sqlite3.complete_statement(buffer[:end]):
+            chunk = strip_sql_transactions(buffer[:end])
+            if chunk.strip():
+                yield chunk
+            buffer = buffer[end:]
+    chunk = strip_sql_transactions(buffer)
+    if chunk.strip():
+        yield chunk
+
+
+def sqlite_import_script(connection: sqlite3.Connection, f: typing.TextIO):
+    """Run a SQL script against a SQLite database without reading it all into memory.
+
+    This is meant for loading datasets into a scratch database: the database is
+    not crash safe while the script runs."""
+    cursor = connection.cursor()
+    try:
+        saved_pragmas = {
+            name: cursor.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in SQL_IMPORT_PRAGMAS
+        }
+        for name, value in SQL_IMPORT_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        try:
+            # executescript() commits before it starts, so each chunk
+            # gets its own transaction.
+            for chunk in iter_sql_chunks(f):
+                cursor.executescript(f"BEGIN;\n{chunk}\nCOMMIT;")
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            for name, value in saved_pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
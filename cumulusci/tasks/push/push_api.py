@@ -1,18 +1,74 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import functools
 import json
+import os
+import threading
+import time
 
 from simple_salesforce import SalesforceMalformedRequest
 
 
-def memoize(obj):
-    cache = obj.cache = {}
+class QueryCache(object):
+    """A least-recently-used cache of query results, expiring entries ttl
+    seconds after they were stored (or never, if ttl is 0 or None).
+
+    Keys are (method name, args, kwargs) tuples, so invalidate() can drop
+    everything cached for particular methods."""
+
+    def __init__(self, maxsize=128, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key: (expires, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *names):
+        """Drop the cached results of the named methods, or of all methods."""
+        with self._lock:
+            if not names:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] in names]:
+                del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
 
-    @functools.wraps(obj)
-    def memoizer(*args, **kwargs):
-        key = str(args) + str(kwargs)
-        if key not in cache:
-            cache[key] = obj(*args, **kwargs)
-        return cache[key]
+def memoize(method):
+    """Cache the results of a SalesforcePushApi method in the instance's
+    query_cache."""
+
+    @functools.wraps(method)
+    def memoizer(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return self.query_cache.get(key, lambda: method(self, *args, **kwargs))
 
     return memoizer
 
@@ -30,6 +86,67 @@ def batch_list(data, batch_size):
     return batch_list
 
 
+class PushRequestCheckpoint(object):
+    """Records the progress of scheduling a push request in a file, so that
+    an interrupted run can be resumed without adding the same orgs again.
+
+    The file holds one JSON object per line: the push request and package
+    version first, then the orgs scheduled and skipped by each batch, and
+    finally a marker once the push request has been queued (after which it
+    can't be resumed)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.request_id = None
+        self.version_id = None
+        self.scheduled = set()
+        self.skipped = {}
+        self.queued = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line may be incomplete if the run was killed
+                    continue
+                if "request_id" in entry:
+                    self.request_id = entry["request_id"]
+                    self.version_id = entry["version_id"]
+                self.scheduled.update(entry.get("scheduled", []))
+                self.skipped.update(entry.get("skipped", {}))
+                self.queued = entry.get("queued", self.queued)
+
+    def start(self, request_id, version_id):
+        self.request_id = request_id
+        self.version_id = version_id
+        self.scheduled = set()
+        self.skipped = {}
+        self.queued = False
+        self._write({"request_id": request_id, "version_id": version_id}, "w")
+
+    def record_batch(self, scheduled, skipped):
+        with self._lock:
+            self.scheduled.update(scheduled)
+            self.skipped.update(skipped)
+            self._write({"scheduled": list(scheduled), "skipped": skipped}, "a")
+
+    def finish(self):
+        self.queued = True
+        self._write({"queued": True}, "a")
+
+    def _write(self, entry, mode):
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
 class BasePushApiObject(object):
     def format_where(self, id_field, where=None):
         base_where = "%s = '%s'" % (id_field, self.sf_id)
@@ -216,6 +333,20 @@ class PackagePushRequest(BasePushApiObject):
         where = self.format_where("PackagePushRequestId", where)
         return self.push_api.get_push_jobs_by_id(where, limit)
 
+    def get_push_errors(self, where=None, limit=None):
+        """Return the PackagePushError records of all of this request's jobs,
+        using one (paginated) query rather than one per job."""
+        base_where = (
+            "PackagePushJobId IN (SELECT Id FROM PackagePushJob WHERE "
+            + self.format_where("PackagePushRequestId")
+            + ")"
+        )
+        if where:
+            where = "%s AND (%s)" % (base_where, where)
+        else:
+            where = base_where
+        return self.push_api.get_push_errors(where, limit)
+
 
 class PackageSubscriber(object):
     def __init__(
@@ -262,10 +393,37 @@ class PackageSubscriber(object):
 class SalesforcePushApi(object):
     """ API Wrapper for the Salesforce Push API """
 
-    def __init__(self, sf, logger, lazy=None, default_where=None, batch_size=None):
+    # How often to retry a batch of orgs after an unexpected server error,
+    # and the delay before the first retry (doubled for each one after)
+    batch_retries = 5
+    retry_delay = 1
+
+    # Defaults for the query cache: how many results to keep, and for how
+    # many seconds, so long push runs still see changes made in the org
+    default_cache_size = 128
+    default_cache_ttl = 300
+
+    def __init__(
+        self,
+        sf,
+        logger,
+        lazy=None,
+        default_where=None,
+        batch_size=None,
+        concurrency=None,
+        cache_size=None,
+        cache_ttl=None,
+    ):
         self.sf = sf
         self.logger = logger
 
+        # Query results are cached per instance: at most cache_size of them,
+        # each for at most cache_ttl seconds (0 keeps them until evicted).
+        self.query_cache = QueryCache(
+            maxsize=cache_size or self.default_cache_size,
+            ttl=self.default_cache_ttl if cache_ttl is None else cache_ttl,
+        )
+
         if not lazy:
             lazy = []
         self.lazy = lazy
@@ -278,6 +436,17 @@ class SalesforcePushApi(object):
             batch_size = 200
         self.batch_size = batch_size
 
+        # Number of batches of orgs to add to a push request at the same time
+        self.concurrency = concurrency or 1
+
+        # org key: {"statusCode": ..., "message": ...} for the orgs that
+        # create_push_request could not add
+        self.skipped_orgs = {}
+
+    def clear_cache(self, *names):
+        """Forget cached query results, for the named methods or for all."""
+        self.query_cache.invalidate(*names)
+
     def return_query_records(self, query):
         res = self.sf.query_all(query)
         if res["totalSize"] > 0:
@@ -543,13 +712,43 @@ class SalesforcePushApi(object):
             push_errors[push_error.sf_id] = push_error
         return push_errors
 
-    def create_push_request(self, version, orgs, start):
-
-        # Create the request
-        res = self.sf.PackagePushRequest.create(
-            {"PackageVersionId": version.sf_id, "ScheduledStartTime": start.isoformat()}
+    def create_push_request(self, version, orgs, start, checkpoint=None):
+        """Create a push request for version and add orgs to it.
+
+        If checkpoint is the path of a file, progress is recorded there and
+        a later call with the same file and version resumes the same push
+        request instead of creating a new one, as long as it hasn't been
+        queued yet.
+
+        Returns the push request Id and the number of orgs added. The orgs
+        that could not be added are left in skipped_orgs."""
+        if checkpoint:
+            checkpoint = PushRequestCheckpoint(checkpoint)
+        resume = (
+            checkpoint
+            and not checkpoint.queued
+            and checkpoint.version_id == version.sf_id
+            and self._reschedule_push_request(checkpoint.request_id, start)
         )
-        request_id = res["id"]
+
+        if resume:
+            request_id = checkpoint.request_id
+            self.logger.info(
+                "Resuming push request {} ({} orgs already added, {} skipped)".format(
+                    request_id, len(checkpoint.scheduled), len(checkpoint.skipped)
+                )
+            )
+        else:
+            # Create the request
+            res = self.sf.PackagePushRequest.create(
+                {
+                    "PackageVersionId": version.sf_id,
+                    "ScheduledStartTime": start.isoformat(),
+                }
+            )
+            request_id = res["id"]
+            if checkpoint:
+                checkpoint.start(request_id, version.sf_id)
 
         # remove duplicates
         n_orgs_pre = len(orgs)
@@ -562,80 +761,159 @@ class SalesforcePushApi(object):
                 )
             )
 
-        # Schedule the orgs
-        batches = batch_list(orgs, self.batch_size)
+        self.skipped_orgs = {}
         scheduled_orgs = 0
-        for batch_num, batch in enumerate(batches):
+        if resume:
+            self.skipped_orgs.update(checkpoint.skipped)
+            scheduled_orgs = len(checkpoint.scheduled & orgs)
+            orgs = orgs - checkpoint.scheduled - set(checkpoint.skipped)
+
+        # Schedule the orgs
+        batches = batch_list(sorted(orgs), self.batch_size)
+        lock = threading.Lock()
+
+        def add_batch(batch_num, batch):
+            nonlocal scheduled_orgs
             self.logger.info(
                 "Batch {} of {}: Attempting to add {} orgs".format(
                     batch_num + 1, len(batches), len(batch)
                 )
             )
-            valid_batch = self._add_batch(batch, request_id)
-            scheduled_orgs += len(valid_batch)
+            skipped = {}
+            valid_batch = self._add_batch(batch, request_id, skipped)
+            if resume:
+                # These orgs were added just before the earlier run stopped
+                added = [
+                    org_id
+                    for org_id, error in skipped.items()
+                    if error["statusCode"] == "DUPLICATE_VALUE"
+                ]
+                for org_id in added:
+                    del skipped[org_id]
+                valid_batch = valid_batch + added
+            with lock:
+                scheduled_orgs += len(valid_batch)
+                self.skipped_orgs.update(skipped)
+            if checkpoint:
+                checkpoint.record_batch(valid_batch, skipped)
             self.logger.info(
                 "{} orgs successfully added to batch".format(len(valid_batch))
             )
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(add_batch, batch_num, batch)
+                for batch_num, batch in enumerate(batches)
+            ]
+        for future in futures:
+            future.result()
+
         self.logger.info(
             "Push request {} is populated with {} orgs".format(
                 request_id, scheduled_orgs
             )
         )
+        self._log_skipped_orgs()
         return request_id, scheduled_orgs
 
-    def _add_batch(self, batch: list, request_id) -> list:
-
-        # add orgs to batch data
-        batch_data = {"records": []}
-        for i, org in enumerate(batch):
-            batch_data["records"].append(
-                {
-                    "attributes": {"type": "PackagePushJob", "referenceId": org},
-                    "PackagePushRequestId": request_id,
-                    "SubscriberOrganizationKey": org,
-                }
+    def _reschedule_push_request(self, request_id, start):
+        """Set a new start time for a push request from an earlier run, if it
+        hasn't been queued yet. Returns whether it can be resumed."""
+        status = self.sf.PackagePushRequest.get(request_id)["Status"]
+        if status != "Created":
+            self.logger.warning(
+                "Not resuming push request {}, which is already {}".format(
+                    request_id, status
+                )
             )
+            return False
+        self.sf.PackagePushRequest.update(
+            request_id, {"ScheduledStartTime": start.isoformat()}
+        )
+        return True
+
+    def _log_skipped_orgs(self):
+        if not self.skipped_orgs:
+            return
+        by_status = {}
+        for error in self.skipped_orgs.values():
+            status = error["statusCode"] or "UNKNOWN"
+            by_status[status] = by_status.get(status, 0) + 1
+        self.logger.warning("Skipped {} orgs:".format(len(self.skipped_orgs)))
+        for status, count in sorted(by_status.items()):
+            self.logger.warning("    {}: {}".format(status, count))
+
+    def _add_batch(self, batch: list, request_id, skipped=None) -> list:
+        """Add the orgs in batch to the push request and return those that
+        were added. Orgs that can't be added are left out (and recorded in
+        skipped, if given); unexpected server errors are retried with
+        increasing delays."""
+        batch = list(batch)
+        attempt = 0
+        while batch:
+            # add orgs to batch data
+            batch_data = {"records": []}
+            for org in batch:
+                batch_data["records"].append(
+                    {
+                        "attributes": {"type": "PackagePushJob", "referenceId": org},
+                        "PackagePushRequestId": request_id,
+                        "SubscriberOrganizationKey": org,
+                    }
+                )
 
-        # add batch to push request
-        try:
-            self.sf._call_salesforce(
-                "POST",
-                self.sf.base_url + "composite/tree/PackagePushJob",
-                data=json.dumps(batch_data),
-            )
-        except SalesforceMalformedRequest as e:
-            invalid_orgs = set()
-            retry_all = False
-            for result in e.content["results"]:
-                for error in result["errors"]:
-                    if "Something bad has happened" in error["message"]:
-                        retry_all = True
+            # add batch to push request
+            try:
+                self.sf._call_salesforce(
+                    "POST",
+                    self.sf.base_url + "composite/tree/PackagePushJob",
+                    data=json.dumps(batch_data),
+                )
+                break
+            except SalesforceMalformedRequest as e:
+                invalid_orgs = {}
+                retry_all = False
+                for result in e.content["results"]:
+                    for error in result["errors"]:
+                        if "Something bad has happened" in error["message"]:
+                            retry_all = True
+                            break
+                        if error["statusCode"] in [
+                            "DUPLICATE_VALUE",
+                            "INVALID_OPERATION",
+                            "UNKNOWN_EXCEPTION",
+                        ]:
+                            org_id = result["referenceId"]
+                            invalid_orgs[org_id] = {
+                                "statusCode": error["statusCode"],
+                                "message": error["message"],
+                            }
+                            self.logger.info(
+                                "Skipping org {} - {}".format(org_id, error["message"])
+                            )
+                        else:
+                            raise
+                    if retry_all:
                         break
-                    if error["statusCode"] in [
-                        "DUPLICATE_VALUE",
-                        "INVALID_OPERATION",
-                        "UNKNOWN_EXCEPTION",
-                    ]:
-                        org_id = result["referenceId"]
-                        invalid_orgs.add(org_id)
-                        self.logger.info(
-                            "Skipping org {} - {}".format(org_id, error["message"])
-                        )
-                    else:
-                        raise
                 if retry_all:
-                    break
-            if retry_all:
-                self.logger.warning("Retrying batch")
-                batch = self._add_batch(batch, request_id)
-            else:
-                for org_id in invalid_orgs:
-                    batch.remove(org_id)
-                if batch:
-                    self.logger.warning("Retrying batch without invalid orgs")
-                    batch = self._add_batch(batch, request_id)
+                    attempt += 1
+                    if attempt > self.batch_retries:
+                        raise
+                    delay = self.retry_delay * 2 ** (attempt - 1)
+                    self.logger.warning("Retrying batch in {} seconds".format(delay))
+                    time.sleep(delay)
+                elif not invalid_orgs:
+                    # Nothing to leave out, so retrying would fail the same way
+                    raise
                 else:
-                    self.logger.error("Skipping batch (no valid orgs)")
+                    for org_id, error in invalid_orgs.items():
+                        batch.remove(org_id)
+                        if skipped is not None:
+                            skipped[org_id] = error
+                    if batch:
+                        self.logger.warning("Retrying batch without invalid orgs")
+                    else:
+                        self.logger.error("Skipping batch (no valid orgs)")
         return batch
 
     def cancel_push_request(self, request_id):
@@ -1,10 +1,14 @@
 import csv
 from datetime import datetime
 from datetime import timedelta
+import json
 import time
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.exceptions import CumulusCIException
 from cumulusci.core.exceptions import PushApiObjectNotFound
+from cumulusci.tasks.push.push_api import PackagePushError
+from cumulusci.tasks.push.push_api import PackagePushJob
+from cumulusci.tasks.push.push_api import PushRequestCheckpoint
 from cumulusci.tasks.push.push_api import SalesforcePushApi
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
 
@@ -119,8 +123,16 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
         success_jobs = []
         canceled_jobs = []
 
-        jobs = self.push_request.get_push_job_objs()
-        for job in jobs:
+        # Build the jobs from their records: get_push_job_objs would query each
+        # job's subscriber, since the report's push API is lazy about them
+        for push_job in self.push_request.get_push_jobs():
+            job = PackagePushJob(
+                push_api=self.push_report,
+                request=self.push_request,
+                org=push_job["SubscriberOrganizationKey"],
+                status=push_job["Status"],
+                sf_id=push_job["Id"],
+            )
             if job.status == "Failed":
                 failed_jobs.append(job)
             elif job.status == "Succeeded":
@@ -135,9 +147,24 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
         )
 
         failed_by_error = {}
-        for job in failed_jobs:
-            errors = job.get_push_error_objs()
-            for error in errors:
+        if failed_jobs:
+            # Fetch the errors of every job at once and match them up here,
+            # rather than querying each failed job's errors.
+            failed_jobs_by_id = {job.sf_id: job for job in failed_jobs}
+            for push_error in self.push_request.get_push_errors():
+                job = failed_jobs_by_id.get(push_error["PackagePushJobId"])
+                if job is None:
+                    continue
+                error = PackagePushError(
+                    push_api=self.push_report,
+                    job=job,
+                    severity=push_error["ErrorSeverity"],
+                    error_type=push_error["ErrorType"],
+                    title=push_error["ErrorTitle"],
+                    message=push_error["ErrorMessage"],
+                    details=push_error["ErrorDetails"],
+                    sf_id=push_error["Id"],
+                )
                 error_key = (
                     error.error_type,
                     error.title,
@@ -160,6 +187,58 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
                 self.logger.info("    Message = {}".format(key[2]))
                 self.logger.info("    Details = {}".format(key[3]))
 
+        if self.options.get("failure_report"):
+            self._write_failure_report(self.options["failure_report"], failed_by_error)
+
+    def _write_failure_report(self, path, failed_by_error):
+        """Write the errors grouped by failure to a JSON file (if path ends
+        with .json) or a CSV file, most common failure first. Each error's
+        job.org is the key of the subscriber org."""
+        groups = sorted(failed_by_error.items(), key=lambda item: -len(item[1]))
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if path.lower().endswith(".json"):
+                f.write("[")
+                for i, (key, errors) in enumerate(groups):
+                    group = {
+                        "ErrorType": key[0],
+                        "ErrorTitle": key[1],
+                        "ErrorMessage": key[2],
+                        "ErrorDetails": key[3],
+                        "Count": len(errors),
+                        "Orgs": [error.job.org for error in errors],
+                    }
+                    f.write(("," if i else "") + "\n" + json.dumps(group))
+                f.write("\n]\n")
+            else:
+                w = csv.writer(f)
+                w.writerow(
+                    [
+                        "OrganizationId",
+                        "ErrorSeverity",
+                        "ErrorType",
+                        "ErrorTitle",
+                        "ErrorMessage",
+                        "ErrorDetails",
+                    ]
+                )
+                for key, errors in groups:
+                    for error in errors:
+                        w.writerow(
+                            [
+                                error.job.org,
+                                error.severity,
+                                error.error_type,
+                                error.title,
+                                error.message,
+                                error.details,
+                            ]
+                        )
+        self.logger.info(
+            "Wrote report of {} failures to {}".format(
+                sum(len(errors) for errors in failed_by_error.values()), path
+            )
+        )
+
     def _report_push_status(self, request_id):
         self._get_push_request_query(request_id)
         # Check if the request is complete
@@ -180,10 +259,9 @@ class BaseSalesforcePushTask(BaseSalesforceApiTask):
                 interval = 60
             time.sleep(interval)
 
-            # Clear the method level cache on get_push_requests and
+            # Clear the cached results of get_push_requests and
             # get_push_request_objs
-            self.push_report.get_push_requests.cache.clear()
-            self.push_report.get_push_request_objs.cache.clear()
+            self.push_report.clear_cache("get_push_requests", "get_push_request_objs")
             # Get the push_request again
             self.push_request = self.push_report.get_push_request_objs(
                 "Id = '{}'".format(request_id), limit=1
@@ -228,11 +306,48 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
                 + " Defaults to 200."
             )
         },
+        "concurrency": {
+            "description": (
+                "Number of batches of orgs to add to the push request at the same time."
+                + " Defaults to 1."
+            )
+        },
+        "checkpoint": {
+            "description": (
+                "Path of a file to record progress in. If scheduling is interrupted,"
+                + " running again with the same file resumes the same push request."
+            )
+        },
+        "failure_report": {
+            "description": (
+                "Path of a file to write the failed orgs to, grouped by error, if the"
+                + " push runs to completion. JSON if the name ends with .json, else CSV."
+            )
+        },
+        "cache_size": {
+            "description": (
+                "Maximum number of query results (packages, versions, subscribers)"
+                + " to keep cached. Defaults to 128."
+            )
+        },
+        "cache_ttl": {
+            "description": (
+                "Number of seconds to keep a cached query result before querying"
+                + " again. Use 0 to keep results for the whole run. Defaults to 300."
+            )
+        },
     }
 
     def _init_task(self):
         super(SchedulePushOrgList, self)._init_task()
-        self.push = SalesforcePushApi(self.sf, self.logger, self.options["batch_size"])
+        self.push = SalesforcePushApi(
+            self.sf,
+            self.logger,
+            batch_size=self.options["batch_size"],
+            concurrency=self.options["concurrency"],
+            cache_size=self.options["cache_size"],
+            cache_ttl=self.options["cache_ttl"],
+        )
 
     def _init_options(self, kwargs):
         super(SchedulePushOrgList, self)._init_options(kwargs)
@@ -249,6 +364,11 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
             self.options["namespace"] = self.project_config.project__package__namespace
         if "batch_size" not in self.options:
             self.options["batch_size"] = 200
+        self.options["batch_size"] = int(self.options["batch_size"])
+        self.options["concurrency"] = int(self.options.get("concurrency") or 1)
+        for name in ("cache_size", "cache_ttl"):
+            value = self.options.get(name)
+            self.options[name] = int(value) if value not in (None, "") else None
         if "csv" not in self.options and "csv_field_name" in self.options:
             raise TaskOptionsError("Please provide a csv file for this task to run.")
 
@@ -285,10 +405,11 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
             start_time = datetime.utcnow() + timedelta(minutes=delay_minutes)
 
         self.request_id, num_scheduled_orgs = self.push.create_push_request(
-            version, orgs, start_time
+            version, orgs, start_time, checkpoint=self.options.get("checkpoint")
         )
 
         self.return_values["request_id"] = self.request_id
+        self.return_values["skipped_orgs"] = self.push.skipped_orgs
 
         if num_scheduled_orgs > 1000:
             sleep_time_s = 30
@@ -308,6 +429,8 @@ class SchedulePushOrgList(BaseSalesforcePushTask):
 
         # Run the job
         self.logger.info(self.push.run_push_request(self.request_id))
+        if self.options.get("checkpoint"):
+            PushRequestCheckpoint(self.options["checkpoint"]).finish()
         self.logger.info(
             "Push Request {} is queued for execution.".format(self.request_id)
         )
@@ -349,6 +472,11 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
                 + " Ex: 2016-10-19T10:00"
             )
         },
+        "concurrency": SchedulePushOrgList.task_options["concurrency"],
+        "checkpoint": SchedulePushOrgList.task_options["checkpoint"],
+        "failure_report": SchedulePushOrgList.task_options["failure_report"],
+        "cache_size": SchedulePushOrgList.task_options["cache_size"],
+        "cache_ttl": SchedulePushOrgList.task_options["cache_ttl"],
     }
 
     def _get_orgs(self):
@@ -360,7 +488,11 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
             default_where["PackageSubscriber"] += " AND ({})".format(subscriber_where)
 
         push_api = SalesforcePushApi(
-            self.sf, self.logger, default_where=default_where.copy()
+            self.sf,
+            self.logger,
+            default_where=default_where.copy(),
+            cache_size=self.options["cache_size"],
+            cache_ttl=self.options["cache_ttl"],
         )
 
         package = self._get_package(self.options.get("namespace"))
@@ -389,8 +521,8 @@ class SchedulePushOrgQuery(SchedulePushOrgList):
             # Query orgs for each version in the range individually to avoid
             # query timeout errors with querying multiple versions
             for included_version in included_versions:
-                # Clear the get_subscribers method cache before each call
-                push_api.get_subscribers.cache.clear()
+                # Clear the get_subscribers cache before each call
+                push_api.clear_cache("get_subscribers")
                 push_api.default_where[
                     "PackageSubscriber"
                 ] = "{} AND MetadataPackageVersionId = '{}'".format(
@@ -13,9 +13,10 @@ from cumulusci.tasks.push.push_api import (
     PackagePushJob,
     PackagePushRequest,
     PackageSubscriber,
+    PushRequestCheckpoint,
+    QueryCache,
     SalesforcePushApi,
     batch_list,
-    memoize,
 )
 
 NAME = "Chewbacca"
@@ -421,8 +422,12 @@ def test_sf_push_create_push_request(sf_push_api, metadata_package_version):
     sf_push_api.sf.PackagePushRequest.create.assert_called_once_with(
         {"PackageVersionId": version_id, "ScheduledStartTime": start_time.isoformat()}
     )
-    assert mock.call(batch_0, push_request_id) in sf_push_api._add_batch.call_args_list
-    assert mock.call(batch_1, push_request_id) in sf_push_api._add_batch.call_args_list
+    assert (
+        mock.call(batch_0, push_request_id, {}) in sf_push_api._add_batch.call_args_list
+    )
+    assert (
+        mock.call(batch_1, push_request_id, {}) in sf_push_api._add_batch.call_args_list
+    )
     assert push_request_id == actual_id
     assert 2 == actual_org_count
 
@@ -516,21 +521,290 @@ def test_sf_push_add_push_batch_retry(sf_push_api, metadata_package_version):
     assert 4 == sf_push_api.sf._call_salesforce.call_count
 
 
+def test_sf_push_add_push_batch_skipped(sf_push_api):
+    orgs = ["00D000000001", "00D000000002"]
+    sf_push_api.sf.base_url = "base_url/"
+    sf_push_api.sf._call_salesforce.side_effect = [
+        SalesforceMalformedRequest(
+            "base_url/composite/tree/PackagePushJob",
+            400,
+            "resource_name",
+            {
+                "results": [
+                    {
+                        "referenceId": orgs[1],
+                        "errors": [
+                            {"message": "duplicate", "statusCode": "DUPLICATE_VALUE"}
+                        ],
+                    }
+                ]
+            },
+        ),
+        [],
+    ]
+    skipped = {}
+
+    assert [orgs[0]] == sf_push_api._add_batch(orgs, "0DV", skipped)
+    assert skipped == {
+        orgs[1]: {"statusCode": "DUPLICATE_VALUE", "message": "duplicate"}
+    }
+    assert ["00D000000001", "00D000000002"] == orgs
+
+
+def test_sf_push_add_push_batch_retry_limit(sf_push_api):
+    sf_push_api.sf.base_url = "base_url/"
+    sf_push_api.sf._call_salesforce.side_effect = SalesforceMalformedRequest(
+        "base_url/composite/tree/PackagePushJob",
+        400,
+        "resource_name",
+        {
+            "results": [
+                {
+                    "referenceId": "00D000000001",
+                    "errors": [{"message": "Something bad has happened!"}],
+                }
+            ]
+        },
+    )
+
+    with mock.patch("time.sleep") as sleep:
+        with pytest.raises(SalesforceMalformedRequest):
+            sf_push_api._add_batch(["00D000000001"], "0DV")
+
+    assert sf_push_api.sf._call_salesforce.call_count == 6
+    assert [c[0][0] for c in sleep.call_args_list] == [1, 2, 4, 8, 16]
+
+
+def test_sf_push_add_push_batch_no_errors(sf_push_api):
+    sf_push_api.sf.base_url = "base_url/"
+    sf_push_api.sf._call_salesforce.side_effect = SalesforceMalformedRequest(
+        "base_url/composite/tree/PackagePushJob",
+        400,
+        "resource_name",
+        {"results": [{"referenceId": "00D000000001", "errors": []}]},
+    )
+
+    with pytest.raises(SalesforceMalformedRequest):
+        sf_push_api._add_batch(["00D000000001"], "0DV")
+
+    assert sf_push_api.sf._call_salesforce.call_count == 1
+
+
+def test_sf_push_create_push_request__concurrent(metadata_package_version):
+    sf_push_api = SalesforcePushApi(
+        sf=mock.Mock(), logger=mock.Mock(), batch_size=2, concurrency=3
+    )
+    orgs = ["00D00000000{}".format(i) for i in range(7)]
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV"}
+
+    def add_batch(batch, request_id, skipped):
+        if "00D000000003" in batch:
+            skipped["00D000000003"] = {"statusCode": "INVALID_OPERATION", "message": ""}
+            return [org for org in batch if org != "00D000000003"]
+        return batch
+
+    sf_push_api._add_batch = mock.Mock(side_effect=add_batch)
+
+    request_id, scheduled = sf_push_api.create_push_request(
+        metadata_package_version, orgs, datetime.datetime.now()
+    )
+
+    assert request_id == "0DV"
+    assert scheduled == 6
+    assert sf_push_api._add_batch.call_count == 4
+    assert list(sf_push_api.skipped_orgs) == ["00D000000003"]
+    sf_push_api.logger.warning.assert_any_call("    INVALID_OPERATION: 1")
+
+
+def test_sf_push_create_push_request__checkpoint(
+    sf_push_api, metadata_package_version, tmp_path
+):
+    checkpoint = str(tmp_path / "push.checkpoint")
+    metadata_package_version.sf_id = "04t"
+    orgs = ["00D000000001", "00D000000002", "00D000000003"]
+    sf_push_api.batch_size = 1
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV"}
+
+    # The run is interrupted while adding the second batch
+    sf_push_api._add_batch = mock.Mock(
+        side_effect=[["00D000000001"], KeyboardInterrupt()]
+    )
+    with pytest.raises(KeyboardInterrupt):
+        sf_push_api.create_push_request(
+            metadata_package_version, orgs, datetime.datetime.now(), checkpoint
+        )
+
+    # The second batch was added just before the interruption
+    def add_batch(batch, request_id, skipped):
+        if batch == ["00D000000002"]:
+            skipped["00D000000002"] = {"statusCode": "DUPLICATE_VALUE", "message": ""}
+            return []
+        return batch
+
+    sf_push_api._add_batch = mock.Mock(side_effect=add_batch)
+    sf_push_api.sf.PackagePushRequest.get.return_value = {"Status": "Created"}
+    start = datetime.datetime(2030, 1, 1, 12, 0)
+    request_id, scheduled = sf_push_api.create_push_request(
+        metadata_package_version, orgs, start, checkpoint
+    )
+
+    assert request_id == "0DV"
+    assert scheduled == 3
+    assert not sf_push_api.skipped_orgs
+    sf_push_api.sf.PackagePushRequest.create.assert_called_once()
+    sf_push_api.sf.PackagePushRequest.get.assert_called_once_with("0DV")
+    sf_push_api.sf.PackagePushRequest.update.assert_called_once_with(
+        "0DV", {"ScheduledStartTime": "2030-01-01T12:00:00"}
+    )
+    assert [c[0][0] for c in sf_push_api._add_batch.call_args_list] == [
+        ["00D000000002"],
+        ["00D000000003"],
+    ]
+    assert PushRequestCheckpoint(checkpoint).scheduled == set(orgs)
+
+
+def test_sf_push_create_push_request__checkpoint_queued(
+    sf_push_api, metadata_package_version, tmp_path
+):
+    checkpoint = tmp_path / "push.checkpoint"
+    checkpoint.write_text(
+        '{"request_id": "0DV1", "version_id": "04t"}\n'
+        '{"scheduled": ["00D000000001"], "skipped": {}}\n'
+    )
+    metadata_package_version.sf_id = "04t"
+    orgs = ["00D000000001", "00D000000002"]
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV2"}
+    sf_push_api.sf.PackagePushRequest.get.return_value = {"Status": "Pending"}
+    sf_push_api._add_batch = mock.Mock(side_effect=lambda batch, *args: batch)
+
+    request_id, scheduled = sf_push_api.create_push_request(
+        metadata_package_version, orgs, datetime.datetime.now(), str(checkpoint)
+    )
+
+    assert request_id == "0DV2"
+    assert scheduled == 2
+    sf_push_api.sf.PackagePushRequest.update.assert_not_called()
+    assert PushRequestCheckpoint(str(checkpoint)).request_id == "0DV2"
+
+
+def test_sf_push_create_push_request__checkpoint_finished(
+    sf_push_api, metadata_package_version, tmp_path
+):
+    checkpoint = str(tmp_path / "push.checkpoint")
+    PushRequestCheckpoint(checkpoint).start("0DV1", "04t")
+    PushRequestCheckpoint(checkpoint).finish()
+    assert PushRequestCheckpoint(checkpoint).queued
+    metadata_package_version.sf_id = "04t"
+    sf_push_api.sf.PackagePushRequest.create.return_value = {"id": "0DV2"}
+    sf_push_api._add_batch = mock.Mock(side_effect=lambda batch, *args: batch)
+
+    request_id, scheduled = sf_push_api.create_push_request(
+        metadata_package_version, ["00D000000001"], datetime.datetime.now(), checkpoint
+    )
+
+    assert request_id == "0DV2"
+    sf_push_api.sf.PackagePushRequest.get.assert_not_called()
+    assert not PushRequestCheckpoint(checkpoint).queued
+
+
+def test_push_request_checkpoint__other_version(tmp_path):
+    path = tmp_path / "push.checkpoint"
+    path.write_text(
+        '{"request_id": "0DV1", "version_id": "04t1"}\n'
+        '{"scheduled": ["00D000000001"], "skipped": {}}\n'
+        '{"scheduled": ["00D0'
+    )
+    checkpoint = PushRequestCheckpoint(str(path))
+    assert checkpoint.request_id == "0DV1"
+    assert checkpoint.scheduled == {"00D000000001"}
+
+    checkpoint.start("0DV2", "04t2")
+    checkpoint = PushRequestCheckpoint(str(path))
+    assert checkpoint.request_id == "0DV2"
+    assert checkpoint.scheduled == set()
+
+
 def test_push_memoize():
-    def test_func(number):
-        return number
+    sf = mock.Mock()
+    sf.query_all.return_value = {"totalSize": 1, "records": [{"Id": "033"}]}
+    push_api = SalesforcePushApi(sf, mock.Mock())
+    other_push_api = SalesforcePushApi(sf, mock.Mock())
+
+    push_api.get_packages("Name = 'foo'")
+    push_api.get_packages("Name = 'foo'")
+    push_api.get_packages("Name = 'bar'")
+    other_push_api.get_packages("Name = 'foo'")
+
+    # Results are cached per instance
+    assert sf.query_all.call_count == 3
+    assert push_api.query_cache.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "size": 2,
+        "maxsize": 128,
+    }
+
+    push_api.clear_cache("get_packages")
+    push_api.get_packages("Name = 'foo'")
+    assert sf.query_all.call_count == 4
+
+
+def test_query_cache__lru():
+    cache = QueryCache(maxsize=2)
+    cache.get(("a", (), ()), lambda: 1)
+    cache.get(("b", (), ()), lambda: 2)
+    assert cache.get(("a", (), ()), lambda: None) == 1
+    cache.get(("c", (), ()), lambda: 3)
+
+    # b was the least recently used
+    assert cache.get(("b", (), ()), lambda: "new") == "new"
+    assert cache.get(("c", (), ()), lambda: None) == 3
+    assert cache.stats()["size"] == 2
+
+
+def test_query_cache__ttl():
+    cache = QueryCache(ttl=60)
+    with mock.patch("time.monotonic", return_value=1000):
+        cache.get("key", lambda: 1)
+    with mock.patch("time.monotonic", return_value=1059):
+        assert cache.get("key", lambda: 2) == 1
+    with mock.patch("time.monotonic", return_value=1060):
+        assert cache.get("key", lambda: 2) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
 
-    memoized_func = memoize(test_func)
-    memoized_func(10)
-    memoized_func(20)
+def test_query_cache__default_ttl():
+    cache = QueryCache()
+    with mock.patch("time.monotonic", return_value=1000):
+        cache.get("key", lambda: 1)
+    with mock.patch("time.monotonic", return_value=1300):
+        assert cache.get("key", lambda: 2) == 2
 
-    expected_cache = {"(10,){}": 10, "(20,){}": 20}
-    assert expected_cache == memoized_func.cache
 
-    memoized_func(10)
-    memoized_func(20)
-    # No new items introduced, cache should be same
-    assert expected_cache == memoized_func.cache
+def test_query_cache__no_ttl():
+    cache = QueryCache(ttl=0)
+    with mock.patch("time.monotonic", return_value=1000):
+        cache.get("key", lambda: 1)
+    with mock.patch("time.monotonic", return_value=100000):
+        assert cache.get("key", lambda: 2) == 1
+
+
+def test_push_api__cache_options():
+    push_api = SalesforcePushApi(mock.Mock(), mock.Mock())
+    assert (push_api.query_cache.maxsize, push_api.query_cache.ttl) == (128, 300)
+
+    push_api = SalesforcePushApi(mock.Mock(), mock.Mock(), cache_size=10, cache_ttl=0)
+    assert (push_api.query_cache.maxsize, push_api.query_cache.ttl) == (10, 0)
+
+
+def test_query_cache__invalidate():
+    cache = QueryCache()
+    cache.get(("a", (1,), ()), lambda: 1)
+    cache.get(("b", (1,), ()), lambda: 2)
+    cache.invalidate("a")
+    assert cache.stats()["size"] == 1
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
 
 
 def test_push_batch_list():
@@ -765,6 +1039,17 @@ def test_package_push_request_get_push_jobs_by_id(package_push_request):
     )
 
 
+def test_package_push_request_get_push_errors(package_push_request):
+    expected = (
+        "PackagePushJobId IN (SELECT Id FROM PackagePushJob WHERE "
+        f"PackagePushRequestId = '{SF_ID}') AND (ErrorSeverity = 'Error')"
+    )
+    package_push_request.get_push_errors("ErrorSeverity = 'Error'")
+    package_push_request.push_api.get_push_errors.assert_called_once_with(
+        expected, None
+    )
+
+
 def test_format_where(package_subscriber):
     assert package_subscriber.format_where("foo") == "foo = 'bar'"
     assert (
@@ -1,4 +1,6 @@
+import csv
 import datetime
+import json
 import os
 from unittest import mock
 import pytest
@@ -13,7 +15,7 @@ from cumulusci.tasks.push.push_api import (
     MetadataPackage,
     MetadataPackageVersion,
     PackagePushRequest,
-    PackagePushJob,
+    PushRequestCheckpoint,
 )
 from cumulusci.tasks.push.tasks import (
     BaseSalesforcePushTask,
@@ -167,39 +169,6 @@ def metadata_package_version_2(metadata_package):
     )
 
 
-@pytest.fixture
-def package_push_job_success():
-    return PackagePushJob(
-        push_api=mock.MagicMock(),
-        request=mock.Mock(),
-        org="00D63000000ApoXEAS",
-        status="Succeeded",
-        sf_id=SF_ID,
-    )
-
-
-@pytest.fixture
-def package_push_job_failure():
-    return PackagePushJob(
-        push_api=mock.MagicMock(),
-        request=mock.Mock(),
-        org="00D63000000ApoXEAS",
-        status="Failed",
-        sf_id=SF_ID,
-    )
-
-
-@pytest.fixture
-def package_push_job_cancel():
-    return PackagePushJob(
-        push_api=mock.MagicMock(),
-        request=mock.Mock(),
-        org="00D63000000ApoXEAS",
-        status="Canceled",
-        sf_id=SF_ID,
-    )
-
-
 @pytest.fixture
 def package_push_request_failure():
     return PackagePushRequest(
@@ -353,6 +322,26 @@ def test_schedule_push_org_list_init_options(org_file):
     assert task.options["batch_size"] == 200
     assert task.options["orgs"] == ORG_FILE
     assert task.options["version"] == VERSION
+    assert task.push.query_cache.maxsize == 128
+    assert task.push.query_cache.ttl == 300
+
+
+def test_schedule_push_org_list_init_options__cache(org_file):
+    task = create_task(
+        SchedulePushOrgList,
+        options={
+            "orgs": ORG_FILE,
+            "version": VERSION,
+            "start_time": datetime.datetime.now(),
+            "cache_size": "50",
+            "cache_ttl": "60",
+        },
+    )
+    task._init_task()
+    assert task.options["cache_size"] == 50
+    assert task.options["cache_ttl"] == 60
+    assert task.push.query_cache.maxsize == 50
+    assert task.push.query_cache.ttl == 60
 
 
 # Should set csv_field_name to OrganizationId by default
@@ -422,24 +411,83 @@ def test_report_push_status_error():
         task._report_push_status("0DV1R000000k9dEWAQ")
 
 
-def test_get_push_request_job_results(
-    package_push_job_success, package_push_job_failure, package_push_job_cancel, caplog
-):
+def _push_job(job_id, status):
+    return {
+        "Id": job_id,
+        "PackagePushRequestId": "0DV",
+        "SubscriberOrganizationKey": "00D" + job_id[3:],
+        "Status": status,
+    }
+
+
+def test_get_push_request_job_results(caplog):
     caplog.set_level(logging.INFO)
     task = create_task(BaseSalesforcePushTask, options={})
     task.sf = mock.MagicMock()
     task.push_report = mock.MagicMock()
     task.push_request = mock.MagicMock()
-    task.push_request.get_push_job_objs.return_value = [
-        package_push_job_success,
-        package_push_job_failure,
-        package_push_job_cancel,
+    task.push_request.get_push_jobs.return_value = [
+        _push_job("0DY000000001", "Succeeded"),
+        _push_job("0DY000000002", "Failed"),
+        _push_job("0DY000000003", "Canceled"),
     ]
     task._get_push_request_job_results()
-    task.push_request.get_push_job_objs.assert_called_once()
+    task.push_request.get_push_jobs.assert_called_once_with()
+    task.push_request.get_push_job_objs.assert_not_called()
     assert "Push complete: 1 succeeded, 1 failed, 1 canceled" in caplog.text
 
 
+def _push_error(job_id, title):
+    return {
+        "Id": "0DX" + title,
+        "PackagePushJobId": job_id,
+        "ErrorSeverity": "Error",
+        "ErrorType": "ApexTestFailure",
+        "ErrorTitle": title,
+        "ErrorMessage": "",
+        "ErrorDetails": "",
+    }
+
+
+@pytest.mark.parametrize("report_name", ["fails.csv", "fails.json"])
+def test_get_push_request_job_results__failure_report(tmp_path, report_name):
+    report = str(tmp_path / report_name)
+    task = create_task(BaseSalesforcePushTask, options={"failure_report": report})
+    task.push_report = mock.MagicMock()
+    task.push_request = mock.MagicMock()
+    task.push_request.get_push_jobs.return_value = [
+        _push_job(f"0DY00000000{i}", status)
+        for i, status in enumerate(["Failed", "Failed", "Failed", "Succeeded"])
+    ]
+    task.push_request.get_push_errors.return_value = [
+        _push_error("0DY000000000", "Rare"),
+        _push_error("0DY000000001", "Common"),
+        _push_error("0DY000000002", "Common"),
+        _push_error("0DY000000003", "Warning"),
+    ]
+
+    task._get_push_request_job_results()
+
+    task.push_request.get_push_errors.assert_called_once_with()
+    task.push_report.get_push_error_objs.assert_not_called()
+    task.push_report.get_subscriber_objs.assert_not_called()
+    with open(report) as f:
+        if report_name.endswith(".json"):
+            groups = json.load(f)
+            assert [(g["ErrorTitle"], g["Count"], g["Orgs"]) for g in groups] == [
+                ("Common", 2, ["00D000000001", "00D000000002"]),
+                ("Rare", 1, ["00D000000000"]),
+            ]
+        else:
+            rows = list(csv.reader(f))
+            assert [(row[0], row[3]) for row in rows] == [
+                ("OrganizationId", "ErrorTitle"),
+                ("00D000000001", "Common"),
+                ("00D000000002", "Common"),
+                ("00D000000000", "Rare"),
+            ]
+
+
 def test_schedule_push_org_query_get_org_error():
     task = create_task(
         SchedulePushOrgQuery,
@@ -502,6 +550,7 @@ def test_schedule_push_org_list_run_task_with_time_assertion(org_file):
         mock.ANY,
         ["00DS0000003TJJ6MAO", "00DS0000003TJJ6MAL"],
         datetime.datetime(2021, 8, 20, 3, 55),
+        checkpoint=None,
     )
 
 
@@ -518,6 +567,27 @@ def test_schedule_push_org_list_run_task_without_time(org_file):
     task.push.create_push_request.assert_called_once()
 
 
+def test_schedule_push_org_list_run_task_checkpoint(org_file, tmp_path):
+    checkpoint = str(tmp_path / "push.checkpoint")
+    PushRequestCheckpoint(checkpoint).start("0DV", "04t")
+    task = create_task(
+        SchedulePushOrgList,
+        options={
+            "orgs": ORG_FILE,
+            "version": VERSION,
+            "namespace": NAMESPACE,
+            "checkpoint": checkpoint,
+        },
+    )
+    task.push = mock.MagicMock()
+    task.sf = mock.MagicMock()
+    task.sf.query_all.return_value = PACKAGE_OBJS
+    task.push.create_push_request.return_value = ("0DV", 2)
+    task._run_task()
+    task.push.run_push_request.assert_called_once_with("0DV")
+    assert PushRequestCheckpoint(checkpoint).queued
+
+
 def test_schedule_push_org_list_run_task_without_orgs(empty_org_file):
     task = create_task(
         SchedulePushOrgList,
@@ -537,7 +607,7 @@ def test_schedule_push_org_list_run_task_without_orgs(empty_org_file):
     task.push.create_push_request.return_value = (task.sf.query_all.return_value, 0)
     task._run_task()
     task.push.create_push_request.assert_called_once_with(
-        mock.ANY, [], datetime.datetime(2021, 8, 19, 23, 18)
+        mock.ANY, [], datetime.datetime(2021, 8, 19, 23, 18), checkpoint=None
     )
 
 
@@ -562,11 +632,16 @@ def test_schedule_push_org_list_run_task_many_orgs(org_file):
         mock.ANY,
         ["00DS0000003TJJ6MAO", "00DS0000003TJJ6MAL"],
         datetime.datetime(2021, 8, 19, 23, 18),
+        checkpoint=None,
     )
 
 
 def test_schedule_push_org_list_run_task_many_orgs_now(org_file):
-    query = "SELECT Id, PackagePushRequestId, SubscriberOrganizationKey, Status FROM PackagePushJob WHERE Id = '0DV1R000000k9dEWAQ'"
+    query = (
+        "SELECT Id, PackagePushJobId, ErrorSeverity, ErrorType, ErrorTitle, ErrorMessage, ErrorDetails "
+        "FROM PackagePushError WHERE PackagePushJobId IN "
+        "(SELECT Id FROM PackagePushJob WHERE PackagePushRequestId = '0DV1R000000k9dEWAQ')"
+    )
     task = create_task(
         SchedulePushOrgList,
         options={
@@ -1,7 +1,10 @@
+import os
+
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.utils import process_bool_arg, process_list_arg
 from cumulusci.salesforce_api.metadata import ApiDeploy
 from cumulusci.salesforce_api.package_zip import MetadataPackageZipBuilder
+from cumulusci.salesforce_api.package_zip import hash_package_source
 from cumulusci.tasks.salesforce.BaseSalesforceMetadataApiTask import (
     BaseSalesforceMetadataApiTask,
 )
@@ -45,6 +48,9 @@ class Deploy(BaseSalesforceMetadataApiTask):
 
     namespaces = {"sf": "http://soap.sforce.com/2006/04/metadata"}
 
+    # Number of built package zips to keep in the project cache
+    package_zip_cache_size = 20
+
     def _init_options(self, kwargs):
         super(Deploy, self)._init_options(kwargs)
 
@@ -96,10 +102,70 @@ class Deploy(BaseSalesforceMetadataApiTask):
             ),
         }
 
+        if not self._can_cache_package_zip(path):
+            return self._build_package_zip(path, options)
+        return self._get_cached_package_zip(path, options)
+
+    def _can_cache_package_zip(self, path):
+        """Only sources inside the project's repo are cached. Anything else,
+        such as a temporary directory with a downloaded dependency, may be
+        gone or replaced with different source at the same path next time."""
+        repo_root = self.project_config.repo_root
+        if not repo_root:
+            return False
+        repo_root = os.path.realpath(repo_root)
+        sources = [path, self.options.get("static_resource_path")]
+        return all(
+            os.path.realpath(source).startswith(repo_root + os.sep)
+            for source in sources
+            if source
+        )
+
+    def _build_package_zip(self, path, options):
         return MetadataPackageZipBuilder(
             path=path, options=options, logger=self.logger
         ).as_base64()
 
+    def _get_cached_package_zip(self, path, options):
+        """Return a package zip from the project cache, keyed by a hash of
+        the source files' paths, sizes and mtimes, the builder options, the
+        project's sfdx settings and its namespace, building and caching it if
+        it is not there yet."""
+        repo_root = self.project_config.repo_root
+        key = hash_package_source(
+            path,
+            options,
+            project_files=[
+                os.path.join(repo_root, "sfdx-project.json"),
+                os.path.join(repo_root, ".forceignore"),
+            ],
+            settings={"namespace": self.project_config.project__package__namespace},
+        )
+        with self.project_config.open_cache("package_zips") as cache:
+            cached_zip = cache / f"{key}.zip.b64"
+            if cached_zip.exists():
+                self.logger.info("Using cached package zip")
+                # Mark as recently used
+                os.utime(cached_zip.getsyspath())
+                with cached_zip.open("r") as f:
+                    return f.read()
+
+            package_zip = self._build_package_zip(path, options)
+            with cached_zip.open("w") as f:
+                f.write(package_zip)
+            self._prune_package_zip_cache(cache)
+        return package_zip
+
+    def _prune_package_zip_cache(self, cache):
+        """Remove all but the most recently used package zips."""
+        entries = sorted(
+            cache.fs.scandir(cache.filename, namespaces=["details"]),
+            key=lambda info: info.modified,
+            reverse=True,
+        )
+        for info in entries[self.package_zip_cache_size :]:
+            (cache / info.name).unlink()
+
     def freeze(self, step):
         steps = super(Deploy, self).freeze(step)
         for step in steps:
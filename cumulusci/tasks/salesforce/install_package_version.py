@@ -96,6 +96,7 @@ class InstallPackageVersion(Deploy):
         else:
             self._retry()
         self.org_config.reset_installed_packages()
+        self.org_config.reset_describe_cache()
 
     def _try(self):
         api = self._get_api()
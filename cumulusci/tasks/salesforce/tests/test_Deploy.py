@@ -3,6 +3,7 @@ import io
 import os
 import unittest
 import zipfile
+from unittest import mock
 
 from cumulusci.core.exceptions import TaskOptionsError
 from cumulusci.core.flowrunner import StepSpec
@@ -105,6 +106,76 @@ class TestDeploy(unittest.TestCase):
                 self.assertIn("<name>StaticResource</name>", package_xml)
                 self.assertIn("<members>TestBundle</members>", package_xml)
 
+    def test_get_api__cached_package_zip(self):
+        with temporary_dir() as repo_root:
+            os.mkdir("src")
+            touch("src/package.xml")
+            task = create_task(Deploy, {"path": "src"})
+            task.project_config.repo_info["root"] = repo_root
+
+            with mock.patch.object(
+                Deploy, "_build_package_zip", wraps=task._build_package_zip
+            ) as build:
+                package_zip = task._get_api().package_zip
+                assert task._get_api().package_zip == package_zip
+                assert build.call_count == 1
+
+                # Options that don't change the zip's content don't matter
+                task.options["check_only"] = True
+                task._get_api()
+                assert build.call_count == 1
+
+                # Changing the source or the options invalidates the cache
+                with open("src/package.xml", "w") as f:
+                    f.write("<Package />")
+                task._get_api()
+                assert build.call_count == 2
+                task.options["clean_meta_xml"] = False
+                task._get_api()
+                assert build.call_count == 3
+
+                # and so do the project's sfdx settings and namespace
+                with open(".forceignore", "w") as f:
+                    f.write("**/jsconfig.json")
+                task._get_api()
+                assert build.call_count == 4
+                touch("sfdx-project.json")
+                task._get_api()
+                assert build.call_count == 5
+                task.project_config.config["project"]["package"]["namespace"] = "ns"
+                task._get_api()
+                assert build.call_count == 6
+
+            cache_dir = os.path.join(repo_root, ".cci", "package_zips")
+            assert len(os.listdir(cache_dir)) == 6
+
+    def test_get_api__source_outside_repo_not_cached(self):
+        with temporary_dir(chdir=False) as repo_root, temporary_dir() as path:
+            touch("package.xml")
+            task = create_task(Deploy, {"path": path})
+            task.project_config.repo_info["root"] = repo_root
+
+            task._get_api()
+
+            assert not os.path.exists(os.path.join(repo_root, ".cci"))
+
+    def test_get_api__prunes_package_zip_cache(self):
+        with temporary_dir() as repo_root:
+            os.mkdir("src")
+            touch("src/package.xml")
+            task = create_task(Deploy, {"path": "src"})
+            task.project_config.repo_info["root"] = repo_root
+            task.package_zip_cache_size = 1
+
+            task._get_api()
+            task.options["clean_meta_xml"] = False
+            package_zip = task._get_api().package_zip
+
+            cache_dir = os.path.join(repo_root, ".cci", "package_zips")
+            (cached,) = os.listdir(cache_dir)
+            with open(os.path.join(cache_dir, cached)) as f:
+                assert f.read() == package_zip
+
     def test_init_options(self):
         with self.assertRaises(TaskOptionsError):
             create_task(
@@ -128,6 +128,7 @@ class UpdateDependencies(BaseSalesforceMetadataApiTask):
         self._uninstall_dependencies()
         self._install_dependencies()
         self.org_config.reset_installed_packages()
+        self.org_config.reset_describe_cache()
 
     def _process_dependencies(self, dependencies):
         for dependency in dependencies:
@@ -51,6 +51,11 @@ class SFDXOrgTask(SFDXBaseTask):
             command += " -u {username}".format(username=self.org_config.username)
         return command
 
+    def _run_task(self):
+        super(SFDXOrgTask, self)._run_task()
+        # The command may have deployed metadata to the org
+        self.org_config.reset_describe_cache()
+
     def _get_env(self):
         env = super(SFDXOrgTask, self)._get_env()
         if not isinstance(self.org_config, ScratchOrgConfig):
@@ -194,38 +194,44 @@ class TestCreatePackageVersion:
                 ],
             },
         )
-        responses.add(  # query dependency org for installed package 1)
-            "GET",
-            f"{self.scratch_base_url}/tooling/query/",
+        responses.add(  # query dependency org for installed package versions
+            "POST",
+            f"{self.scratch_base_url}/tooling/composite",
             json={
-                "size": 1,
-                "records": [
+                "compositeResponse": [
                     {
-                        "Id": "04t000000000002AAA",
-                        "MajorVersion": 1,
-                        "MinorVersion": 5,
-                        "PatchVersion": 0,
-                        "BuildNumber": 1,
-                        "IsBeta": False,
-                    }
-                ],
-            },
-        ),
-        responses.add(  # query dependency org for installed package 2)
-            "GET",
-            f"{self.scratch_base_url}/tooling/query/",
-            json={
-                "size": 1,
-                "records": [
+                        "body": {
+                            "size": 1,
+                            "records": [
+                                {
+                                    "Id": "04t000000000002AAA",
+                                    "MajorVersion": 1,
+                                    "MinorVersion": 5,
+                                    "PatchVersion": 0,
+                                    "BuildNumber": 1,
+                                    "IsBeta": False,
+                                }
+                            ],
+                        },
+                        "httpStatusCode": 200,
+                    },
                     {
-                        "Id": "04t000000000003AAA",
-                        "MajorVersion": 1,
-                        "MinorVersion": 99,
-                        "PatchVersion": 0,
-                        "BuildNumber": 1,
-                        "IsBeta": False,
-                    }
-                ],
+                        "body": {
+                            "size": 1,
+                            "records": [
+                                {
+                                    "Id": "04t000000000003AAA",
+                                    "MajorVersion": 1,
+                                    "MinorVersion": 99,
+                                    "PatchVersion": 0,
+                                    "BuildNumber": 1,
+                                    "IsBeta": False,
+                                }
+                            ],
+                        },
+                        "httpStatusCode": 200,
+                    },
+                ]
             },
         )
         responses.add(  # query for existing package (dependency from github)
@@ -80,6 +80,18 @@ class TestSFDXBaseTask(MockLoggerMixin, unittest.TestCase):
         self.assertIn("SFDX_DEFAULTUSERNAME", task._get_env())
         self.assertIn(access_token, task._get_env()["SFDX_DEFAULTUSERNAME"])
 
+    @patch("cumulusci.tasks.command.Command._run_command")
+    def test_run_task__resets_describe_cache(self, _run_command):
+        self.task_config.config["options"] = {"command": "force:source:push"}
+        org_config = ScratchOrgConfig({"username": "test@example.com"}, "test")
+        org_config.reset_describe_cache = mock.Mock()
+
+        task = SFDXOrgTask(self.project_config, self.task_config, org_config)
+        task._run_task()
+
+        _run_command.assert_called_once()
+        org_config.reset_describe_cache.assert_called_once_with()
+
     def test_scratch_org_username(self):
         """ Scratch Org credentials are passed by -u flag """
         self.task_config.config["options"] = {"command": "force:org --help"}
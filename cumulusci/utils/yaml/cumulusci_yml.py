@@ -5,6 +5,12 @@ from io import StringIO
 
 import yaml
 
+try:
+    # The libyaml-based loader is much faster, when it is available.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 NBSP = "\u00A0"
 
 pattern = re.compile(r"^\s*[\u00A0]+\s*", re.MULTILINE)
@@ -37,5 +43,10 @@ def _replace_nbsp(origdata):
 def cci_safe_load(f_config: IO[Text]):
     "Load a file, convert NBSP->space and parse it in YAML."
     data = _replace_nbsp(f_config.read())
-    rc = yaml.safe_load(StringIO(data))
+    rc = safe_load(StringIO(data))
     return rc
+
+
+def safe_load(stream):
+    "Parse YAML like yaml.safe_load, using the libyaml C loader if available."
+    return yaml.load(stream, Loader=SafeLoader)
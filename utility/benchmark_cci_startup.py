@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Measure how long cci takes to load its config at startup.
+
+Times loading the universal and current project config in-process with the
+pure-Python YAML loader, with the libyaml loader and from the compiled config
+cache, then times whole `cci project info` runs with a cold and a warm cache.
+Uses a temporary home directory so the real ~/.cumulusci is left alone.
+
+Usage: python utility/benchmark_cci_startup.py [RUNS]
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import yaml
+
+from cumulusci.core.config import BaseProjectConfig, UniversalConfig
+from cumulusci.core.config.config_cache import CONFIG_CACHE_DIRNAME
+from cumulusci.utils.yaml import cumulusci_yml
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+COMMAND = [sys.executable, "-m", "cumulusci", "project", "info"]
+
+
+def load_config():
+    UniversalConfig.config = None
+    start = time.perf_counter()
+    BaseProjectConfig(UniversalConfig())
+    return time.perf_counter() - start
+
+
+def run_cci():
+    start = time.perf_counter()
+    subprocess.run(COMMAND, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def time_runs(func, cache_dir, cold):
+    times = []
+    for _ in range(RUNS):
+        if cold:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        times.append(func())
+    return times
+
+
+def report(label, times):
+    print(
+        f"{label:>18}: median {statistics.median(times) * 1000:7.1f}ms, "
+        f"min {min(times) * 1000:7.1f}ms over {len(times)} runs"
+    )
+
+
+def main():
+    with TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        cache_dir = Path(home, ".cumulusci", CONFIG_CACHE_DIRNAME)
+
+        print("Loading config in-process")
+        c_loader = cumulusci_yml.SafeLoader
+        cumulusci_yml.SafeLoader = yaml.SafeLoader
+        report("python yaml loader", time_runs(load_config, cache_dir, cold=True))
+        cumulusci_yml.SafeLoader = c_loader
+        report("libyaml loader", time_runs(load_config, cache_dir, cold=True))
+        load_config()
+        report("compiled cache", time_runs(load_config, cache_dir, cold=False))
+
+        print(f"Running {' '.join(COMMAND[3:])}")
+        run_cci()
+        report("cold cache", time_runs(run_cci, cache_dir, cold=True))
+        run_cci()
+        report("warm cache", time_runs(run_cci, cache_dir, cold=False))
+
+
+if __name__ == "__main__":
+    main()
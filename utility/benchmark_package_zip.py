@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare building a package zip with one pass per transform (the previous
+MetadataPackageZipBuilder behavior) against the single-pass pipeline.
+
+Usage: python utility/benchmark_package_zip.py [CLASSES]
+"""
+
+import functools
+import io
+import os
+import sys
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cumulusci.salesforce_api.package_zip import MetadataPackageZipBuilder
+from cumulusci.utils import (
+    inject_namespace,
+    process_text_in_zipfile,
+    strip_namespace,
+    tokenize_namespace,
+    zip_clean_metaxml,
+)
+
+CLASSES = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+OPTIONS = {
+    "namespace_tokenize": "ns",
+    "namespace_inject": "ns",
+    "namespace_strip": "ns",
+    "unmanaged": False,
+}
+
+PACKAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Package xmlns="http://soap.sforce.com/2006/04/metadata">
+    <types>
+        <members>*</members>
+        <name>ApexClass</name>
+    </types>
+    <version>50.0</version>
+</Package>
+"""
+CLASS_BODY = (
+    "public class %%%NAMESPACE%%%Class{n} {{\n"
+    + "    // ns__Field__c %%%NAMESPACE_OR_C%%%\n" * 50
+    + "}}\n"
+)
+CLASS_META = """<?xml version="1.0" encoding="UTF-8"?>
+<ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
+    <apiVersion>50.0</apiVersion>
+    <packageVersions>
+        <majorNumber>1</majorNumber>
+        <minorNumber>0</minorNumber>
+        <namespace>other</namespace>
+    </packageVersions>
+    <status>Active</status>
+</ApexClass>
+"""
+
+
+def make_tree(path):
+    classes = Path(path, "classes")
+    classes.mkdir()
+    Path(path, "package.xml").write_text(PACKAGE_XML)
+    for n in range(CLASSES):
+        Path(classes, f"Class{n}.cls").write_text(CLASS_BODY.format(n=n))
+        Path(classes, f"Class{n}.cls-meta.xml").write_text(CLASS_META)
+
+
+def build_multi_pass(path):
+    zf = zipfile.ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED)
+    for root, dirs, files in os.walk(path):
+        for f in files:
+            file_path = Path(root, f)
+            zf.write(file_path, arcname=file_path.relative_to(path).as_posix())
+    fp = zf.fp
+    zf.close()
+    zf = zipfile.ZipFile(fp, "r")
+    for transform, kwargs in (
+        (tokenize_namespace, {"namespace": "ns"}),
+        (inject_namespace, {"namespace": "ns", "managed": True}),
+        (strip_namespace, {"namespace": "ns"}),
+    ):
+        zf = process_text_in_zipfile(zf, functools.partial(transform, **kwargs))
+    return zip_clean_metaxml(zf)
+
+
+def build_single_pass(path):
+    return MetadataPackageZipBuilder(path=path, options=OPTIONS).zf
+
+
+def measure(label, func, path):
+    start = time.perf_counter()
+    zf = func(path)
+    elapsed = time.perf_counter() - start
+
+    # Measure memory separately, since tracing skews the timing.
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:>12}: {elapsed:6.2f}s, peak memory {peak / 2 ** 20:7.1f} MiB")
+    return {name: zf.read(name) for name in zf.namelist()}
+
+
+def main():
+    with TemporaryDirectory() as path:
+        make_tree(path)
+        print(f"Packaging {CLASSES * 2 + 1} files")
+        multi = measure("multi-pass", build_multi_pass, path)
+        single = measure("single-pass", build_single_pass, path)
+        assert multi == single
+
+
+if __name__ == "__main__":
+    main()
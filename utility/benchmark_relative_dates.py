@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Compare row throughput of per-row and batched relative date adjustment.
+
+Usage: python utility/benchmark_relative_dates.py [ROWS]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from cumulusci.tasks.bulkdata.dates import adjust_relative_dates, RelativeDateAdjuster
+from cumulusci.tasks.bulkdata.mapping_parser import MappingStep
+from cumulusci.tasks.bulkdata.step import DataOperationType
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+
+def make_rows(count):
+    anchor = date(2020, 7, 1)
+    days = [anchor + timedelta(days=n) for n in range(-365, 365)]
+    rows = []
+    for _ in range(count):
+        d = random.choice(days).isoformat()
+        rows.append(
+            ["Opportunity", d, f"{d}T{random.randint(0, 23):02}:00:00.000+0000"]
+        )
+    return rows
+
+
+def report(label, rows, elapsed):
+    print(f"{label:>10}: {len(rows) / elapsed:12,.0f} rows/second")
+
+
+def main():
+    mapping = MappingStep(
+        sf_object="Opportunity",
+        fields=["Name", "CloseDate", "LastActivityDate__c"],
+        anchor_date="2020-07-01",
+    )
+    context = ([1], [2], date.today())
+    rows = make_rows(ROWS)
+
+    start = time.perf_counter()
+    expected = [
+        adjust_relative_dates(mapping, context, row, DataOperationType.INSERT)
+        for row in rows
+    ]
+    report("per-row", rows, time.perf_counter() - start)
+
+    adjuster = RelativeDateAdjuster(mapping, context, DataOperationType.INSERT)
+    start = time.perf_counter()
+    actual = list(adjuster.adjust_records(rows))
+    report("batched", rows, time.perf_counter() - start)
+
+    assert actual == expected
+
+
+if __name__ == "__main__":
+    main()
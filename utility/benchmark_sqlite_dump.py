@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure extract-then-load round trips of a sql_path dataset.
+
+Builds a SQLite database like the one extract_dataset fills, then writes it
+out as a SQL script with one INSERT per row (sqlite3's iterdump, the default),
+with multi-row INSERTs and with multi-row INSERTs gzip compressed, and times
+loading each script back into a fresh database file the way load_dataset does.
+
+Usage: python utility/benchmark_sqlite_dump.py [ROWS] [ROWS_PER_INSERT]
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+from cumulusci.tasks.bulkdata.utils import (
+    open_sql_script,
+    sqlite_dump_script,
+    sqlite_import_script,
+)
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+ROWS_PER_INSERT = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+
+def create_database(path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE accounts (id INTEGER PRIMARY KEY, name VARCHAR(255), "
+        "description VARCHAR(255), parent_id VARCHAR(255))"
+    )
+    conn.execute(
+        "CREATE TABLE contacts (id INTEGER PRIMARY KEY, first_name VARCHAR(255), "
+        "last_name VARCHAR(255), email VARCHAR(255), account_id VARCHAR(255))"
+    )
+    conn.executemany(
+        "INSERT INTO accounts VALUES (?, ?, ?, ?)",
+        ((i, f"Account {i}", "It's an account;\nreally", None) for i in range(ROWS)),
+    )
+    conn.executemany(
+        "INSERT INTO contacts VALUES (?, ?, ?, ?, ?)",
+        (
+            (i, "Test", f"Contact {i}", f"contact{i}@example.com", str(i // 2))
+            for i in range(ROWS * 2)
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def round_trip(label, conn, sql_path, rows_per_insert, directory):
+    start = time.perf_counter()
+    with open_sql_script(sql_path, "w") as f:
+        sqlite_dump_script(conn, f, rows_per_insert)
+    dump_time = time.perf_counter() - start
+
+    load_conn = sqlite3.connect(os.path.join(directory, f"{label}.db"))
+    start = time.perf_counter()
+    with open_sql_script(sql_path) as f:
+        sqlite_import_script(load_conn, f)
+    load_time = time.perf_counter() - start
+    count = load_conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+    load_conn.close()
+    assert count == ROWS * 2, count
+
+    size = os.path.getsize(sql_path)
+    print(
+        f"{label:>18}: dump {dump_time:6.2f}s, load {load_time:6.2f}s, "
+        f"{size / 1000000:7.1f}MB"
+    )
+
+
+def main():
+    with TemporaryDirectory() as directory:
+        conn = create_database(os.path.join(directory, "extract.db"))
+        print(f"Dumping and loading {ROWS * 3} rows")
+        round_trip(
+            "one row per insert",
+            conn,
+            os.path.join(directory, "rows.sql"),
+            1,
+            directory,
+        )
+        round_trip(
+            f"{ROWS_PER_INSERT} per insert",
+            conn,
+            os.path.join(directory, "batched.sql"),
+            ROWS_PER_INSERT,
+            directory,
+        )
+        round_trip(
+            "gzip compressed",
+            conn,
+            os.path.join(directory, "batched.sql.gz"),
+            ROWS_PER_INSERT,
+            directory,
+        )
+
+
+if __name__ == "__main__":
+    main()
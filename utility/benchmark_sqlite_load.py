@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Measure how long it takes to load a sql_path dataset into SQLite.
+
+Generates a dataset script the way extract_dataset writes one (sqlite3's
+iterdump, one INSERT per row), then times loading it into a fresh database
+file by running the whole script with executescript, as load_dataset used to,
+and with the streaming loader, reporting the peak memory each one allocates.
+Then does the same for a smaller script that isn't wrapped in a transaction
+(like a hand-written one), where executescript commits after every statement.
+
+Usage: python utility/benchmark_sqlite_load.py [ROWS] [RUNS]
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+from cumulusci.tasks.bulkdata.utils import sqlite_import_script
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+
+def write_dataset(path, rows, transaction=True):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE accounts (id INTEGER PRIMARY KEY, name VARCHAR(255), "
+        "description VARCHAR(255), parent_id VARCHAR(255))"
+    )
+    conn.execute(
+        "CREATE TABLE contacts (id INTEGER PRIMARY KEY, first_name VARCHAR(255), "
+        "last_name VARCHAR(255), email VARCHAR(255), account_id VARCHAR(255))"
+    )
+    conn.executemany(
+        "INSERT INTO accounts VALUES (?, ?, ?, ?)",
+        ((i, f"Account {i}", "It's an account;\nreally", None) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO contacts VALUES (?, ?, ?, ?, ?)",
+        (
+            (i, "Test", f"Contact {i}", f"contact{i}@example.com", str(i // 2))
+            for i in range(rows * 2)
+        ),
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        for line in conn.iterdump():
+            if transaction or line not in ("BEGIN TRANSACTION;", "COMMIT;"):
+                f.write(line + "\n")
+
+
+def load_executescript(sql_path, db_path):
+    conn = sqlite3.connect(db_path)
+    with open(sql_path, "r", encoding="utf-8") as f:
+        conn.executescript(f.read())
+    conn.close()
+
+
+def load_streaming(sql_path, db_path):
+    conn = sqlite3.connect(db_path)
+    with open(sql_path, "r", encoding="utf-8") as f:
+        sqlite_import_script(conn, f)
+    conn.close()
+
+
+def time_runs(func, sql_path, directory, rows):
+    times = []
+    for run in range(RUNS):
+        db_path = os.path.join(directory, f"{func.__name__}{run}.db")
+        start = time.perf_counter()
+        func(sql_path, db_path)
+        times.append(time.perf_counter() - start)
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+        conn.close()
+        assert count == rows * 2, count
+    tracemalloc.start()
+    func(sql_path, os.path.join(directory, f"{func.__name__}.db"))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return times, peak
+
+
+def report(label, times, peak):
+    print(
+        f"{label:>14}: median {statistics.median(times):6.2f}s, "
+        f"min {min(times):6.2f}s over {len(times)} runs, "
+        f"peak memory {peak / 1000000:6.1f}MB"
+    )
+
+
+def compare(rows, transaction):
+    with TemporaryDirectory() as directory:
+        sql_path = os.path.join(directory, "dataset.sql")
+        write_dataset(sql_path, rows, transaction)
+        size = os.path.getsize(sql_path)
+        print(
+            f"Loading {rows * 3} rows ({size / 1000000:.1f}MB of SQL) "
+            f"{'in' if transaction else 'without'} a transaction"
+        )
+        for func in (load_executescript, load_streaming):
+            label = func.__name__[len("load_") :]
+            report(label, *time_runs(func, sql_path, directory, rows))
+
+
+def main():
+    compare(ROWS, transaction=True)
+    compare(ROWS // 40, transaction=False)
+
+
+if __name__ == "__main__":
+    main()